@@ -10,6 +10,15 @@ class DataStructure(str, Enum):
     UNSORTED_LIST = "unsorted_list"
     SORTED_LIST = "sorted_list"
     BINARY_SEARCH_TREE = "binary_search_tree"
+    EYTZINGER_TREE = "eytzinger_tree"
+    AVL_TREE = "avl_tree"
+    RED_BLACK_TREE = "red_black_tree"
+    TREAP = "treap"
+    BINTREES_AVL_TREE = "bintrees_avl_tree"
+    BINTREES_RB_TREE = "bintrees_rb_tree"
+    HASH_INDEX = "hash_index"
+    B_PLUS_TREE = "b_plus_tree"
+    SPLAY_TREE = "splay_tree"
 
     def __str__(self):
         """Define a default string representation."""
@@ -23,6 +32,15 @@ class SearchAlgorithm(str, Enum):
     BINARY_SEARCH_ITERATIVE = "binary_search_iterative"
     BINARY_SEARCH_RECURSIVE = "binary_search_recursive"
     BST_SEARCH = "bst_search"
+    EYTZINGER_SEARCH = "eytzinger_search"
+    GALLOPING_SEARCH = "galloping_search"
+    HASH_LOOKUP = "hash_lookup"
+    INTERPOLATION_SEARCH = "interpolation_search"
+    EXPONENTIAL_SEARCH = "exponential_search"
+    LEARNED_INDEX_SEARCH = "learned_index_search"
+    B_PLUS_TREE_SEARCH = "b_plus_tree_search"
+    MOVE_TO_FRONT_SEARCH = "move_to_front_search"
+    TRANSPOSE_SEARCH = "transpose_search"
 
     def __str__(self):
         """Define a default string representation."""
@@ -37,6 +55,22 @@ class TargetPosition(str, Enum):
     END = "end"  # last 10% of elements
     RANDOM = "random"  # random position
     NONEXISTENT = "nonexistent"  # element not in dataset
+    ZIPF = "zipf"  # popularity falls off as a power of the rank
+    HOT_SET = "hot_set"  # most searches go to a small set of hot elements
+    TEMPORAL = "temporal"  # recent targets are likely to be searched again
+
+    def __str__(self):
+        """Define a default string representation."""
+        return self.value
+
+
+class InsertOrder(str, Enum):
+    """Define the order in which values are inserted into a tree."""
+
+    BALANCED = "balanced"  # medians first, so any tree ends up balanced
+    RANDOM = "random"  # shuffled, as data arrives in practice
+    SORTED = "sorted"  # ascending, the worst case for an unbalanced tree
+    REVERSED = "reversed"  # descending, the mirrored worst case
 
     def __str__(self):
         """Define a default string representation."""
@@ -53,3 +87,63 @@ class DataType(str, Enum):
     def __str__(self):
         """Define a default string representation."""
         return self.value
+
+
+class Storage(str, Enum):
+    """Define where the values of a list are kept while they are searched."""
+
+    MEMORY = "memory"  # a list of Python objects on the heap
+    MMAP = "mmap"  # a memory-mapped file, paged in by the operating system
+    PACKED = "packed"  # fixed-width strings end to end in one byte buffer
+
+    def __str__(self):
+        """Define a default string representation."""
+        return self.value
+
+
+class Concurrency(str, Enum):
+    """Define how concurrent readers share one structure."""
+
+    THREADS = "threads"  # threads of one process, serialized by any GIL
+    PROCESSES = "processes"  # processes that read shared memory
+
+    def __str__(self):
+        """Define a default string representation."""
+        return self.value
+
+
+class Operation(str, Enum):
+    """Define an operation of a mixed read/write workload."""
+
+    READ = "read"  # search for a value that is stored
+    INSERT = "insert"  # insert a new value
+    DELETE = "delete"  # delete a value that is stored
+
+    def __str__(self):
+        """Define a default string representation."""
+        return self.value
+
+
+class CachePolicy(str, Enum):
+    """Define how a lookup cache chooses the result to evict."""
+
+    LRU = "lru"  # the least recently used result
+    LFU = "lfu"  # the least frequently used result
+    ARC = "arc"  # adaptive between recency and frequency
+    TWO_QUEUE = "2q"  # results used once before those used again
+
+    def __str__(self):
+        """Define a default string representation."""
+        return self.value
+
+
+class OutputFormat(str, Enum):
+    """Define the file formats that benchmark results are saved in."""
+
+    JSON = "json"  # one document with the environment and every run
+    CSV = "csv"  # one row per run, with lists encoded as JSON
+    JSONL = "jsonl"  # one JSON object per run and line
+
+    def __str__(self):
+        """Define a default string representation."""
+        return self.value
@@ -0,0 +1,148 @@
+"""AVL tree implementation that rebalances on every insert and delete."""
+
+from typing import Any, List, Optional
+
+
+class AVLNode:
+    """Creates the node class for the AVL tree."""
+
+    __slots__ = ("data", "height", "l_child", "r_child")
+
+    def __init__(self, value):
+        self.l_child: Optional[AVLNode] = None
+        self.r_child: Optional[AVLNode] = None
+        self.data = value
+        self.height = 1
+
+
+def _height(node: Optional[AVLNode]) -> int:
+    """Return the height of a possibly empty subtree."""
+    return node.height if node is not None else 0
+
+
+def _update_height(node: AVLNode) -> None:
+    """Recompute the height of a node from its children."""
+    node.height = 1 + max(_height(node.l_child), _height(node.r_child))
+
+
+class AVLTree:
+    """Binary search tree whose subtree heights differ by at most one."""
+
+    def __init__(self):
+        self.root: Optional[AVLNode] = None
+        self.rotations = 0
+
+    def _rotate_left(self, node: AVLNode) -> AVLNode:
+        """Rotate a subtree left and return its new root."""
+        pivot = node.r_child
+        node.r_child = pivot.l_child
+        pivot.l_child = node
+        _update_height(node)
+        _update_height(pivot)
+        self.rotations += 1
+        return pivot
+
+    def _rotate_right(self, node: AVLNode) -> AVLNode:
+        """Rotate a subtree right and return its new root."""
+        pivot = node.l_child
+        node.l_child = pivot.r_child
+        pivot.r_child = node
+        _update_height(node)
+        _update_height(pivot)
+        self.rotations += 1
+        return pivot
+
+    def _rebalance(self, node: AVLNode) -> AVLNode:
+        """Restore the AVL property at a node and return the subtree root."""
+        _update_height(node)
+        balance = _height(node.l_child) - _height(node.r_child)
+        if balance > 1:
+            if _height(node.l_child.l_child) < _height(node.l_child.r_child):
+                node.l_child = self._rotate_left(node.l_child)
+            return self._rotate_right(node)
+        if balance < -1:
+            if _height(node.r_child.r_child) < _height(node.r_child.l_child):
+                node.r_child = self._rotate_right(node.r_child)
+            return self._rotate_left(node)
+        return node
+
+    def insert(self, value: Any) -> None:
+        """Inserts the value into the tree and rebalances the path."""
+        if self.root is None:
+            self.root = AVLNode(value)
+            return
+        # remember the path so it can be rebalanced bottom-up
+        path: List[AVLNode] = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            node = node.l_child if value < node.data else node.r_child
+        parent = path[-1]
+        if value < parent.data:
+            parent.l_child = AVLNode(value)
+        else:
+            parent.r_child = AVLNode(value)
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            old_height = node.height
+            subtree = self._rebalance(node)
+            if depth == 0:
+                self.root = subtree
+            elif path[depth - 1].l_child is node:
+                path[depth - 1].l_child = subtree
+            else:
+                path[depth - 1].r_child = subtree
+            # a rotation restores the old height, so an insert needs at most
+            # one, and an unchanged height leaves the ancestors balanced
+            if subtree is not node or node.height == old_height:
+                break
+
+    def delete(self, value: Any) -> bool:
+        """Deletes one copy of the value and rebalances the path to it."""
+        path: List[AVLNode] = []
+        node = self.root
+        while node is not None and node.data != value:
+            path.append(node)
+            node = node.l_child if value < node.data else node.r_child
+        if node is None:
+            return False
+        if node.l_child is not None and node.r_child is not None:
+            # take the smallest value on the right, and unlink its node
+            path.append(node)
+            successor = node.r_child
+            while successor.l_child is not None:
+                path.append(successor)
+                successor = successor.l_child
+            node.data = successor.data
+            node = successor
+        child = node.l_child if node.l_child is not None else node.r_child
+        if not path:
+            self.root = child
+        elif path[-1].l_child is node:
+            path[-1].l_child = child
+        else:
+            path[-1].r_child = child
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            old_height = node.height
+            subtree = self._rebalance(node)
+            if depth == 0:
+                self.root = subtree
+            elif path[depth - 1].l_child is node:
+                path[depth - 1].l_child = subtree
+            else:
+                path[depth - 1].r_child = subtree
+            # unlike an insert, a rotation can shorten the subtree, so only
+            # an unrotated subtree of unchanged height ends the walk
+            if subtree is node and node.height == old_height:
+                break
+        return True
+
+    def search(self, target: Any) -> bool:
+        """Search for a value in the tree and return if found."""
+        node = self.root
+        while node is not None:
+            if node.data == target:
+                return True
+            node = node.l_child if target < node.data else node.r_child
+        return False
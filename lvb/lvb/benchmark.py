@@ -1,56 +1,195 @@
 """Run a benchmark on search operations."""
 
+import gc
+import math
+import statistics
+import time
 import timeit
-from typing import Any, Callable, List
+from dataclasses import dataclass
+from typing import Any, Callable, List, Sequence
 
+from lvb.constants import constants
 
-def benchmark(func: Callable, *args, **kwargs) -> float:
-    """Run a benchmark on a function using timeit.
+# two-sided 95% critical values of Student's t for 1 to 30 degrees of freedom
+T_CRITICAL_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)  # fmt: skip
+
+# critical value of the normal distribution for more degrees of freedom
+Z_CRITICAL_95 = 1.960
+
+
+def t_critical(degrees: float) -> float:
+    """Return the two-sided 95% critical value of Student's t.
 
     Args:
-        func (Callable): Function to benchmark.
-        *args: Positional arguments to pass to the function.
-        **kwargs: Keyword arguments to pass to the function.
+        degrees (float): Degrees of freedom, at least one. A fractional
+            value, as Welch's test gives, is rounded down to stay cautious.
 
     Returns:
-        float: Average execution time in seconds.
+        float: Critical value of the t distribution.
+    """
+    whole = max(1, math.floor(degrees))
+    if whole <= len(T_CRITICAL_95):
+        return T_CRITICAL_95[whole - 1]
+    return Z_CRITICAL_95
 
-    Raises:
-        ValueError: If the provided `func` is not callable.
+
+@dataclass(frozen=True)
+class Measurement:
+    """Class to store the timing statistics of a benchmarked function."""
+
+    # Time per call of every independent repeat, in seconds
+    times: List[float]
+    # Calls per repeat and empty-harness time per call that was subtracted
+    number: int
+    overhead: float
+
+    @property
+    def mean(self) -> float:
+        """Return the mean time per call across the repeats."""
+        return statistics.fmean(self.times)
+
+    @property
+    def stdev(self) -> float:
+        """Return the sample standard deviation across the repeats."""
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+    @property
+    def minimum(self) -> float:
+        """Return the fastest time per call of any repeat."""
+        return min(self.times)
+
+    @property
+    def margin(self) -> float:
+        """Return the half-width of the 95% confidence interval of the mean."""
+        degrees = len(self.times) - 1
+        if degrees < 1:
+            return 0.0
+        return t_critical(degrees) * self.stdev / math.sqrt(len(self.times))
+
+
+def calibrate(func: Callable, target_time: float) -> int:
+    """Find how many calls of a function take at least the target time.
+
+    Args:
+        func (Callable): Function to calibrate.
+        target_time (float): Time that one repeat should take, in seconds.
+
+    Returns:
+        int: Number of calls per repeat, at least one.
     """
-    if not callable(func):  # Check if func is callable
-        raise ValueError("The provided `func` must be callable.")  # raise ValueError
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= target_time:
+            return number
+        # grow towards the target in one step, but at most tenfold
+        number = max(
+            number + 1,
+            min(
+                number * 10,
+                math.ceil(number * target_time / max(elapsed, 1e-9)),
+            ),
+        )
+
 
-    def wrapped_func():
-        """Wrap the function call for timeit."""
-        func(*args, **kwargs)  # Call the function with arguments
+def _noop() -> None:
+    """Do nothing, so the cost of the timing harness can be measured."""
 
-    execution_time = timeit.timeit(wrapped_func, number=1000)  # Measure execution time
-    return execution_time / 1000 # Average over 1000 runs
 
+def measure(
+    func: Callable,
+    repeats: int = constants.DEFAULT_REPEATS,
+    time_budget: float = constants.DEFAULT_TIME_BUDGET,
+    warmup: int = constants.DEFAULT_WARMUP,
+) -> Measurement:
+    """Measure a function with calibrated, independent, repeated timings.
 
-def benchmark_search(
-    search_func: Callable, dataset: List[Any], targets: List[Any], **kwargs
-) -> float:
-    """Benchmark a search function with multiple targets.
+    The call count is calibrated so that all repeats together take about
+    the time budget, the function is warmed up first, and the cost of the
+    harness calling an empty function is subtracted. Like `timeit`, the
+    garbage collector is disabled while a repeat is timed.
 
     Args:
-        search_func (Callable): Search function to benchmark.
-        dataset (List[Any]): Dataset to search through.
-        targets (List[Any]): List of target elements to search for.
-        **kwargs: Additional keyword arguments for the search function.
+        func (Callable): Function to measure.
+        repeats (int): Number of independent repeats.
+        time_budget (float): Time that all repeats together should take.
+        warmup (int): Number of calls to make before any timing.
 
     Returns:
-        float: Average execution time in seconds.
+        Measurement: Time per call of every repeat.
 
     Raises:
-        ValueError: If the provided `search_func` is not callable.
+        ValueError: If the provided `func` is not callable.
+    """
+    if not callable(func):
+        raise ValueError("The provided `func` must be callable.")
+    repeats = max(1, repeats)
+    for _ in range(warmup):
+        func()
+    number = calibrate(func, time_budget / repeats)
+    overhead = min(timeit.Timer(_noop).repeat(repeats, number)) / number
+    totals = timeit.Timer(func).repeat(repeats, number)
+    return Measurement(
+        times=[max(0.0, total / number - overhead) for total in totals],
+        number=number,
+        overhead=overhead,
+    )
+
+
+def measure_latencies(
+    search_func: Callable[[Any], Any], targets: Sequence[Any]
+) -> List[float]:
+    """Time every search on its own to find the spread of latencies.
+
+    Args:
+        search_func (Callable): Function that searches for one target.
+        targets (Sequence[Any]): Targets to search for.
+
+    Returns:
+        List[float]: Latency of each search in seconds, without the cost of
+        reading the clock.
+    """
+    clock = time.perf_counter_ns
+    # the cheapest back-to-back clock reading is the cost of timing a call
+    clock_cost = None
+    for _ in range(1000):
+        start = clock()
+        elapsed = clock() - start
+        if clock_cost is None or elapsed < clock_cost:
+            clock_cost = elapsed
+    latencies = []
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        for target in targets:
+            start = clock()
+            search_func(target)
+            latencies.append(max(0, clock() - start - clock_cost) / 1e9)
+    finally:
+        if collecting:
+            gc.enable()
+    return latencies
+
+
+def percentiles(
+    values: Sequence[float], points: Sequence[float] = (50, 95, 99)
+) -> List[float]:
+    """Compute percentiles of values by linear interpolation.
+
+    Args:
+        values (Sequence[float]): Values to summarize.
+        points (Sequence[float]): Percentiles to compute, from 0.1 to 99.9
+            in steps of 0.1.
+
+    Returns:
+        List[float]: Value at each requested percentile.
     """
-    if not callable(search_func):  # Check if search_func is callable
-        raise ValueError("The provided `search_func` must be callable.")  # raise ValueError
-
-    # measure the time to find all targets
-    def search_all_targets():  # Define a function to search all targets
-        for target in targets:  # Iterate through each target
-            search_func(dataset, target, **kwargs)  # Call the search function
-    return benchmark(search_all_targets)  # Measure the average execution time
+    if len(values) < 2:  # noqa: PLR2004
+        return [values[0] if values else 0.0 for _ in points]
+    cuts = statistics.quantiles(values, n=1000, method="inclusive")
+    return [cuts[round(point * 10) - 1] for point in points]
@@ -1,6 +1,8 @@
-"""Binary search implementations (iterative and recursive)."""
+"""Binary search implementations with exponential and batched variants."""
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
 
 
 def binary_search_iterative(dataset: List[Any], target: Any) -> Optional[int]:
@@ -55,3 +57,62 @@ def binary_search_recursive(
         return binary_search_recursive(dataset, target, mid + 1, right)
     else:
         return binary_search_recursive(dataset, target, left, mid - 1)
+
+
+def binary_search_many(
+    dataset: Sequence[Any], targets: Sequence[Any]
+) -> List[Optional[int]]:
+    """Perform a binary search for every target in one vectorized call.
+
+    Note: Dataset must be sorted for binary search to work correctly.
+
+    Args:
+        dataset: Sorted list or array to search through
+        targets: Elements to search for
+
+    Returns:
+        List: Index of each target in the order given, or None if not found
+    """
+    values = np.asarray(dataset)
+    wanted = np.asarray(targets)
+    if values.size == 0:
+        return [None] * len(wanted)
+
+    positions = np.searchsorted(values, wanted)
+    clipped = np.minimum(positions, values.size - 1)
+    found = (positions < values.size) & (values[clipped] == wanted)
+    return [
+        index if hit else None
+        for index, hit in zip(clipped.tolist(), found.tolist())
+    ]
+
+
+def exponential_search(dataset: List[Any], target: Any) -> Optional[int]:
+    """Perform an exponential search on the dataset.
+
+    The range holding the target is found by doubling a bound from the
+    start, and is then searched with a binary search.
+
+    Note: Dataset must be sorted for exponential search to work correctly.
+
+    Args:
+        dataset: Sorted list to search through
+        target: Element to search for
+
+    Returns:
+        int: Index of the target element, or None if not found
+    """
+    size = len(dataset)
+    bound = 1
+    while bound < size and dataset[bound] < target:
+        bound *= 2
+    left, right = bound // 2, min(bound, size - 1)
+    while left <= right:
+        mid = (left + right) // 2
+        if dataset[mid] == target:
+            return mid
+        elif dataset[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return None
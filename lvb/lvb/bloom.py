@@ -0,0 +1,104 @@
+"""Bloom filter that rejects missing targets before any search runs."""
+
+import math
+from typing import Any, Callable, Iterable
+
+# keep the mixed hash values inside an unsigned 64-bit word
+MASK_64 = (1 << 64) - 1
+
+
+def _mix(value: int) -> int:
+    """Scramble a hash value with the splitmix64 finalizer."""
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & MASK_64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & MASK_64
+    return value ^ (value >> 31)
+
+
+class BloomFilter:
+    """Compact set membership test with false positives but no misses.
+
+    The bits live in one bytearray, and the k probe positions of a value
+    come from double hashing two mixes of its built-in hash.
+    """
+
+    __slots__ = ("bits", "hashes", "size")
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError(
+                "The false positive rate must be between 0 and 1."
+            )
+        capacity = max(1, capacity)
+        # optimal bit count and number of hashes for the requested rate
+        self.size = max(
+            8,
+            math.ceil(
+                -capacity * math.log(false_positive_rate) / math.log(2) ** 2
+            ),
+        )
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    @classmethod
+    def from_dataset(
+        cls, dataset: Iterable[Any], capacity: int, false_positive_rate: float
+    ) -> "BloomFilter":
+        """Build a filter sized for the capacity and add every value to it.
+
+        Args:
+            dataset: Values to add to the filter
+            capacity: Number of values the filter is sized for
+            false_positive_rate: Target rate of false positives
+
+        Returns:
+            BloomFilter: Filter that contains every value of the dataset
+        """
+        bloom = cls(capacity, false_positive_rate)
+        for value in dataset:
+            bloom.add(value)
+        return bloom
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes in the bit array."""
+        return len(self.bits)
+
+    def add(self, value: Any) -> None:
+        """Set the bits of a value in the filter."""
+        bits = self.bits
+        size = self.size
+        first = _mix(hash(value) & MASK_64)
+        second = _mix(first) | 1
+        for probe in range(self.hashes):
+            position = (first + probe * second) % size
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: Any) -> bool:
+        """Return False if the value is definitely not in the filter."""
+        bits = self.bits
+        size = self.size
+        first = _mix(hash(value) & MASK_64)
+        second = _mix(first) | 1
+        for probe in range(self.hashes):
+            position = (first + probe * second) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def guard(self, search_func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """Wrap a search so that rejected targets never reach the structure.
+
+        Args:
+            search_func: Function that searches for a single target
+
+        Returns:
+            Callable: Search function that returns None for rejected targets
+        """
+
+        def guarded_search(target: Any) -> Any:
+            """Search for the target only if the filter may contain it."""
+            if target not in self:
+                return None
+            return search_func(target)
+
+        return guarded_search
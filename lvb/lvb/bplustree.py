@@ -0,0 +1,339 @@
+"""B+-tree with a configurable fanout and contiguous sorted leaves."""
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort_right
+from typing import Any, List, MutableSequence, Optional, Sequence, Tuple, Union
+
+# the smallest fanout for which splits and merges stay well defined
+MIN_FANOUT = 4
+
+
+def _typecode_for(value: Any) -> Optional[str]:
+    """Pick an `array.array` type code for keys like the value, if any.
+
+    Args:
+        value: Representative key of the tree
+
+    Returns:
+        Optional[str]: Type code for unboxed keys, or None for a list
+    """
+    if isinstance(value, float):
+        return "d"
+    # bool is a subclass of int but has no meaningful machine layout here
+    if isinstance(value, int) and not isinstance(value, bool):
+        try:
+            array("q", [value])
+        except OverflowError:
+            return None
+        return "q"
+    return None
+
+
+def _even_ranges(count: int, fanout: int) -> List[Tuple[int, int]]:
+    """Split a count into the fewest ranges of at most fanout, evenly sized.
+
+    Args:
+        count: Number of entries to split
+        fanout: Largest number of entries in a range
+
+    Returns:
+        List: Start and end index of every range
+    """
+    groups = -(-count // fanout)
+    ranges = []
+    start = 0
+    for group in range(groups):
+        end = start + count // groups + (group < count % groups)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+class BPlusLeaf:
+    """Creates the leaf node class that holds a sorted run of keys."""
+
+    __slots__ = ("keys", "next")
+
+    def __init__(self, keys: MutableSequence[Any]):
+        self.keys = keys
+        self.next: Optional[BPlusLeaf] = None
+
+
+class BPlusInternal:
+    """Creates the internal node class that routes searches to children."""
+
+    __slots__ = ("children", "keys")
+
+    def __init__(self, keys: List[Any], children: List[Any]):
+        self.keys = keys
+        self.children = children
+
+
+Node = Union[BPlusLeaf, BPlusInternal]
+
+
+class BPlusTree:
+    """Balanced search tree whose nodes hold up to `fanout` entries.
+
+    Every key lives in a leaf and the leaves are chained in sorted order.
+    A separator key is no smaller than any key to its left and no larger
+    than any key to its right, so duplicates may straddle two leaves.
+    """
+
+    def __init__(self, fanout: int):
+        if fanout < MIN_FANOUT:
+            raise ValueError(f"The fanout must be at least {MIN_FANOUT}.")
+        self.fanout = fanout
+        self.minimum = fanout // 2
+        self.typecode: Optional[str] = None
+        self.root: Node = BPlusLeaf([])
+        self.height = 1
+
+    def _keys(self, values: Sequence[Any]) -> MutableSequence[Any]:
+        """Copy values into the contiguous key storage of a node."""
+        if self.typecode is None:
+            return list(values)
+        return array(self.typecode, values)
+
+    @classmethod
+    def from_sorted(
+        cls, sorted_data: Sequence[Any], fanout: int
+    ) -> "BPlusTree":
+        """Bulk load packed leaves and build the levels above them in O(n).
+
+        Args:
+            sorted_data: Values in ascending order
+            fanout: Largest number of keys or children in a node
+
+        Returns:
+            BPlusTree: Tree holding every value of the input
+        """
+        tree = cls(fanout)
+        if not sorted_data:
+            return tree
+        tree.typecode = _typecode_for(sorted_data[-1])
+        if _typecode_for(sorted_data[0]) != tree.typecode:
+            tree.typecode = None
+        # each level holds (smallest key, node) pairs for the level above
+        level: List[Tuple[Any, Node]] = []
+        previous: Optional[BPlusLeaf] = None
+        for start, end in _even_ranges(len(sorted_data), fanout):
+            leaf = BPlusLeaf(tree._keys(sorted_data[start:end]))
+            if previous is not None:
+                previous.next = leaf
+            previous = leaf
+            level.append((leaf.keys[0], leaf))
+        while len(level) > 1:
+            level = [
+                (
+                    level[start][0],
+                    BPlusInternal(
+                        [key for key, _ in level[start + 1 : end]],
+                        [node for _, node in level[start:end]],
+                    ),
+                )
+                for start, end in _even_ranges(len(level), fanout)
+            ]
+            tree.height += 1
+        tree.root = level[0][1]
+        return tree
+
+    def _leftmost_path(
+        self, target: Any
+    ) -> Tuple[List[Tuple[BPlusInternal, int]], BPlusLeaf, int]:
+        """Find the first position that may hold the target.
+
+        Args:
+            target: Key to look for
+
+        Returns:
+            Tuple: Path of (node, child index) pairs, the leaf, and the
+            position of the first key in the leaf that is not smaller
+        """
+        path: List[Tuple[BPlusInternal, int]] = []
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            index = bisect_left(node.keys, target)
+            path.append((node, index))
+            node = node.children[index]
+        position = bisect_left(node.keys, target)
+        if position == len(node.keys) and node.next is not None:
+            # a run of equal keys may start in the following leaf
+            while path and path[-1][1] + 1 == len(path[-1][0].children):
+                path.pop()
+            if path:
+                parent, index = path.pop()
+                path.append((parent, index + 1))
+                node = parent.children[index + 1]
+                while isinstance(node, BPlusInternal):
+                    path.append((node, 0))
+                    node = node.children[0]
+                position = 0
+        return path, node, position
+
+    def search(self, target: Any) -> bool:
+        """Search for a value in the tree and return if found."""
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[bisect_left(node.keys, target)]
+        keys = node.keys
+        position = bisect_left(keys, target)
+        if position == len(keys):
+            # a run of equal keys may start in the following leaf
+            if node.next is None:
+                return False
+            keys = node.next.keys
+            position = 0
+        return keys[position] == target
+
+    def insert(self, value: Any) -> None:
+        """Inserts the value into its leaf and splits full nodes upwards."""
+        if self.typecode is None and not self.root.keys:
+            self.typecode = _typecode_for(value)
+            self.root = BPlusLeaf(self._keys([]))
+        path: List[Tuple[BPlusInternal, int]] = []
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            index = bisect_right(node.keys, value)
+            path.append((node, index))
+            node = node.children[index]
+        insort_right(node.keys, value)
+        if len(node.keys) <= self.fanout:
+            return
+
+        # split the leaf, copying its first right-hand key up as separator
+        middle = len(node.keys) // 2
+        sibling = BPlusLeaf(node.keys[middle:])
+        del node.keys[middle:]
+        sibling.next = node.next
+        node.next = sibling
+        separator: Any = sibling.keys[0]
+        new_node: Node = sibling
+        while path:
+            parent, index = path.pop()
+            parent.keys.insert(index, separator)
+            parent.children.insert(index + 1, new_node)
+            if len(parent.children) <= self.fanout:
+                return
+            # split the internal node, moving its middle key up
+            middle = len(parent.keys) // 2
+            separator = parent.keys[middle]
+            new_node = BPlusInternal(
+                parent.keys[middle + 1 :], parent.children[middle + 1 :]
+            )
+            del parent.keys[middle:]
+            del parent.children[middle + 1 :]
+        self.root = BPlusInternal([separator], [self.root, new_node])
+        self.height += 1
+
+    def delete(self, value: Any) -> bool:
+        """Delete one copy of the value and merge nodes that underflow.
+
+        Args:
+            value: Value to delete
+
+        Returns:
+            bool: True if a copy of the value was found and deleted
+        """
+        path, node, position = self._leftmost_path(value)
+        if position == len(node.keys) or node.keys[position] != value:
+            return False
+        del node.keys[position]
+
+        child: Node = node
+        while path:
+            parent, index = path.pop()
+            size = (
+                len(child.keys)
+                if isinstance(child, BPlusLeaf)
+                else len(child.children)
+            )
+            if size >= self.minimum:
+                return True
+            self._rebalance(parent, index)
+            child = parent
+        if (
+            isinstance(self.root, BPlusInternal)
+            and len(self.root.children) == 1
+        ):
+            self.root = self.root.children[0]
+            self.height -= 1
+        return True
+
+    def _rebalance(self, parent: BPlusInternal, index: int) -> None:
+        """Refill an underfull child by borrowing from or merging a sibling.
+
+        Args:
+            parent: Internal node holding the underfull child
+            index: Position of the underfull child in the parent
+        """
+        child = parent.children[index]
+        left = parent.children[index - 1] if index > 0 else None
+        right = (
+            parent.children[index + 1]
+            if index + 1 < len(parent.children)
+            else None
+        )
+        if isinstance(child, BPlusLeaf):
+            if left is not None and len(left.keys) > self.minimum:
+                child.keys.insert(0, left.keys.pop())
+                parent.keys[index - 1] = child.keys[0]
+            elif right is not None and len(right.keys) > self.minimum:
+                child.keys.append(right.keys.pop(0))
+                parent.keys[index] = right.keys[0]
+            elif left is not None:
+                left.keys.extend(child.keys)
+                left.next = child.next
+                del parent.keys[index - 1]
+                del parent.children[index]
+            elif right is not None:
+                child.keys.extend(right.keys)
+                child.next = right.next
+                del parent.keys[index]
+                del parent.children[index + 1]
+            return
+
+        if left is not None and len(left.children) > self.minimum:
+            child.keys.insert(0, parent.keys[index - 1])
+            child.children.insert(0, left.children.pop())
+            parent.keys[index - 1] = left.keys.pop()
+        elif right is not None and len(right.children) > self.minimum:
+            child.keys.append(parent.keys[index])
+            child.children.append(right.children.pop(0))
+            parent.keys[index] = right.keys.pop(0)
+        elif left is not None:
+            left.keys.append(parent.keys[index - 1])
+            left.keys.extend(child.keys)
+            left.children.extend(child.children)
+            del parent.keys[index - 1]
+            del parent.children[index]
+        elif right is not None:
+            child.keys.append(parent.keys[index])
+            child.keys.extend(right.keys)
+            child.children.extend(right.children)
+            del parent.keys[index]
+            del parent.children[index + 1]
+
+    def _nodes(self) -> List[Node]:
+        """Return every node of the tree, level by level."""
+        nodes: List[Node] = [self.root]
+        for node in nodes:
+            if isinstance(node, BPlusInternal):
+                nodes.extend(node.children)
+        return nodes
+
+    @property
+    def node_count(self) -> int:
+        """Return the number of leaf and internal nodes."""
+        return len(self._nodes())
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the nodes and key arrays, excluding boxed keys."""
+        total = 0
+        for node in self._nodes():
+            total += sys.getsizeof(node) + sys.getsizeof(node.keys)
+            if isinstance(node, BPlusInternal):
+                total += sys.getsizeof(node.children)
+        return total
@@ -1,9 +1,13 @@
 """Binary Search Tree Function Implementation"""
 
+from typing import Any, List, Optional, Sequence, Tuple
+
 
 class Node:
     """Creates the Node class for the BST."""
 
+    __slots__ = ("data", "l_child", "r_child")
+
     def __init__(self, value):
         self.l_child = None
         self.r_child = None
@@ -16,12 +20,46 @@ class BinarySearchTree:
     def __init__(self):
         self.root = None
 
+    @classmethod
+    def from_sorted(cls, sorted_data: Sequence[Any]) -> "BinarySearchTree":
+        """Build a balanced tree in O(n) by linking nodes directly."""
+        bst = cls()
+        if not sorted_data:
+            return bst
+        # each pending entry links the median of a range below its parent
+        bst.root = Node(None)
+        pending: List[Tuple[Node, int, int]] = [
+            (bst.root, 0, len(sorted_data) - 1)
+        ]
+        while pending:
+            node, start, end = pending.pop()
+            mid = (start + end) // 2
+            node.data = sorted_data[mid]
+            if start < mid:
+                node.l_child = Node(None)
+                pending.append((node.l_child, start, mid - 1))
+            if mid < end:
+                node.r_child = Node(None)
+                pending.append((node.r_child, mid + 1, end))
+        return bst
+
     def insert(self, value):
         """Inserts the value into the tree."""
         if self.root is None:
             self.root = Node(value)
-        else:
-            self.insert_recursive(self.root, value)
+            return
+        node = self.root
+        while True:
+            if value < node.data:
+                if node.l_child is None:
+                    node.l_child = Node(value)
+                    return
+                node = node.l_child
+            else:
+                if node.r_child is None:
+                    node.r_child = Node(value)
+                    return
+                node = node.r_child
 
     def insert_recursive(self, node, value):
         """Inserts the value into the tree recursively."""
@@ -36,9 +74,41 @@ class BinarySearchTree:
             else:
                 self.insert_recursive(node.r_child, value)
 
+    def delete(self, value) -> bool:
+        """Deletes one copy of the value and returns if it was found."""
+        parent: Optional[Node] = None
+        node: Optional[Node] = self.root
+        while node is not None and node.data != value:
+            parent = node
+            node = node.l_child if value < node.data else node.r_child
+        if node is None:
+            return False
+        if node.l_child is not None and node.r_child is not None:
+            # take the smallest value on the right, and unlink its node
+            parent = node
+            successor = node.r_child
+            while successor.l_child is not None:
+                parent = successor
+                successor = successor.l_child
+            node.data = successor.data
+            node = successor
+        child = node.l_child if node.l_child is not None else node.r_child
+        if parent is None:
+            self.root = child
+        elif parent.l_child is node:
+            parent.l_child = child
+        else:
+            parent.r_child = child
+        return True
+
     def search(self, target):
         """Search for a value in the BST and return if found."""
-        return self.search_recursive(self.root, target)
+        node: Optional[Node] = self.root
+        while node is not None:
+            if node.data == target:
+                return True
+            node = node.l_child if target < node.data else node.r_child
+        return False
 
     def search_recursive(self, node, target):
         """Search for a value in the BST recursively."""
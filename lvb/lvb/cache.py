@@ -0,0 +1,162 @@
+"""On-disk cache of generated datasets that later runs memory-map."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+
+import numpy as np
+
+from lvb.approach import DataType
+from lvb.constants import constants
+
+# every cached dataset is one NumPy file with this suffix
+CACHE_SUFFIX = ".npy"
+
+
+class DatasetCache:
+    """Directory of datasets keyed by size, type, sortedness and seed.
+
+    Each dataset is stored as a fixed-width NumPy array, so strings keep
+    their ASCII bytes, and is loaded without a copy through `mmap`. The
+    modification time of a file records its last use, and the least
+    recently used files are evicted once the directory grows too large.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = constants.DEFAULT_CACHE_DIRECTORY,
+        size_limit: int = constants.CACHE_SIZE_LIMIT,
+    ):
+        self.directory = Path(directory).expanduser()
+        self.size_limit = size_limit
+
+    def path(
+        self, size: int, data_type: DataType, sorted_data: bool, seed: int
+    ) -> Path:
+        """Return the file that holds the dataset with the given key."""
+        order = "sorted" if sorted_data else "unsorted"
+        return self.directory / (
+            f"{data_type}-{size}-{order}-seed{seed}{CACHE_SUFFIX}"
+        )
+
+    def load(
+        self, size: int, data_type: DataType, sorted_data: bool, seed: int
+    ) -> Optional[np.ndarray]:
+        """Map a cached dataset into memory, if it is in the cache.
+
+        Args:
+            size: Number of values in the dataset
+            data_type: Type of data in the dataset
+            sorted_data: Whether the dataset is sorted
+            seed: Seed that the dataset was generated with
+
+        Returns:
+            Optional[np.ndarray]: Read-only mapped values, or None on a miss
+        """
+        path = self.path(size, data_type, sorted_data, seed)
+        try:
+            values = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            # a missing or truncated file is a miss and is written again
+            return None
+        if len(values) != size:
+            return None
+        # mark the file as recently used for the eviction order
+        os.utime(path)
+        return values
+
+    def store(
+        self,
+        values: np.ndarray,
+        data_type: DataType,
+        sorted_data: bool,
+        seed: int,
+    ) -> None:
+        """Write a dataset to the cache and evict old files to make room.
+
+        Args:
+            values: Values of the dataset
+            data_type: Type of data in the dataset
+            sorted_data: Whether the dataset is sorted
+            seed: Seed that the dataset was generated with
+        """
+
+        def write(path: Path) -> None:
+            # a file object keeps np.save from appending its own suffix
+            with path.open("wb") as file:
+                np.save(file, values)
+
+        self.create(len(values), data_type, sorted_data, seed, write)
+
+    def create(
+        self,
+        size: int,
+        data_type: DataType,
+        sorted_data: bool,
+        seed: int,
+        write: Callable[[Path], None],
+    ) -> Path:
+        """Let a writer create a dataset file, then evict old files.
+
+        Args:
+            size: Number of values in the dataset
+            data_type: Type of data in the dataset
+            sorted_data: Whether the dataset is sorted
+            seed: Seed that the dataset was generated with
+            write: Function that writes the NumPy file to the given path
+
+        Returns:
+            Path: File that now holds the dataset
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(size, data_type, sorted_data, seed)
+        # write to a temporary file first, so readers never see half a file
+        descriptor, temporary = tempfile.mkstemp(
+            dir=self.directory, suffix=".tmp"
+        )
+        os.close(descriptor)
+        try:
+            write(Path(temporary))
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        self.evict(keep=path)
+        return path
+
+    def files(self) -> List[Path]:
+        """Return the cached datasets from least to most recently used."""
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            self.directory.glob(f"*{CACHE_SUFFIX}"),
+            key=lambda path: path.stat().st_mtime,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Return the total size of the cached datasets on disk."""
+        return sum(path.stat().st_size for path in self.files())
+
+    def evict(self, keep: Optional[Path] = None) -> List[Path]:
+        """Delete the least recently used datasets beyond the size limit.
+
+        Args:
+            keep: Dataset that is never evicted, such as the one just written
+
+        Returns:
+            List: Files that were deleted
+        """
+        files = self.files()
+        total = sum(path.stat().st_size for path in files)
+        evicted = []
+        for path in files:
+            if total <= self.size_limit:
+                break
+            if path == keep:
+                continue
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
+            evicted.append(path)
+        return evicted
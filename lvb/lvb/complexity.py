@@ -0,0 +1,147 @@
+"""Fit the growth of search times to complexity classes and extrapolate."""
+
+import math
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from lvb.constants import constants
+
+# candidate growth models, from the slowest growing to the fastest, so a
+# tie goes to the simpler explanation
+MODELS: Dict[str, Callable[[float], float]] = {
+    "1": lambda size: 1.0,
+    "log n": math.log2,
+    "n": float,
+    "n log n": lambda size: size * math.log2(size),
+}
+
+
+@dataclass(frozen=True)
+class ModelFit:
+    """Class to store a least-squares fit of time = a + b * f(n)."""
+
+    name: str
+    intercept: float
+    coefficient: float
+    # Share of the variance of the times that the model explains
+    r_squared: float
+    # R² penalized for the parameters the model spends
+    adjusted_r_squared: float
+
+    def predict(self, size: int) -> float:
+        """Return the time that the model predicts for a dataset size."""
+        return self.intercept + self.coefficient * MODELS[self.name](size)
+
+
+@dataclass(frozen=True)
+class ScalingAnalysis:
+    """Class to store how search times grow with the dataset size."""
+
+    # Time of each run divided by the time of the run before it
+    ratios: List[float]
+    # Slope of log(time) against log(size), as in time ~ n ** exponent
+    exponent: float
+    fits: List[ModelFit]
+    best: Optional[ModelFit]
+
+
+def doubling_ratios(times: Sequence[float]) -> List[float]:
+    """Return the ratio of every time to the time of the run before it."""
+    return [
+        after / before if before > 0 else math.inf
+        for before, after in pairwise(times)
+    ]
+
+
+def power_law_exponent(sizes: Sequence[int], times: Sequence[float]) -> float:
+    """Return the slope of a straight line through log(size), log(time).
+
+    An exponent near 0 means constant time, near 1 linear time, and a
+    logarithmic search shows a small exponent that shrinks as n grows.
+
+    Args:
+        sizes: Dataset size of every run
+        times: Time of every run, in seconds
+
+    Returns:
+        float: Fitted exponent, or NaN with fewer than two usable runs
+    """
+    points = [
+        (math.log(size), math.log(time))
+        for size, time in zip(sizes, times)
+        if size > 0 and time > 0
+    ]
+    if len({x for x, _ in points}) < 2:  # noqa: PLR2004
+        return math.nan
+    slope, _ = np.polyfit(*zip(*points), deg=1)
+    return float(slope)
+
+
+def fit_model(
+    name: str, sizes: Sequence[int], times: Sequence[float]
+) -> Optional[ModelFit]:
+    """Fit one growth model to the times by least squares.
+
+    Args:
+        name: Model in MODELS to fit
+        sizes: Dataset size of every run
+        times: Time of every run, in seconds
+
+    Returns:
+        Optional[ModelFit]: Fit, or None if the times shrink as the model
+        grows, which no complexity class explains
+    """
+    observed = np.asarray(times, dtype=float)
+    mean = float(observed.mean())
+    total = float(((observed - mean) ** 2).sum())
+    if name == "1":
+        return ModelFit(name, mean, 0.0, 0.0, 0.0)
+    growth = np.array([MODELS[name](size) for size in sizes])
+    design = np.column_stack([np.ones_like(growth), growth])
+    (intercept, coefficient), *_ = np.linalg.lstsq(design, observed)
+    if coefficient <= 0:
+        return None
+    residual = float(
+        ((observed - design @ (intercept, coefficient)) ** 2).sum()
+    )
+    r_squared = 1.0 - residual / total if total > 0 else 1.0
+    runs = len(times)
+    adjusted = 1.0 - (1.0 - r_squared) * (runs - 1) / (runs - 2)
+    return ModelFit(
+        name, float(intercept), float(coefficient), r_squared, adjusted
+    )
+
+
+def analyze_scaling(
+    sizes: Sequence[int], times: Sequence[float]
+) -> ScalingAnalysis:
+    """Find how the times of doubling runs grow with the dataset size.
+
+    Every model is fitted with an intercept, which absorbs the fixed cost
+    of the harness, and the best one explains the most variance once its
+    extra parameter is paid for, so flat, noisy times stay constant.
+
+    Args:
+        sizes: Dataset size of every run, in increasing order
+        times: Time of every run, in seconds
+
+    Returns:
+        ScalingAnalysis: Doubling ratios, exponent and model fits
+    """
+    ratios = doubling_ratios(times)
+    exponent = power_law_exponent(sizes, times)
+    if len(set(sizes)) < constants.MIN_FIT_SIZES:
+        return ScalingAnalysis(ratios, exponent, [], None)
+    fits = [
+        fit
+        for fit in (fit_model(name, sizes, times) for name in MODELS)
+        if fit is not None
+    ]
+    best = None
+    for fit in fits:
+        if best is None or fit.adjusted_r_squared > best.adjusted_r_squared:
+            best = fit
+    return ScalingAnalysis(ratios, exponent, fits, best)
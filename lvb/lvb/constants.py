@@ -12,6 +12,14 @@ class Constants:
     DEFAULT_RUNS: int
     DEFAULT_SEARCHES: int
     DOUBLING_FACTOR: int
+    DEFAULT_REPEATS: int
+    DEFAULT_TIME_BUDGET: float
+    DEFAULT_WARMUP: int
+    DEFAULT_FALSE_POSITIVE_RATE: float
+    LEARNED_INDEX_MAX_ERROR: int
+    DEFAULT_FANOUT: int
+    DEFAULT_JOBS: int
+    DEFAULT_DURATION: float
 
     # For data generation
     RANDOM_INT_MIN: int
@@ -19,6 +27,53 @@ class Constants:
     RANDOM_FLOAT_MIN: float
     RANDOM_FLOAT_MAX: float
     STRING_LENGTH: int
+    GENERATION_BLOCK: int
+
+    # For skewed target workloads
+    DEFAULT_ZIPF_EXPONENT: float
+    ZIPF_SERIES_CUTOFF: float
+    HOT_SET_FRACTION: float
+    HOT_SET_PROBABILITY: float
+    TEMPORAL_WINDOW: int
+    TEMPORAL_PROBABILITY: float
+
+    # For the lookup cache
+    DEFAULT_LOOKUP_CACHE_CAPACITY: int
+
+    # For mixed read/write workloads
+    DEFAULT_OPERATIONS: int
+    DEFAULT_READ_SHARE: float
+    DEFAULT_INSERT_SHARE: float
+    DEFAULT_DELETE_SHARE: float
+
+    # For the on-disk dataset cache
+    DEFAULT_CACHE_DIRECTORY: str
+    CACHE_SIZE_LIMIT: int
+
+    # For memory-mapped storage
+    MAPPED_SCAN_BLOCK: int
+
+    # For the lookup service
+    DEFAULT_HOST: str
+    DEFAULT_PORT: int
+    DEFAULT_REQUEST_BATCH: int
+    DEFAULT_CONNECTIONS: int
+    DEFAULT_PIPELINE: int
+    FRAME_LIMIT: int
+    SUSTAINED_FRACTION: float
+    RATE_STEP: float
+
+    # For saved results and regression checks
+    DEFAULT_RESULTS_FILE: str
+    DEFAULT_REGRESSION_THRESHOLD: float
+
+    # For complexity fitting
+    MIN_FIT_SIZES: int
+
+    # For profiling
+    PROFILE_FUNCTIONS: int
+    PRINTED_TRACES: int
+    PRINTED_PROBES: int
 
     # For output formatting
     DECIMAL_PLACES: int
@@ -29,10 +84,47 @@ constants = Constants(
     DEFAULT_RUNS=5,  # Default number of benchmarking runs
     DEFAULT_SEARCHES=100,  # Default number of searches per run
     DOUBLING_FACTOR=2,  # Factor by which the dataset size increases
+    DEFAULT_REPEATS=5,  # Default number of independent timing repeats
+    DEFAULT_TIME_BUDGET=0.5,  # Default seconds for all repeats of a run
+    DEFAULT_WARMUP=2,  # Default number of untimed calls before timing
+    DEFAULT_FALSE_POSITIVE_RATE=0.01,  # Target rate for the Bloom filter
+    LEARNED_INDEX_MAX_ERROR=16,  # Largest error of a learned prediction
+    DEFAULT_FANOUT=64,  # Largest number of entries in a B+-tree node
+    DEFAULT_JOBS=1,  # Default number of processes that run benchmarks
+    DEFAULT_DURATION=1.0,  # Default seconds that throughput readers run
     RANDOM_INT_MIN=1,  # Minimum value for random integers
     RANDOM_INT_MAX=10000,  # Maximum value for random integers
     RANDOM_FLOAT_MIN=0.0,  # Minimum value for random floats
     RANDOM_FLOAT_MAX=10000.0,  # Maximum value for random floats
     STRING_LENGTH=10,  # Length of random strings
+    GENERATION_BLOCK=1 << 22,  # Values drawn at once while generating
+    DEFAULT_ZIPF_EXPONENT=1.0,  # Skew of Zipf targets, 0 being uniform
+    ZIPF_SERIES_CUTOFF=1e-8,  # Below this, Zipf sampling uses a series
+    HOT_SET_FRACTION=0.01,  # Share of the elements that are hot
+    HOT_SET_PROBABILITY=0.9,  # Chance that a search goes to the hot set
+    TEMPORAL_WINDOW=16,  # Recent targets that a search may repeat
+    TEMPORAL_PROBABILITY=0.8,  # Chance that a search repeats a recent one
+    DEFAULT_LOOKUP_CACHE_CAPACITY=64,  # Results kept by a lookup cache
+    DEFAULT_OPERATIONS=10000,  # Operations per run of a mixed workload
+    DEFAULT_READ_SHARE=0.8,  # Share of the operations that are reads
+    DEFAULT_INSERT_SHARE=0.1,  # Share of the operations that are inserts
+    DEFAULT_DELETE_SHARE=0.1,  # Share of the operations that are deletes
+    DEFAULT_CACHE_DIRECTORY="~/.cache/lvb",  # Where datasets are cached
+    CACHE_SIZE_LIMIT=4 * 1024**3,  # Bytes of datasets kept in the cache
+    MAPPED_SCAN_BLOCK=65536,  # Values read per block of a streaming scan
+    DEFAULT_HOST="127.0.0.1",  # Interface that the lookup server binds
+    DEFAULT_PORT=7878,  # TCP port that the lookup server listens on
+    DEFAULT_REQUEST_BATCH=16,  # Keys in one request of the load generator
+    DEFAULT_CONNECTIONS=4,  # Connections that the load generator opens
+    DEFAULT_PIPELINE=1,  # Requests in flight on one closed-loop connection
+    FRAME_LIMIT=1 << 24,  # Largest request payload the server accepts
+    SUSTAINED_FRACTION=0.95,  # Share of an offered rate that counts as kept
+    RATE_STEP=1.25,  # Factor between the rates probed for the maximum QPS
+    DEFAULT_RESULTS_FILE="lvb-results",  # Name of saved results, sans suffix
+    DEFAULT_REGRESSION_THRESHOLD=0.05,  # Slowdown that fails a comparison
+    MIN_FIT_SIZES=3,  # Fewest distinct sizes that a model is fitted to
+    PROFILE_FUNCTIONS=15,  # Functions listed from a profile, by time spent
+    PRINTED_TRACES=3,  # Probe traces printed per run, the rest only saved
+    PRINTED_PROBES=16,  # Probes printed from a trace before it is cut short
     DECIMAL_PLACES=6,  # Number of decimal places for output formatting
 )
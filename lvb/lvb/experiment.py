@@ -0,0 +1,688 @@
+"""Configure and run one benchmark of a search algorithm on a structure."""
+
+# ruff: noqa: PLR0911, PLR0912, PLR0913
+
+import random
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from lvb import approach
+from lvb.benchmark import Measurement, measure, measure_latencies
+from lvb.binarysearch import (
+    binary_search_iterative,
+    binary_search_many,
+    binary_search_recursive,
+    exponential_search,
+)
+from lvb.bloom import BloomFilter
+from lvb.cache import DatasetCache
+from lvb.constants import constants
+from lvb.gallopingsearch import galloping_search_many
+from lvb.generate import (
+    BINARY_SEARCH_TREES,
+    SELF_BALANCING_TREES,
+    generate_array,
+    generate_dataset,
+    generate_learned_index,
+    generate_structure,
+    select_array_targets,
+    select_targets,
+)
+from lvb.instrument import count_searches
+from lvb.interpolationsearch import interpolation_search
+from lvb.linearsearch import (
+    linear_search,
+    linear_search_many,
+    move_to_front_search,
+    transpose_search,
+)
+from lvb.lookupcache import cache_statistics, create_lookup_cache
+from lvb.mapped import MappedDataset, open_mapped_dataset
+from lvb.memory import measure_memory
+from lvb.packed import PackedStrings
+
+# search algorithms that only run on a sorted list
+SORTED_LIST_SEARCHES = [
+    approach.SearchAlgorithm.GALLOPING_SEARCH,
+    approach.SearchAlgorithm.INTERPOLATION_SEARCH,
+    approach.SearchAlgorithm.EXPONENTIAL_SEARCH,
+    approach.SearchAlgorithm.LEARNED_INDEX_SEARCH,
+]
+
+# search algorithms that run directly over a memory-mapped file
+MAPPED_SEARCHES = [
+    approach.SearchAlgorithm.LINEAR_SEARCH,
+    approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+    approach.SearchAlgorithm.BINARY_SEARCH_RECURSIVE,
+]
+
+# structures whose keys can stay packed in one byte buffer
+PACKED_STRUCTURES = [
+    approach.DataStructure.UNSORTED_LIST,
+    approach.DataStructure.SORTED_LIST,
+    approach.DataStructure.EYTZINGER_TREE,
+]
+
+# single-target searches that run on the list itself, with no structure
+# binary searches that run as one C bisection over packed keys
+PACKED_BISECTIONS = [
+    approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+    approach.SearchAlgorithm.BINARY_SEARCH_RECURSIVE,
+]
+
+LIST_SEARCHES = {
+    approach.SearchAlgorithm.LINEAR_SEARCH: linear_search,
+    approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE: binary_search_iterative,
+    approach.SearchAlgorithm.BINARY_SEARCH_RECURSIVE: binary_search_recursive,
+    approach.SearchAlgorithm.INTERPOLATION_SEARCH: interpolation_search,
+    approach.SearchAlgorithm.EXPONENTIAL_SEARCH: exponential_search,
+    approach.SearchAlgorithm.MOVE_TO_FRONT_SEARCH: move_to_front_search,
+    approach.SearchAlgorithm.TRANSPOSE_SEARCH: transpose_search,
+}
+
+# searches that reorder the list as they go, so that it adapts to skew
+SELF_ADJUSTING_SEARCHES = [
+    approach.SearchAlgorithm.MOVE_TO_FRONT_SEARCH,
+    approach.SearchAlgorithm.TRANSPOSE_SEARCH,
+]
+
+# search algorithms that do arithmetic on the values they search
+NUMERIC_SEARCHES = [
+    approach.SearchAlgorithm.INTERPOLATION_SEARCH,
+    approach.SearchAlgorithm.LEARNED_INDEX_SEARCH,
+]
+
+
+def describe(choice: str) -> str:
+    """Turn an enum value into words for a console message."""
+    return str(choice).replace("_", " ")
+
+
+def validate_configuration(
+    data_structure: approach.DataStructure,
+    search_algorithm: approach.SearchAlgorithm,
+    batch: bool = False,
+    bloom_filter: bool = False,
+    *,
+    data_type: Optional[approach.DataType] = None,
+    storage: approach.Storage = approach.Storage.MEMORY,
+    lookup_cache: bool = False,
+    memory: bool = False,
+    instrument: bool = False,
+) -> Optional[str]:
+    """Check that a search algorithm can run on a data structure.
+
+    Args:
+        data_structure: Data structure to search
+        search_algorithm: Search algorithm to run on it
+        batch: Whether all targets are searched for in one batched call
+        bloom_filter: Whether a Bloom filter screens every single search
+        data_type: Type of data to search, if it is known
+        storage: Where the values of a list are kept
+        lookup_cache: Whether a cache of results answers repeated searches
+        memory: Whether the run profiles the memory that it allocates
+        instrument: Whether the run counts the operations of every search
+
+    Returns:
+        Optional[str]: Reason the pair is invalid, or None if it is valid
+    """
+    if (
+        search_algorithm
+        in [
+            approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+            approach.SearchAlgorithm.BINARY_SEARCH_RECURSIVE,
+        ]
+        and data_structure == approach.DataStructure.UNSORTED_LIST
+    ):
+        return "Binary search requires sorted list"
+
+    if (
+        search_algorithm in SORTED_LIST_SEARCHES
+        and data_structure != approach.DataStructure.SORTED_LIST
+    ):
+        return (
+            f"{describe(search_algorithm).capitalize()} requires sorted list"
+        )
+
+    if (
+        search_algorithm in NUMERIC_SEARCHES
+        and data_type == approach.DataType.STRINGS
+    ):
+        return (
+            f"{describe(search_algorithm).capitalize()} requires numeric data"
+        )
+
+    if (
+        search_algorithm in SELF_ADJUSTING_SEARCHES
+        and data_structure != approach.DataStructure.UNSORTED_LIST
+    ):
+        return (
+            f"{describe(search_algorithm).capitalize()} requires unsorted list"
+        )
+
+    if batch and data_structure not in [
+        approach.DataStructure.UNSORTED_LIST,
+        approach.DataStructure.SORTED_LIST,
+    ]:
+        return "Batch search requires a list"
+
+    if batch and search_algorithm in SELF_ADJUSTING_SEARCHES:
+        return "Self-adjusting searches reorder the list one target at a time"
+
+    if bloom_filter and (
+        batch or search_algorithm == approach.SearchAlgorithm.GALLOPING_SEARCH
+    ):
+        return "Bloom filter requires single-target searches"
+
+    if lookup_cache and (
+        batch or search_algorithm == approach.SearchAlgorithm.GALLOPING_SEARCH
+    ):
+        return "Lookup cache requires single-target searches"
+
+    if lookup_cache and (
+        search_algorithm in SELF_ADJUSTING_SEARCHES
+        or data_structure == approach.DataStructure.SPLAY_TREE
+    ):
+        # a cached index goes stale as soon as a search moves the value
+        return "Lookup cache requires searches that only read"
+
+    if storage == approach.Storage.MMAP and (
+        search_algorithm not in MAPPED_SEARCHES
+        or batch
+        or bloom_filter
+        or lookup_cache
+    ):
+        return "Mapped storage requires a single linear or binary search"
+
+    if storage == approach.Storage.MMAP and (memory or instrument):
+        # the values are read from the file, never built into a structure
+        return "Mapped storage cannot profile memory or count operations"
+
+    if storage == approach.Storage.PACKED:
+        if data_type not in [None, approach.DataType.STRINGS]:
+            return "Packed storage requires string data"
+        if data_structure not in PACKED_STRUCTURES:
+            return "Packed storage requires a list or an Eytzinger tree"
+        if search_algorithm in SELF_ADJUSTING_SEARCHES:
+            return "Packed storage keeps its keys in place"
+
+    pointer_tree = (
+        data_structure in BINARY_SEARCH_TREES
+        or data_structure in SELF_BALANCING_TREES
+    )
+    if search_algorithm == approach.SearchAlgorithm.BST_SEARCH:
+        return None if pointer_tree else "BST search requires binary tree"
+    if pointer_tree:
+        return "Binary tree requires BST search"
+
+    # structures that are searched only by an algorithm of their own
+    dedicated_searches = {
+        approach.DataStructure.EYTZINGER_TREE: approach.SearchAlgorithm.EYTZINGER_SEARCH,
+        approach.DataStructure.HASH_INDEX: approach.SearchAlgorithm.HASH_LOOKUP,
+        approach.DataStructure.B_PLUS_TREE: approach.SearchAlgorithm.B_PLUS_TREE_SEARCH,
+    }
+    for structure, algorithm in dedicated_searches.items():
+        if search_algorithm == algorithm and data_structure != structure:
+            return f"{describe(algorithm).capitalize()} requires {describe(structure)}"
+        if data_structure == structure and search_algorithm != algorithm:
+            return f"{describe(structure).capitalize()} requires {describe(algorithm)}"
+
+    return None
+
+
+def select_search_function(
+    search_algorithm: approach.SearchAlgorithm,
+    dataset: List[Any],
+    structure: Optional[Any],
+) -> Optional[Callable[[Any], Any]]:
+    """Select the function that searches for a single target.
+
+    The list searches are bound to the dataset, so every returned function
+    takes only the target and the timed loop needs no dispatch.
+
+    Args:
+        search_algorithm: Search algorithm to run
+        dataset: Dataset that the list searches run on
+        structure: Generated structure, or None for the list structures
+
+    Returns:
+        Optional[Callable]: Search function, or None if the algorithm only
+        searches for a whole batch of targets at once
+    """
+    if isinstance(dataset, PackedStrings):
+        # packed keys are scanned and bisected in C, without reading one at
+        # a time into an object of its own
+        if search_algorithm == approach.SearchAlgorithm.LINEAR_SEARCH:
+            return dataset.find
+        if search_algorithm in PACKED_BISECTIONS:
+            return dataset.bisect
+    if search_algorithm in LIST_SEARCHES:
+        return partial(LIST_SEARCHES[search_algorithm], dataset)
+    if structure is not None:
+        return structure.search
+    return None
+
+
+@dataclass(frozen=True)
+class Configuration:
+    """Class to store every choice that defines one benchmark."""
+
+    data_structure: approach.DataStructure
+    search_algorithm: approach.SearchAlgorithm
+    data_type: approach.DataType = approach.DataType.INTEGERS
+    target_position: approach.TargetPosition = approach.TargetPosition.RANDOM
+    # Skew of the Zipf target position, where 0 searches uniformly
+    zipf_exponent: float = constants.DEFAULT_ZIPF_EXPONENT
+    insert_order: approach.InsertOrder = approach.InsertOrder.BALANCED
+    fanout: int = constants.DEFAULT_FANOUT
+    searches: int = constants.DEFAULT_SEARCHES
+    batch: bool = False
+    bloom_filter: bool = False
+    false_positive_rate: float = constants.DEFAULT_FALSE_POSITIVE_RATE
+    # Eviction policy of a cache of search results, or None for no cache
+    lookup_cache: Optional[approach.CachePolicy] = None
+    lookup_cache_capacity: int = constants.DEFAULT_LOOKUP_CACHE_CAPACITY
+    repeats: int = constants.DEFAULT_REPEATS
+    time_budget: float = constants.DEFAULT_TIME_BUDGET
+    warmup: int = constants.DEFAULT_WARMUP
+    seed: Optional[int] = None
+    storage: approach.Storage = approach.Storage.MEMORY
+    # Whether to measure the memory of the structure and its searches
+    memory: bool = False
+    # Whether to count the comparisons and probes of every search
+    instrument: bool = False
+    # Whether to keep the probes of every search, for locality analysis
+    trace: bool = False
+    # Directory of the dataset cache, or None to always generate
+    cache_directory: Optional[str] = None
+
+    def validate(self) -> Optional[str]:
+        """Return the reason the configuration is invalid, or None."""
+        return validate_configuration(
+            self.data_structure,
+            self.search_algorithm,
+            self.batch,
+            self.bloom_filter,
+            data_type=self.data_type,
+            storage=self.storage,
+            lookup_cache=self.lookup_cache is not None,
+            memory=self.memory,
+            instrument=self.instrument,
+        )
+
+    def dataset_cache(self) -> Optional[DatasetCache]:
+        """Return the cache of seeded datasets, or None if it is off."""
+        if self.cache_directory is None:
+            return None
+        return DatasetCache(self.cache_directory)
+
+    @property
+    def self_adjusting(self) -> bool:
+        """Return whether searching reorders the structure it searches."""
+        return (
+            self.search_algorithm in SELF_ADJUSTING_SEARCHES
+            or self.data_structure == approach.DataStructure.SPLAY_TREE
+        )
+
+    @property
+    def needs_sorted(self) -> bool:
+        """Return whether the dataset is generated in sorted order.
+
+        Every structure other than the unsorted list and the hash index is
+        searched or built in sorted order, so sorting once while the data
+        is generated spares the tree builders a second sort.
+        """
+        return self.data_structure not in [
+            approach.DataStructure.UNSORTED_LIST,
+            approach.DataStructure.HASH_INDEX,
+        ]
+
+
+@dataclass
+class RunResult:
+    """Class to store the outcome of benchmarking one dataset size."""
+
+    size: int
+    # Time to search for all of the targets once
+    measurement: Measurement
+    # Time of each single search, empty for batched searches
+    latencies: List[float] = field(default_factory=list)
+    # Build statistics of the structure and any other reported numbers
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def elapsed_time(self) -> float:
+        """Return the mean time to search for all of the targets."""
+        return self.measurement.mean
+
+
+def build_structure(
+    configuration: Configuration, dataset: List[Any]
+) -> Optional[Any]:
+    """Build the structure that the configured search runs on.
+
+    Args:
+        configuration: Benchmark to build the structure for
+        dataset: Dataset to build it from, sorted if the configuration
+            needs it
+
+    Returns:
+        Optional[Any]: Generated structure, or None for the list searches
+    """
+    if (
+        configuration.search_algorithm
+        == approach.SearchAlgorithm.LEARNED_INDEX_SEARCH
+    ):
+        # the model is fitted over the sorted list that it indexes
+        return generate_learned_index(dataset)
+    return generate_structure(
+        dataset,
+        configuration.data_structure,
+        configuration.insert_order,
+        configuration.fanout,
+        sorted_data=configuration.needs_sorted,
+    )
+
+
+def _structure_details(structure: Any, size: int) -> Dict[str, Any]:
+    """Collect the rebalancing work and footprint of a built structure."""
+    details: Dict[str, Any] = {}
+    # only the trees implemented here count their rotations
+    for name in ("rotations", "height", "node_count"):
+        value = getattr(structure, name, None)
+        if value is not None:
+            details[name] = value
+    nbytes = getattr(structure, "nbytes", None)
+    if nbytes is not None:
+        details["bytes_per_key"] = nbytes / max(1, size)
+    return details
+
+
+def search_each(search_func: Callable[[Any], Any], targets: List[Any]) -> None:
+    """Search for every target once, one at a time."""
+    for target in targets:
+        search_func(target)
+
+
+def _batch_search(configuration: Configuration) -> Callable:
+    """Select the function that finds a whole batch of targets at once."""
+    if (
+        configuration.search_algorithm
+        == approach.SearchAlgorithm.LINEAR_SEARCH
+    ):
+        return linear_search_many
+    return binary_search_many
+
+
+def _search_phase(
+    configuration: Configuration,
+    dataset: List[Any],
+    targets: List[Any],
+    search_func: Optional[Callable[[Any], Any]],
+) -> Callable[[], Any]:
+    """Return a function that searches for every target as a run does."""
+    if (
+        configuration.search_algorithm
+        == approach.SearchAlgorithm.GALLOPING_SEARCH
+    ):
+        return partial(galloping_search_many, dataset, targets)
+    if configuration.batch:
+        # the arrays are copied here, outside of the measured searches
+        return partial(
+            _batch_search(configuration),
+            np.asarray(dataset),
+            np.asarray(targets),
+        )
+    return partial(search_each, search_func, targets)
+
+
+def _timing(configuration: Configuration) -> Callable[[Callable], Measurement]:
+    """Bind the repeats, budget and warm-up of a configuration to `measure`."""
+    return partial(
+        measure,
+        repeats=configuration.repeats,
+        time_budget=configuration.time_budget,
+        warmup=configuration.warmup,
+    )
+
+
+def benchmark_dataset(
+    configuration: Configuration,
+    dataset: List[Any],
+    targets: List[Any],
+    build: Optional[Callable[[], Optional[Any]]] = None,
+) -> RunResult:
+    """Build the configured structure over a dataset and time its searches.
+
+    Args:
+        configuration: Benchmark to run
+        dataset: Dataset to search, sorted if the configuration needs it
+        targets: Targets to search for
+        build: Function that returns the structure over the dataset, by
+            default one that builds it from scratch
+
+    Returns:
+        RunResult: Timings and build statistics of the run
+    """
+    size = len(dataset)
+    details: Dict[str, Any] = {}
+
+    # Generate structure if needed, timing the inserts and rebalancing
+    build_start = time.perf_counter()
+    structure = (
+        build_structure(configuration, dataset) if build is None else build()
+    )
+    if structure is not None:
+        details["build_time"] = time.perf_counter() - build_start
+        details.update(_structure_details(structure, size))
+
+    # Select search function
+    search_func = select_search_function(
+        configuration.search_algorithm, dataset, structure
+    )
+
+    # Screen every search with a Bloom filter if requested
+    bloom = None
+    if configuration.bloom_filter:
+        bloom_start = time.perf_counter()
+        bloom = BloomFilter.from_dataset(
+            dataset, size, configuration.false_positive_rate
+        )
+        details["bloom_build_time"] = time.perf_counter() - bloom_start
+        details["bloom_bytes_per_key"] = bloom.nbytes / max(1, size)
+        # only targets that are truly missing can be false positives
+        members = set(dataset)
+        missing = [target for target in targets if target not in members]
+        false_positives = sum(target in bloom for target in missing)
+        details["bloom_false_positives"] = false_positives
+        details["bloom_missing_targets"] = len(missing)
+        details["bloom_false_positive_rate"] = (
+            false_positives / len(missing) if missing else 0.0
+        )
+        search_func = bloom.guard(search_func)
+
+    # Answer repeated targets from a cache of results if requested
+    lookup_cache = None
+    if configuration.lookup_cache is not None:
+        lookup_cache = create_lookup_cache(
+            configuration.lookup_cache, configuration.lookup_cache_capacity
+        )
+        search_func = lookup_cache.wrap(search_func)
+
+    if configuration.memory:
+        details.update(
+            measure_memory(
+                # a list is its own structure, so copying it builds one
+                lambda: (
+                    build_structure(configuration, dataset)
+                    if structure is not None
+                    else dataset.copy()
+                ),
+                size,
+                _search_phase(configuration, dataset, targets, search_func),
+            )
+        )
+
+    if configuration.instrument and not (
+        configuration.batch
+        or configuration.search_algorithm
+        == approach.SearchAlgorithm.GALLOPING_SEARCH
+    ):
+        details.update(
+            count_searches(
+                LIST_SEARCHES.get(configuration.search_algorithm),
+                dataset,
+                structure,
+                targets,
+                trace=configuration.trace,
+            )
+        )
+
+    timing = _timing(configuration)
+    measurement = timing(
+        _search_phase(configuration, dataset, targets, search_func)
+    )
+    if (
+        configuration.search_algorithm
+        == approach.SearchAlgorithm.GALLOPING_SEARCH
+    ):
+        # the sweep is batched by design, so compare it against the
+        # same targets found by independent binary searches
+        search_binary = partial(binary_search_iterative, dataset)
+        details["baseline_time"] = timing(
+            partial(search_each, search_binary, targets)
+        ).mean
+        return RunResult(size, measurement, details=details)
+
+    if configuration.batch:
+        return RunResult(size, measurement, details=details)
+
+    latencies = measure_latencies(search_func, targets)
+    if lookup_cache is not None:
+        details.update(cache_statistics(lookup_cache, search_func, targets))
+    return RunResult(size, measurement, latencies, details)
+
+
+def benchmark_mapped(
+    configuration: Configuration, mapped: MappedDataset, targets: List[Any]
+) -> RunResult:
+    """Time searches that run directly over a memory-mapped file.
+
+    The targets are first searched for once on a cold page cache, which
+    also counts the pages and bytes that the lookups read, and then timed
+    repeatedly on the warm page cache.
+
+    Args:
+        configuration: Benchmark to run
+        mapped: Mapped dataset to search
+        targets: Targets to search for
+
+    Returns:
+        RunResult: Warm timings, with cold latencies and I/O in the details
+    """
+    search_func = (
+        mapped.linear_search
+        if configuration.search_algorithm
+        == approach.SearchAlgorithm.LINEAR_SEARCH
+        else mapped.binary_search
+    )
+    details: Dict[str, Any] = {}
+    details["page_cache_dropped"] = mapped.evict_pages()
+    mapped.reset_counters()
+    details["cold_latencies"] = measure_latencies(search_func, targets)
+    lookups = max(1, mapped.lookups)
+    details["pages_per_lookup"] = mapped.pages_touched / lookups
+    details["bytes_per_lookup"] = mapped.bytes_read / lookups
+
+    def perform_searches():
+        for target in targets:
+            search_func(target)
+
+    measurement = _timing(configuration)(perform_searches)
+    latencies = measure_latencies(search_func, targets)
+    return RunResult(len(mapped), measurement, latencies, details)
+
+
+def run_benchmark(configuration: Configuration, size: int) -> RunResult:
+    """Generate a dataset and targets of a size and benchmark them.
+
+    Args:
+        configuration: Benchmark to run
+        size: Number of values in the dataset
+
+    Returns:
+        RunResult: Timings and build statistics of the run
+    """
+    if configuration.seed is not None:
+        # targets, shuffles and treap priorities use Python's generator
+        random.seed(f"{configuration.seed}:{size}")
+    generate_start = time.perf_counter()
+    cache = configuration.dataset_cache()
+    if configuration.storage == approach.Storage.MMAP:
+        with open_mapped_dataset(
+            size,
+            configuration.data_type,
+            sorted_data=configuration.needs_sorted,
+            seed=configuration.seed,
+            cache=cache,
+        ) as mapped:
+            generate_time = time.perf_counter() - generate_start
+            targets = select_array_targets(
+                mapped.values,
+                configuration.target_position,
+                configuration.searches,
+                configuration.data_type,
+                configuration.zipf_exponent,
+            )
+            result = benchmark_mapped(configuration, mapped, targets)
+        result.details["generate_time"] = generate_time
+        return result
+
+    if configuration.storage == approach.Storage.PACKED:
+        values = generate_array(
+            size,
+            configuration.data_type,
+            sorted_data=configuration.needs_sorted,
+            seed=configuration.seed,
+            cache=cache,
+        )
+        packed = PackedStrings.from_array(values)
+        generate_time = time.perf_counter() - generate_start
+        # targets are encoded once, so lookups compare bytes with bytes
+        targets = [
+            packed.encode(target)
+            for target in select_array_targets(
+                values,
+                configuration.target_position,
+                configuration.searches,
+                configuration.data_type,
+                configuration.zipf_exponent,
+            )
+        ]
+        result = benchmark_dataset(configuration, packed, targets)
+        result.details["generate_time"] = generate_time
+        result.details["packed_bytes_per_key"] = packed.nbytes / max(1, size)
+        return result
+
+    dataset = generate_dataset(
+        size,
+        configuration.data_type,
+        sorted_data=configuration.needs_sorted,
+        seed=configuration.seed,
+        cache=cache,
+    )
+    generate_time = time.perf_counter() - generate_start
+    targets = select_targets(
+        dataset,
+        configuration.target_position,
+        configuration.searches,
+        configuration.data_type,
+        configuration.zipf_exponent,
+    )
+    result = benchmark_dataset(configuration, dataset, targets)
+    result.details["generate_time"] = generate_time
+    return result
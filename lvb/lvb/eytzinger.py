@@ -0,0 +1,124 @@
+"""Array-backed binary search tree stored in Eytzinger (BFS) order."""
+
+from array import array
+from typing import Any, List, MutableSequence, Sequence
+
+from lvb.packed import PackedStrings, layout_nbytes
+
+
+def _allocate_layout(sorted_data: Sequence[Any]) -> MutableSequence[Any]:
+    """Allocate a flat container with one unused slot at index zero.
+
+    Integers and floats are stored unboxed in an `array.array`, packed
+    strings stay packed, while all other types fall back to a plain list
+    of references.
+
+    Args:
+        sorted_data: Sorted values that will be placed in the layout
+
+    Returns:
+        MutableSequence: Container with room for every value plus one slot
+    """
+    slots = len(sorted_data) + 1
+    if isinstance(sorted_data, PackedStrings):
+        return PackedStrings.empty(slots, sorted_data.width)
+    first = sorted_data[0] if sorted_data else None
+    # bool is a subclass of int but has no meaningful machine layout here
+    if isinstance(first, int) and not isinstance(first, bool):
+        try:
+            # the extremes of sorted data decide whether all values fit
+            array("q", (sorted_data[0], sorted_data[-1]))
+        except OverflowError:
+            return [None] * slots
+        return array("q", [0]) * slots
+    if isinstance(first, float):
+        return array("d", [0.0]) * slots
+    return [None] * slots
+
+
+class EytzingerTree:
+    """Balanced binary search tree stored implicitly in a flat array.
+
+    The node at index k has its children at indices 2k and 2k + 1, so
+    searching the tree is an index-arithmetic loop with no node objects
+    and no pointers to follow.
+    """
+
+    __slots__ = ("layout", "size")
+
+    def __init__(self):
+        self.layout: MutableSequence[Any] = []
+        self.size = 0
+
+    @classmethod
+    def from_sorted(cls, sorted_data: Sequence[Any]) -> "EytzingerTree":
+        """Build the tree in O(n) from data that is already sorted.
+
+        Args:
+            sorted_data: Values in ascending order
+
+        Returns:
+            EytzingerTree: Tree holding every value of the input
+        """
+        tree = cls()
+        size = len(sorted_data)
+        layout = _allocate_layout(sorted_data)
+        # an in-order walk of the implicit tree visits the slots in sorted
+        # order, so the sorted values can be written out one after another
+        position = 0
+        index = 1
+        stack: List[int] = []
+        while stack or index <= size:
+            while index <= size:
+                stack.append(index)
+                index *= 2
+            index = stack.pop()
+            layout[index] = sorted_data[position]
+            position += 1
+            index = 2 * index + 1
+        tree.layout = layout
+        tree.size = size
+        return tree
+
+    def __len__(self) -> int:
+        """Return the number of values stored in the tree."""
+        return self.size
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the flat layout, excluding boxed values."""
+        return layout_nbytes(self.layout)
+
+    def search(self, target: Any) -> bool:
+        """Search for a value in the tree and return if found."""
+        layout = self.layout
+        if isinstance(layout, PackedStrings):
+            return self._search_packed(target)
+        size = self.size
+        index = 1
+        while index <= size:
+            value = layout[index]
+            if value == target:
+                return True
+            # descend right when the node is smaller than the target
+            index = 2 * index + (value < target)
+        return False
+
+    def _search_packed(self, target: bytes) -> bool:
+        """Search a packed layout, slicing every node out of the buffer.
+
+        Python cannot order two byte ranges without an object for each, so
+        every level still reads its key into one short bytes object, but
+        straight from the buffer rather than through `__getitem__`.
+        """
+        buffer = self.layout.buffer
+        width = self.layout.width
+        size = self.size
+        index = 1
+        while index <= size:
+            start = index * width
+            value = buffer[start : start + width]
+            if value == target:
+                return True
+            index = 2 * index + (value < target)
+        return False
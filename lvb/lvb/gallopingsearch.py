@@ -0,0 +1,42 @@
+"""Galloping merge search that answers a batch of targets in one sweep."""
+
+from bisect import bisect_left
+from typing import Any, List, Optional, Sequence
+
+
+def galloping_search_many(
+    dataset: Sequence[Any], targets: Sequence[Any]
+) -> List[Optional[int]]:
+    """Find every target by sweeping the dataset once in sorted order.
+
+    The targets are visited in ascending order, and each one is located
+    with an exponential probe that starts at the position of the previous
+    one, so a batch of k targets costs about O(k log(n/k)) comparisons.
+
+    Note: Dataset must be sorted for galloping search to work correctly.
+
+    Args:
+        dataset: Sorted list to search through
+        targets: Elements to search for, in any order
+
+    Returns:
+        List: Index of each target in the order given, or None if not found
+    """
+    size = len(dataset)
+    results: List[Optional[int]] = [None] * len(targets)
+    low = 0
+    for order in sorted(range(len(targets)), key=targets.__getitem__):
+        target = targets[order]
+        if low < size and dataset[low] < target:
+            # double the stride until the probe reaches the target
+            previous = low
+            stride = 1
+            probe = low + 1
+            while probe < size and dataset[probe] < target:
+                previous = probe
+                stride *= 2
+                probe = low + stride
+            low = bisect_left(dataset, target, previous + 1, min(probe, size))
+        if low < size and dataset[low] == target:
+            results[order] = low
+    return results
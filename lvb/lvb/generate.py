@@ -1,37 +1,197 @@
 """Generate test data for search benchmarking."""
 
+import math
 import random
 import string
-from typing import Any, List
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type
 
-from lvb.approach import DataType, TargetPosition
+import numpy as np
+
+from lvb.approach import DataStructure, DataType, InsertOrder, TargetPosition
+from lvb.avl import AVLTree
+from lvb.bplustree import BPlusTree
 from lvb.bst import BinarySearchTree
+from lvb.cache import DatasetCache
 from lvb.constants import constants
+from lvb.eytzinger import EytzingerTree
+from lvb.hashindex import HashIndex
+from lvb.learnedindex import LearnedIndex
+from lvb.redblack import RedBlackTree
+from lvb.referencetree import BintreesTree
+from lvb.splay import SplayTree
+from lvb.treap import Treap
+
+# target positions that favour some elements over others, as traffic does
+SKEWED_POSITIONS = [
+    TargetPosition.ZIPF,
+    TargetPosition.HOT_SET,
+    TargetPosition.TEMPORAL,
+]
+
+# map each unbalanced data structure to its class of binary search tree
+BINARY_SEARCH_TREES: Dict[DataStructure, Type[BinarySearchTree]] = {
+    DataStructure.BINARY_SEARCH_TREE: BinarySearchTree,
+    DataStructure.SPLAY_TREE: SplayTree,
+}
+
+# map each self-balancing data structure to the constructor of its tree
+SELF_BALANCING_TREES: Dict[DataStructure, Callable[[], Any]] = {
+    DataStructure.AVL_TREE: AVLTree,
+    DataStructure.RED_BLACK_TREE: RedBlackTree,
+    DataStructure.TREAP: Treap,
+    DataStructure.BINTREES_AVL_TREE: BintreesTree.avl,
+    DataStructure.BINTREES_RB_TREE: BintreesTree.red_black,
+}
+
+
+def create_generator(
+    seed: Optional[int] = None, size: int = 0
+) -> np.random.Generator:
+    """Create the NumPy generator that draws the values of a dataset.
 
+    Args:
+        seed: Seed for reproducible values, or None for fresh entropy
+        size: Size of the dataset, so every size gets its own stream
 
-def generate_random_integer() -> int:
-    """Generate a random integer within the specified range."""
-    return random.randint(constants.RANDOM_INT_MIN, constants.RANDOM_INT_MAX)
+    Returns:
+        np.random.Generator: Generator for the values of the dataset
+    """
+    if seed is None:
+        return np.random.default_rng()
+    return np.random.default_rng([seed, size])
 
 
-def generate_random_float() -> float:
-    """Generate a random float within the specified range."""
-    return random.uniform(
-        constants.RANDOM_FLOAT_MIN, constants.RANDOM_FLOAT_MAX
-    )
+def value_dtype(data_type: DataType) -> np.dtype:
+    """Return the fixed-width NumPy type that holds values of a data type."""
+    if data_type == DataType.INTEGERS:
+        return np.dtype(np.int64)
+    if data_type == DataType.FLOATS:
+        return np.dtype(np.float64)
+    if data_type == DataType.STRINGS:
+        return np.dtype(f"S{constants.STRING_LENGTH}")
+    raise ValueError(f"Unknown data type: {data_type}")
 
 
-def generate_random_string() -> str:
-    """Generate a random string of specified length."""
-    return "".join(
-        random.choices(
-            string.ascii_letters + string.digits, k=constants.STRING_LENGTH
+def generate_values(
+    size: int, data_type: DataType, generator: np.random.Generator
+) -> np.ndarray:
+    """Draw every value of a dataset in a few vectorized calls.
+
+    Args:
+        size: Number of values to draw
+        data_type: Type of data to generate
+        generator: Generator to draw the values from
+
+    Returns:
+        np.ndarray: Integers, floats, or fixed-width ASCII byte strings
+    """
+    if data_type == DataType.INTEGERS:
+        return generator.integers(
+            constants.RANDOM_INT_MIN,
+            constants.RANDOM_INT_MAX,
+            size,
+            endpoint=True,
         )
-    )
+    if data_type == DataType.FLOATS:
+        return generator.uniform(
+            constants.RANDOM_FLOAT_MIN, constants.RANDOM_FLOAT_MAX, size
+        )
+    if data_type == DataType.STRINGS:
+        # draw one buffer of characters and cut it into fixed-width strings
+        alphabet = np.frombuffer(
+            (string.ascii_letters + string.digits).encode("ascii"),
+            dtype=np.uint8,
+        )
+        characters = alphabet[
+            generator.integers(
+                0, len(alphabet), size * constants.STRING_LENGTH
+            )
+        ]
+        return characters.view(f"S{constants.STRING_LENGTH}")
+    raise ValueError(f"Unknown data type: {data_type}")
+
+
+def fill_values(
+    values: np.ndarray, data_type: DataType, generator: np.random.Generator
+) -> None:
+    """Fill an array, possibly memory-mapped, with random values in blocks.
+
+    Drawing a block at a time bounds the temporary memory, and gives the
+    same values whether the array lives on the heap or in a mapped file.
+
+    Args:
+        values: Array to fill
+        data_type: Type of data to generate
+        generator: Generator to draw the values from
+    """
+    block = constants.GENERATION_BLOCK
+    for start in range(0, len(values), block):
+        stop = min(start + block, len(values))
+        values[start:stop] = generate_values(
+            stop - start, data_type, generator
+        )
+
+
+def generate_array(
+    size: int,
+    data_type: DataType,
+    sorted_data: bool = False,
+    seed: Optional[int] = None,
+    cache: Optional[DatasetCache] = None,
+) -> np.ndarray:
+    """Generate the values of a dataset as a NumPy array.
+
+    Args:
+        size: Size of the dataset to generate
+        data_type: Type of data to generate
+        sorted_data: Whether to sort the dataset
+        seed: Seed for reproducible values, or None for fresh entropy
+        cache: Cache to load the dataset from and store it in
+
+    Returns:
+        np.ndarray: Generated values, memory-mapped if loaded from the cache
+    """
+    # only a seeded dataset can be generated again, so only it is cached
+    if cache is not None and seed is not None:
+        values = cache.load(size, data_type, sorted_data, seed)
+        if values is not None:
+            return values
+
+    values = np.empty(size, dtype=value_dtype(data_type))
+    fill_values(values, data_type, create_generator(seed, size))
+
+    # sort the values once, before they become Python objects
+    if sorted_data:
+        values.sort()
+
+    if cache is not None and seed is not None:
+        cache.store(values, data_type, sorted_data, seed)
+    return values
+
+
+def to_list(values: np.ndarray, data_type: DataType) -> List[Any]:
+    """Convert generated values into a list of Python objects.
+
+    Args:
+        values: Values of the dataset
+        data_type: Type of data in the dataset
+
+    Returns:
+        List: Integers, floats, or strings
+    """
+    if data_type == DataType.STRINGS:
+        # ASCII bytes sort in the same order as the decoded strings
+        return values.astype(f"U{constants.STRING_LENGTH}").tolist()
+    return values.tolist()
 
 
 def generate_dataset(
-    size: int, data_type: DataType, sorted_data: bool = False
+    size: int,
+    data_type: DataType,
+    sorted_data: bool = False,
+    seed: Optional[int] = None,
+    cache: Optional[DatasetCache] = None,
 ) -> List[Any]:
     """Generate a dataset of the specified size and type.
 
@@ -39,59 +199,258 @@ def generate_dataset(
         size: Size of the dataset to generate
         data_type: Type of data to generate
         sorted_data: Whether to sort the dataset
+        seed: Seed for reproducible values, or None for fresh entropy
+        cache: Cache to load the dataset from and store it in
 
     Returns:
         List: Generated dataset
     """
-    # Generate values based on the data type
-    if data_type == DataType.INTEGERS:
-        dataset = [generate_random_integer() for _ in range(size)]
-    elif data_type == DataType.FLOATS:
-        dataset = [generate_random_float() for _ in range(size)]
-    elif data_type == DataType.STRINGS:
-        dataset = [generate_random_string() for _ in range(size)]
-    else:
-        raise ValueError(f"Unknown data type: {data_type}")
-
-    # sort the dataset if required
+    values = generate_array(size, data_type, sorted_data, seed, cache)
+    return to_list(values, data_type)
+
+
+def generate_growth(
+    size: int,
+    new_size: int,
+    data_type: DataType,
+    sorted_data: bool = False,
+    seed: Optional[int] = None,
+) -> List[Any]:
+    """Generate the values that grow a dataset from one size to another.
+
+    The values come from a stream of their own for every step of growth,
+    so a seeded dataset grows the same way every time, but the grown
+    dataset differs from one generated at the new size in a single step.
+
+    Args:
+        size: Size of the dataset before it grows
+        new_size: Size of the dataset after it grows
+        data_type: Type of data to generate
+        sorted_data: Whether to sort the new values
+        seed: Seed for reproducible values, or None for fresh entropy
+
+    Returns:
+        List: The new_size - size values to add to the dataset
+    """
+    generator = (
+        np.random.default_rng()
+        if seed is None
+        else np.random.default_rng([seed, size, new_size])
+    )
+    values = np.empty(new_size - size, dtype=value_dtype(data_type))
+    fill_values(values, data_type, generator)
     if sorted_data:
-        dataset.sort()
+        values.sort()
+    return to_list(values, data_type)
+
+
+def _sorted(dataset: List[Any], sorted_data: bool) -> List[Any]:
+    """Return the dataset in sorted order, sorting only if needed."""
+    return dataset if sorted_data else sorted(dataset)
+
 
-    return dataset
+def order_for_insertion(
+    dataset: List[Any], insert_order: InsertOrder, sorted_data: bool = False
+) -> List[Any]:
+    """Arrange the dataset in the order that values are inserted into a tree.
 
+    Args:
+        dataset: Dataset to arrange
+        insert_order: Order in which the values should arrive
+        sorted_data: Whether the dataset is already sorted
 
-def generate_binary_search_tree(dataset: List[Any]) -> BinarySearchTree:
-    """Generate a balanced binary search tree from the dataset.
+    Returns:
+        List: Values of the dataset in insertion order
+    """
+    if insert_order == InsertOrder.RANDOM:
+        shuffled = list(dataset)
+        random.shuffle(shuffled)
+        return shuffled
+    if insert_order == InsertOrder.SORTED:
+        return _sorted(dataset, sorted_data)
+    if insert_order == InsertOrder.REVERSED:
+        return _sorted(dataset, sorted_data)[::-1]
+    if insert_order != InsertOrder.BALANCED:
+        raise ValueError(f"Unknown insert order: {insert_order}")
+
+    # Emit the medians level by level, so that every tree fills up evenly
+    sorted_dataset = _sorted(dataset, sorted_data)
+    ordered = []
+    ranges: Deque[Tuple[int, int]] = deque([(0, len(sorted_dataset) - 1)])
+    while ranges:
+        start, end = ranges.popleft()
+        if start > end:
+            continue
+        mid = (start + end) // 2
+        ordered.append(sorted_dataset[mid])
+        ranges.append((start, mid - 1))
+        ranges.append((mid + 1, end))
+    return ordered
+
+
+def generate_binary_search_tree(
+    dataset: List[Any],
+    insert_order: InsertOrder = InsertOrder.BALANCED,
+    sorted_data: bool = False,
+    tree_class: Type[BinarySearchTree] = BinarySearchTree,
+) -> BinarySearchTree:
+    """Generate a binary search tree from the dataset.
 
     Args:
         dataset: Dataset to build the tree from
+        insert_order: Order in which values are inserted into the tree
+        sorted_data: Whether the dataset is already sorted
+        tree_class: Binary search tree, or a subclass such as the splay
+            tree, to build
 
     Returns:
         BinarySearchTree: Generated binary search tree
     """
-    # Sort the dataset first to ensure proper tree balancing
-    sorted_dataset = sorted(dataset)
+    if insert_order == InsertOrder.BALANCED:
+        # Sort the dataset first to ensure proper tree balancing
+        sorted_dataset = _sorted(dataset, sorted_data)
 
-    # Create and populate the binary search tree using a balanced approach
-    bst = BinarySearchTree()
+        # Link the medians directly instead of inserting them one at a time
+        return tree_class.from_sorted(sorted_dataset)
 
-    # Helper function to insert middle elements first for balancing
-    def build_balanced_bst(arr, start, end):
-        if start > end:
-            return
+    # Insert one value at a time, so the shape follows the insert order
+    bst = tree_class()
+    for value in order_for_insertion(dataset, insert_order, sorted_data):
+        bst.insert(value)
+    return bst
 
-        # Get the middle element and insert it
-        mid = (start + end) // 2
-        bst.insert(arr[mid])
 
-        # Recursively insert left and right subarrays
-        build_balanced_bst(arr, start, mid - 1)
-        build_balanced_bst(arr, mid + 1, end)
+def generate_self_balancing_tree(
+    dataset: List[Any],
+    data_structure: DataStructure,
+    insert_order: InsertOrder = InsertOrder.RANDOM,
+    sorted_data: bool = False,
+) -> Any:
+    """Generate a self-balancing tree by inserting every value of the dataset.
 
-    # Build the balanced BST
-    build_balanced_bst(sorted_dataset, 0, len(sorted_dataset) - 1)
+    Args:
+        dataset: Dataset to build the tree from
+        data_structure: Self-balancing tree to generate
+        insert_order: Order in which values are inserted into the tree
+        sorted_data: Whether the dataset is already sorted
+
+    Returns:
+        Any: Generated tree that supports insert and search
+    """
+    if data_structure not in SELF_BALANCING_TREES:
+        raise ValueError(f"Not a self-balancing tree: {data_structure}")
+    tree = SELF_BALANCING_TREES[data_structure]()
+    for value in order_for_insertion(dataset, insert_order, sorted_data):
+        tree.insert(value)
+    return tree
 
-    return bst
+
+def generate_eytzinger_tree(
+    dataset: List[Any], sorted_data: bool = False
+) -> EytzingerTree:
+    """Generate an array-backed balanced tree from the dataset.
+
+    Args:
+        dataset: Dataset to build the tree from
+        sorted_data: Whether the dataset is already sorted
+
+    Returns:
+        EytzingerTree: Generated tree in Eytzinger layout
+    """
+    # the layout is filled in O(n) from a single sorted pass over the data
+    return EytzingerTree.from_sorted(_sorted(dataset, sorted_data))
+
+
+def generate_hash_index(dataset: List[Any]) -> HashIndex:
+    """Generate a hash index from the dataset.
+
+    Args:
+        dataset: Dataset to index
+
+    Returns:
+        HashIndex: Index from each value to its first position
+    """
+    return HashIndex.from_dataset(dataset)
+
+
+def generate_learned_index(dataset: List[Any]) -> LearnedIndex:
+    """Generate a learned index over the sorted dataset.
+
+    Args:
+        dataset: Sorted numeric dataset to model
+
+    Returns:
+        LearnedIndex: Piecewise-linear model of the positions of the values
+    """
+    return LearnedIndex(dataset, constants.LEARNED_INDEX_MAX_ERROR)
+
+
+def generate_b_plus_tree(
+    dataset: List[Any],
+    fanout: int = constants.DEFAULT_FANOUT,
+    insert_order: InsertOrder = InsertOrder.BALANCED,
+    sorted_data: bool = False,
+) -> BPlusTree:
+    """Generate a B+-tree from the dataset.
+
+    Args:
+        dataset: Dataset to build the tree from
+        fanout: Largest number of keys or children in a node
+        insert_order: Order in which values are inserted into the tree
+        sorted_data: Whether the dataset is already sorted
+
+    Returns:
+        BPlusTree: Generated B+-tree
+    """
+    if insert_order == InsertOrder.BALANCED:
+        # Bulk load the leaves from a single sorted pass over the data
+        return BPlusTree.from_sorted(_sorted(dataset, sorted_data), fanout)
+
+    # Insert one value at a time, splitting nodes as they fill up
+    tree = BPlusTree(fanout)
+    for value in order_for_insertion(dataset, insert_order, sorted_data):
+        tree.insert(value)
+    return tree
+
+
+def generate_structure(
+    dataset: List[Any],
+    data_structure: DataStructure,
+    insert_order: InsertOrder = InsertOrder.BALANCED,
+    fanout: int = constants.DEFAULT_FANOUT,
+    sorted_data: bool = False,
+) -> Optional[Any]:
+    """Generate the structure to search, unless it is the dataset itself.
+
+    Args:
+        dataset: Dataset to build the structure from
+        data_structure: Data structure to generate
+        insert_order: Order in which values are inserted into a tree
+        fanout: Largest number of entries in a B+-tree node
+        sorted_data: Whether the dataset is already sorted, so that the
+            trees built from sorted values can skip sorting it again
+
+    Returns:
+        Optional[Any]: Generated structure, or None for the list structures
+    """
+    if data_structure == DataStructure.HASH_INDEX:
+        return generate_hash_index(dataset)
+    if data_structure == DataStructure.B_PLUS_TREE:
+        return generate_b_plus_tree(dataset, fanout, insert_order, sorted_data)
+    if data_structure in BINARY_SEARCH_TREES:
+        return generate_binary_search_tree(
+            dataset,
+            insert_order,
+            sorted_data,
+            tree_class=BINARY_SEARCH_TREES[data_structure],
+        )
+    if data_structure == DataStructure.EYTZINGER_TREE:
+        return generate_eytzinger_tree(dataset, sorted_data)
+    if data_structure in SELF_BALANCING_TREES:
+        return generate_self_balancing_tree(
+            dataset, data_structure, insert_order, sorted_data
+        )
+    return None
 
 
 def select_targets(
@@ -99,6 +458,7 @@ def select_targets(
     position: TargetPosition,
     num_targets: int,
     data_type: DataType,
+    zipf_exponent: float = constants.DEFAULT_ZIPF_EXPONENT,
 ) -> List[Any]:
     """Select target elements from the dataset based on position."""
     size = len(dataset)
@@ -108,9 +468,49 @@ def select_targets(
     if position == TargetPosition.NONEXISTENT:
         return _generate_nonexistent_targets(dataset, num_targets, data_type)
 
+    if position in SKEWED_POSITIONS:
+        return _select_skewed_targets(
+            dataset, position, num_targets, zipf_exponent
+        )
+
     return _select_existing_targets(dataset, position, num_targets)
 
 
+def select_array_targets(
+    values: np.ndarray,
+    position: TargetPosition,
+    num_targets: int,
+    data_type: DataType,
+    zipf_exponent: float = constants.DEFAULT_ZIPF_EXPONENT,
+) -> List[Any]:
+    """Select targets from an array without converting all of its values.
+
+    The positions are drawn exactly as `select_targets` draws values from
+    a list, so a seeded run picks the same targets from either.
+
+    Args:
+        values: Values of the dataset, possibly memory-mapped or shared
+        position: Position of the targets in the dataset
+        num_targets: Number of targets to select
+        data_type: Type of data in the dataset
+        zipf_exponent: Skew of the Zipf targets
+
+    Returns:
+        List: Targets as Python objects
+    """
+    if len(values) == 0:
+        return []
+    if position == TargetPosition.NONEXISTENT:
+        # missing targets are derived from the largest value alone
+        largest = to_list(values[[int(np.argmax(values))]], data_type)
+        return select_targets(largest, position, num_targets, data_type)
+    # pick positions first, so only the chosen values are converted
+    positions = select_targets(
+        range(len(values)), position, num_targets, data_type, zipf_exponent
+    )
+    return to_list(values[np.asarray(positions, dtype=np.intp)], data_type)
+
+
 def _select_existing_targets(
     dataset: List[Any], position: TargetPosition, num_targets: int
 ) -> List[Any]:
@@ -136,6 +536,114 @@ def _select_existing_targets(
     return []
 
 
+def _zipf_ranks(size: int, num_ranks: int, exponent: float) -> List[int]:
+    """Draw ranks from 1 to size with a Zipf law, in O(1) time per rank.
+
+    Rejection-inversion sampling (Hörmann and Derflinger, 1996) inverts
+    the integral of x ** -exponent, a continuous hat over the discrete
+    weights, and rejects the few draws that fall outside of them. Unlike
+    a table of cumulative weights it takes neither time nor memory in
+    proportion to the size, which a memory-mapped dataset relies on.
+
+    Args:
+        size: Number of ranks
+        num_ranks: Number of ranks to draw
+        exponent: Skew of the ranks, 0 being uniform
+
+    Returns:
+        List[int]: Drawn ranks, rank 1 being the most frequent
+    """
+
+    def weight(x: float) -> float:
+        return math.exp(-exponent * math.log(x))
+
+    def integral(x: float) -> float:
+        log_x = math.log(x)
+        return _expm1_over((1 - exponent) * log_x) * log_x
+
+    def inverse(y: float) -> float:
+        t = max(-1.0, y * (1 - exponent))
+        return math.exp(_log1p_over(t) * y)
+
+    low = integral(1.5) - 1
+    high = integral(size + 0.5)
+    # a draw this close to its rank is always inside of the weights
+    squeeze = 2 - inverse(integral(2.5) - weight(2))
+    ranks = []
+    while len(ranks) < num_ranks:
+        u = high + random.random() * (low - high)
+        x = inverse(u)
+        rank = min(size, max(1, int(x + 0.5)))
+        if rank - x <= squeeze or u >= integral(rank + 0.5) - weight(rank):
+            ranks.append(rank)
+    return ranks
+
+
+def _log1p_over(x: float) -> float:
+    """Return log(1 + x) / x, which tends to 1 as x tends to 0."""
+    if abs(x) > constants.ZIPF_SERIES_CUTOFF:
+        return math.log1p(x) / x
+    return 1 - x * (0.5 - x * (1 / 3 - 0.25 * x))
+
+
+def _expm1_over(x: float) -> float:
+    """Return (exp(x) - 1) / x, which tends to 1 as x tends to 0."""
+    if abs(x) > constants.ZIPF_SERIES_CUTOFF:
+        return math.expm1(x) / x
+    return 1 + x * 0.5 * (1 + x / 3 * (1 + 0.25 * x))
+
+
+def _select_skewed_targets(
+    dataset: List[Any],
+    position: TargetPosition,
+    num_targets: int,
+    zipf_exponent: float,
+) -> List[Any]:
+    """Helper function to select targets that repeat like real traffic.
+
+    The popular elements are spread over the whole dataset rather than
+    bunched at one end, so that skew is not mistaken for position.
+    """
+    size = len(dataset)
+    if position == TargetPosition.ZIPF:
+        # the element of rank r is searched in proportion to r ** -s, and
+        # the ranks are scattered by an affine permutation of the positions
+        # with a stride of about size / golden ratio, from a random offset
+        stride = max(1, int(size * (math.sqrt(5) - 1) / 2))
+        while math.gcd(stride, size) != 1:
+            stride += 1
+        offset = random.randrange(size)
+        return [
+            dataset[(offset + stride * (rank - 1)) % size]
+            for rank in _zipf_ranks(size, num_targets, zipf_exponent)
+        ]
+
+    if position == TargetPosition.HOT_SET:
+        hot = random.sample(
+            dataset, max(1, int(size * constants.HOT_SET_FRACTION))
+        )
+        return [
+            random.choice(hot)
+            if random.random() < constants.HOT_SET_PROBABILITY
+            else random.choice(dataset)
+            for _ in range(num_targets)
+        ]
+
+    if position == TargetPosition.TEMPORAL:
+        recent: Deque[Any] = deque(maxlen=constants.TEMPORAL_WINDOW)
+        targets = []
+        for _ in range(num_targets):
+            if recent and random.random() < constants.TEMPORAL_PROBABILITY:
+                target = random.choice(recent)
+            else:
+                target = random.choice(dataset)
+            recent.append(target)
+            targets.append(target)
+        return targets
+
+    return []
+
+
 def _generate_nonexistent_targets(
     dataset: List[Any], num_targets: int, data_type: DataType
 ) -> List[Any]:
@@ -0,0 +1,60 @@
+"""Hash index that maps every value to its first position in the dataset."""
+
+import sys
+from typing import Any, Dict, List, Optional
+
+
+class HashIndex:
+    """Answer lookups in O(1) with a dictionary from value to position."""
+
+    __slots__ = ("index", "size")
+
+    def __init__(self):
+        self.index: Dict[Any, int] = {}
+        # positions handed out so far, one per value indexed or inserted
+        self.size = 0
+
+    @classmethod
+    def from_dataset(cls, dataset: List[Any]) -> "HashIndex":
+        """Build the index in a single pass over the dataset.
+
+        Args:
+            dataset: Dataset to index, in any order
+
+        Returns:
+            HashIndex: Index holding the first position of every value
+        """
+        hash_index = cls()
+        # walking backwards lets the first occurrence overwrite later ones
+        hash_index.index = dict(
+            zip(reversed(dataset), range(len(dataset) - 1, -1, -1))
+        )
+        hash_index.size = len(dataset)
+        return hash_index
+
+    def __len__(self) -> int:
+        """Return the number of distinct values in the index."""
+        return len(self.index)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the hash table, excluding the shared keys."""
+        return sys.getsizeof(self.index)
+
+    def insert(self, value: Any) -> None:
+        """Append a value after the last position, keeping an earlier one."""
+        self.index.setdefault(value, self.size)
+        self.size += 1
+
+    def delete(self, value: Any) -> bool:
+        """Remove a value and return if it was indexed.
+
+        The index holds one entry for every distinct value, so deleting a
+        duplicate removes all of its copies, and the positions of the other
+        values stay where they are.
+        """
+        return self.index.pop(value, None) is not None
+
+    def search(self, target: Any) -> Optional[int]:
+        """Return the first position of the target, or None if not found."""
+        return self.index.get(target)
@@ -0,0 +1,178 @@
+"""Grow one dataset across doubling runs instead of generating each anew."""
+
+import gc
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Sequence
+
+from lvb import approach
+from lvb.approach import DataStructure, InsertOrder
+from lvb.experiment import (
+    Configuration,
+    RunResult,
+    benchmark_dataset,
+    build_structure,
+)
+from lvb.generate import (
+    BINARY_SEARCH_TREES,
+    SELF_BALANCING_TREES,
+    generate_dataset,
+    generate_growth,
+    order_for_insertion,
+    select_targets,
+)
+
+# trees that take new values one insert at a time
+INSERTABLE_TREES = [
+    *BINARY_SEARCH_TREES,
+    *SELF_BALANCING_TREES,
+    DataStructure.B_PLUS_TREE,
+]
+
+
+@contextmanager
+def collection_paused() -> Iterator[None]:
+    """Pause the cyclic garbage collector for the duration of a block.
+
+    Every object that setup allocates stays reachable, so the collections
+    that the allocations trigger only walk a heap that keeps growing, and
+    take about half of the time to build a tree of millions of nodes.
+    """
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def validate_incremental(
+    configuration: Configuration, jobs: int = 1
+) -> Optional[str]:
+    """Return the reason runs cannot grow one dataset, or None."""
+    if configuration.storage != approach.Storage.MEMORY:
+        return "Incremental growth keeps the dataset in memory"
+    if jobs > 1:
+        # every run starts from the dataset of the run before it
+        return "Incremental growth runs in a single process"
+    return None
+
+
+def grow_structure(
+    configuration: Configuration,
+    structure: Optional[Any],
+    dataset: List[Any],
+    new_values: List[Any],
+) -> Optional[Any]:
+    """Bring the structure of the previous run up to the grown dataset.
+
+    A tree built in random insert order takes the new values by inserting
+    them in random order too. The values are drawn independently, so the
+    old ones followed by the new ones are as random an order as any, and
+    the tree has the shape that a fresh build would have, and reports
+    the rotations of only these inserts. Every other
+    structure is rebuilt from the grown dataset, which for the balanced
+    trees and the Eytzinger layout is a single O(n) pass over the merged
+    sorted values.
+
+    Args:
+        configuration: Benchmark that the structure is built for
+        structure: Structure over the dataset before it grew, if any
+        dataset: Dataset after it grew, sorted if the configuration
+            needs it
+        new_values: Values that the dataset grew by
+
+    Returns:
+        Optional[Any]: Structure over the grown dataset, or None for the
+        list searches
+    """
+    if (
+        structure is not None
+        and configuration.insert_order == InsertOrder.RANDOM
+        and configuration.data_structure in INSERTABLE_TREES
+    ):
+        # count the rotations of these inserts alone, as the build time does
+        if hasattr(structure, "rotations"):
+            structure.rotations = 0
+        for value in order_for_insertion(new_values, InsertOrder.RANDOM):
+            structure.insert(value)
+        return structure
+    return build_structure(configuration, dataset)
+
+
+def run_incremental(
+    configuration: Configuration, sizes: Sequence[int]
+) -> Iterator[RunResult]:
+    """Benchmark growing sizes of one dataset that keeps its values.
+
+    The first run generates its dataset as `run_benchmark` would, and
+    every later run generates only the values that it adds. A sorted
+    dataset is extended by a sorted delta and sorted again, which Timsort
+    does as a single O(n) merge of the two runs that it finds. The merge
+    and the build run with the garbage collector paused.
+
+    Args:
+        configuration: Benchmark to run
+        sizes: Dataset size of every run, in increasing order
+
+    Yields:
+        RunResult: Timings and build statistics of every run, with the
+        time to generate and merge the new values
+    """
+    dataset: List[Any] = []
+    structure: Optional[Any] = None
+    for size in sizes:
+        if size <= len(dataset):
+            raise ValueError("Incremental runs must grow the dataset")
+        if configuration.seed is not None:
+            # targets, shuffles and treap priorities use Python's generator
+            random.seed(f"{configuration.seed}:{size}")
+        generate_start = time.perf_counter()
+        if dataset:
+            new_values = generate_growth(
+                len(dataset),
+                size,
+                configuration.data_type,
+                sorted_data=configuration.needs_sorted,
+                seed=configuration.seed,
+            )
+        else:
+            new_values = generate_dataset(
+                size,
+                configuration.data_type,
+                sorted_data=configuration.needs_sorted,
+                seed=configuration.seed,
+                cache=configuration.dataset_cache(),
+            )
+        generate_time = time.perf_counter() - generate_start
+
+        merge_start = time.perf_counter()
+        with collection_paused():
+            dataset.extend(new_values)
+            if configuration.needs_sorted:
+                dataset.sort()
+        merge_time = time.perf_counter() - merge_start
+
+        targets = select_targets(
+            dataset,
+            configuration.target_position,
+            configuration.searches,
+            configuration.data_type,
+            configuration.zipf_exponent,
+        )
+
+        def grow() -> Optional[Any]:
+            # the next run grows whatever structure this one searches
+            nonlocal structure
+            with collection_paused():
+                structure = grow_structure(
+                    configuration, structure, dataset, new_values
+                )
+            return structure
+
+        result = benchmark_dataset(configuration, dataset, targets, grow)
+        result.details["generate_time"] = generate_time
+        result.details["merge_time"] = merge_time
+        yield result
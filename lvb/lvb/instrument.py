@@ -0,0 +1,268 @@
+"""Count the comparisons and probes of searches, and profile whole runs.
+
+The search functions themselves stay untouched, so timed runs pay nothing
+for this module. Instead, an instrumented lookup searches for a target
+wrapped in a `CountingKey`, in a dataset wrapped in a `ProbeRecorder`,
+and the wrappers note every comparison and every position read.
+"""
+
+import copy
+import cProfile
+import pstats
+import statistics
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import pairwise
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+
+@dataclass
+class SearchLog:
+    """Class to store the work of one lookup."""
+
+    comparisons: int = 0
+    # Positions read, for a search over a list or an array layout
+    indices: List[int] = field(default_factory=list)
+    # Keys compared with the target, for a search over linked nodes
+    keys: List[Any] = field(default_factory=list)
+
+    def compared(self, value: Any) -> None:
+        """Note one comparison of the target with a stored value."""
+        self.comparisons += 1
+        # several comparisons with one stored value are one probe
+        if not self.keys or self.keys[-1] != value:
+            self.keys.append(value)
+
+    def read(self, index: int) -> None:
+        """Note one read of a position."""
+        if not self.indices or self.indices[-1] != index:
+            self.indices.append(index)
+
+    @property
+    def probes(self) -> int:
+        """Return the number of positions read or keys visited."""
+        return len(self.indices) if self.indices else len(self.keys)
+
+
+def _unwrap(value: Any) -> Any:
+    """Return the plain value of a key that may be wrapped."""
+    return value.value if isinstance(value, CountingKey) else value
+
+
+class CountingKey:
+    """Target that counts every comparison a search makes with it.
+
+    A stored value compared with the key defers to the key's reflected
+    operator, so even comparisons written as `stored < target` are seen.
+    Arithmetic, which interpolation and learned searches do on the
+    target, works on the plain value.
+    """
+
+    __slots__ = ("log", "value")
+
+    def __init__(self, value: Any, log: SearchLog):
+        self.value = value
+        self.log = log
+
+    def _compare(self, other: Any) -> Any:
+        """Note a comparison and return the plain value to compare with."""
+        other = _unwrap(other)
+        self.log.compared(other)
+        return other
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare for equality, counting the comparison."""
+        return self.value == self._compare(other)
+
+    def __ne__(self, other: Any) -> bool:
+        """Compare for inequality, counting the comparison."""
+        return self.value != self._compare(other)
+
+    def __lt__(self, other: Any) -> bool:
+        """Compare for less than, counting the comparison."""
+        return self.value < self._compare(other)
+
+    def __le__(self, other: Any) -> bool:
+        """Compare for less than or equal, counting the comparison."""
+        return self.value <= self._compare(other)
+
+    def __gt__(self, other: Any) -> bool:
+        """Compare for greater than, counting the comparison."""
+        return self.value > self._compare(other)
+
+    def __ge__(self, other: Any) -> bool:
+        """Compare for greater than or equal, counting the comparison."""
+        return self.value >= self._compare(other)
+
+    def __hash__(self) -> int:
+        """Hash like the plain value, so hash lookups find it."""
+        return hash(self.value)
+
+    def __add__(self, other: Any) -> Any:
+        """Add to the plain value."""
+        return self.value + _unwrap(other)
+
+    def __radd__(self, other: Any) -> Any:
+        """Add the plain value."""
+        return _unwrap(other) + self.value
+
+    def __sub__(self, other: Any) -> Any:
+        """Subtract from the plain value."""
+        return self.value - _unwrap(other)
+
+    def __rsub__(self, other: Any) -> Any:
+        """Subtract the plain value."""
+        return _unwrap(other) - self.value
+
+    def __mul__(self, other: Any) -> Any:
+        """Multiply the plain value."""
+        return self.value * _unwrap(other)
+
+    def __rmul__(self, other: Any) -> Any:
+        """Multiply by the plain value."""
+        return _unwrap(other) * self.value
+
+    def __float__(self) -> float:
+        """Convert the plain value to a float."""
+        return float(self.value)
+
+
+class ProbeRecorder:
+    """Sequence that notes every position a search reads.
+
+    Writes, which only the self-adjusting searches make, pass through to
+    the values unrecorded.
+    """
+
+    __slots__ = ("log", "values")
+
+    def __init__(self, values: Sequence[Any], log: SearchLog):
+        self.values = values
+        self.log = log
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Any:
+        """Return the value at a position, noting the read."""
+        self.log.read(index)
+        return self.values[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the values in order, noting every read."""
+        for index, value in enumerate(self.values):
+            self.log.read(index)
+            yield value
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        """Overwrite the value at a position."""
+        self.values[index] = value
+
+    def __delitem__(self, index: int) -> None:
+        """Remove the value at a position."""
+        del self.values[index]
+
+    def insert(self, index: int, value: Any) -> None:
+        """Insert a value before a position."""
+        self.values.insert(index, value)
+
+
+def _instrumented_search(
+    list_search: Optional[Callable[[Any, Any], Any]],
+    dataset: List[Any],
+    structure: Optional[Any],
+    log: SearchLog,
+) -> Callable[[Any], Any]:
+    """Build a search that reports the positions it reads to the log."""
+    if list_search is not None:
+        return partial(list_search, ProbeRecorder(dataset, log))
+    if hasattr(structure, "layout"):
+        # an array layout is read by position, like a list
+        recorded = copy.copy(structure)
+        recorded.layout = ProbeRecorder(structure.layout, log)
+        return recorded.search
+    return structure.search
+
+
+def count_searches(
+    list_search: Optional[Callable[[Any, Any], Any]],
+    dataset: List[Any],
+    structure: Optional[Any],
+    targets: Sequence[Any],
+    trace: bool = False,
+) -> Dict[str, Any]:
+    """Search for every target once and count the work of each lookup.
+
+    Args:
+        list_search: Search that runs on the list itself, or None to
+            search the structure
+        dataset: Dataset that the list search runs on
+        structure: Built structure whose search method is instrumented
+        targets: Targets to search for
+        trace: Whether to keep the positions or keys each lookup probed
+
+    Returns:
+        Dict: Mean and largest comparisons and probes per lookup, the
+        mean distance between positions read, and the probe traces if
+        asked for
+    """
+    logs = []
+    for target in targets:
+        log = SearchLog()
+        search_func = _instrumented_search(
+            list_search, dataset, structure, log
+        )
+        search_func(CountingKey(target, log))
+        logs.append(log)
+    if not logs:
+        return {}
+    comparisons = [log.comparisons for log in logs]
+    probes = [log.probes for log in logs]
+    details: Dict[str, Any] = {
+        "comparisons_per_search": statistics.fmean(comparisons),
+        "max_comparisons": max(comparisons),
+        "probes_per_search": statistics.fmean(probes),
+        "max_probes": max(probes),
+    }
+    strides = [
+        abs(after - before)
+        for log in logs
+        for before, after in pairwise(log.indices)
+    ]
+    if strides:
+        details["mean_probe_stride"] = statistics.fmean(strides)
+    if trace:
+        details["probe_traces"] = [
+            log.indices if log.indices else log.keys for log in logs
+        ]
+    return details
+
+
+def profile_call(
+    func: Callable[[], Any], path: str
+) -> Tuple[Any, pstats.Stats]:
+    """Run a function under cProfile and dump the profile to a file.
+
+    Args:
+        func: Function to profile
+        path: File to dump the profile to, readable with `pstats`
+
+    Returns:
+        Tuple[Any, pstats.Stats]: Return value of the function, and its
+        profile sorted by cumulative time
+    """
+    profiler = cProfile.Profile()
+    value = profiler.runcall(func)
+    profiler.dump_stats(path)
+    stats = pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE)
+    return value, stats
@@ -0,0 +1,41 @@
+"""Interpolation search implementation for sorted numeric data."""
+
+from typing import List, Optional, Union
+
+Number = Union[int, float]
+
+
+def interpolation_search(
+    dataset: List[Number], target: Number
+) -> Optional[int]:
+    """Perform an interpolation search on the dataset.
+
+    Each probe estimates the position of the target from the values at the
+    ends of the remaining range, which takes O(log log n) probes on average
+    when the values are spread uniformly.
+
+    Note: Dataset must be sorted and numeric for interpolation to work.
+
+    Args:
+        dataset: Sorted list of numbers to search through
+        target: Number to search for
+
+    Returns:
+        int: Index of the target element, or None if not found
+    """
+    low, high = 0, len(dataset) - 1
+    while low <= high and dataset[low] <= target <= dataset[high]:
+        low_value = dataset[low]
+        spread = dataset[high] - low_value
+        if spread == 0:
+            # every value in the range is equal to the target
+            return low
+        probe = low + int((target - low_value) * (high - low) / spread)
+        value = dataset[probe]
+        if value == target:
+            return probe
+        elif value < target:
+            low = probe + 1
+        else:
+            high = probe - 1
+    return None
@@ -0,0 +1,93 @@
+"""Learned index that predicts positions with a piecewise-linear model."""
+
+import sys
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Union
+
+Number = Union[int, float]
+
+
+class LearnedIndex:
+    """Predict where a key sits in a sorted dataset, then search locally.
+
+    The model is a sequence of linear segments fitted so that every
+    prediction is at most `max_error` positions away from the first
+    position of its key, which bounds the window that must be searched.
+    """
+
+    __slots__ = ("dataset", "intercepts", "keys", "max_error", "slopes")
+
+    def __init__(self, dataset: List[Number], max_error: int):
+        self.dataset = dataset
+        self.max_error = max_error
+        self.keys: List[Number] = []
+        self.slopes: List[float] = []
+        self.intercepts: List[int] = []
+        self._fit()
+
+    def _fit(self) -> None:
+        """Fit the segments in one pass with a shrinking cone of slopes."""
+        dataset = self.dataset
+        max_error = self.max_error
+        start_key: Number = 0
+        start_position = 0
+        low_slope, high_slope = 0.0, float("inf")
+        previous: Optional[Number] = None
+        for position, key in enumerate(dataset):
+            if key == previous:
+                # only the first position of a duplicate key is predicted
+                continue
+            previous = key
+            if self.keys:
+                run = key - start_key
+                low = (position - max_error - start_position) / run
+                high = (position + max_error - start_position) / run
+                if max(low, low_slope) <= min(high, high_slope):
+                    low_slope = max(low, low_slope)
+                    high_slope = min(high, high_slope)
+                    continue
+                self._close_segment(low_slope, high_slope)
+            # start a new segment at this key
+            self.keys.append(key)
+            self.intercepts.append(position)
+            start_key, start_position = key, position
+            low_slope, high_slope = 0.0, float("inf")
+        if self.keys:
+            self._close_segment(low_slope, high_slope)
+
+    def _close_segment(self, low_slope: float, high_slope: float) -> None:
+        """Record the slope of the segment that is being fitted."""
+        if high_slope == float("inf"):
+            self.slopes.append(low_slope)
+        else:
+            self.slopes.append((low_slope + high_slope) / 2)
+
+    def __len__(self) -> int:
+        """Return the number of linear segments in the model."""
+        return len(self.keys)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the model, excluding the shared dataset."""
+        return (
+            sys.getsizeof(self.keys)
+            + sys.getsizeof(self.slopes)
+            + sys.getsizeof(self.intercepts)
+            + sum(sys.getsizeof(slope) for slope in self.slopes)
+        )
+
+    def search(self, target: Number) -> Optional[int]:
+        """Return the first position of the target, or None if not found."""
+        segment = bisect_right(self.keys, target) - 1
+        if segment < 0:
+            return None
+        predicted = self.intercepts[segment] + int(
+            self.slopes[segment] * (target - self.keys[segment])
+        )
+        # truncating the prediction can move it one more position down
+        low = max(0, predicted - self.max_error - 1)
+        high = min(len(self.dataset), predicted + self.max_error + 1)
+        position = bisect_left(self.dataset, target, low, high)
+        if position < len(self.dataset) and self.dataset[position] == target:
+            return position
+        return None
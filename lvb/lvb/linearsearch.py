@@ -1,6 +1,8 @@
-"""Linear search implementation."""
+"""Linear search implementations (single target, self-adjusting, batched)."""
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
 
 
 def linear_search(dataset: List[Any], target: Any) -> Optional[int]:
@@ -20,3 +22,79 @@ def linear_search(dataset: List[Any], target: Any) -> Optional[int]:
 
     # Target not found
     return None
+
+
+def linear_search_many(
+    dataset: Sequence[Any], targets: Sequence[Any]
+) -> List[Optional[int]]:
+    """Find the first index of every target with vectorized operations.
+
+    Args:
+        dataset: List or array to search through, in any order
+        targets: Elements to search for
+
+    Returns:
+        List: Index of each target in the order given, or None if not found
+    """
+    values = np.asarray(dataset)
+    wanted = np.asarray(targets)
+    if values.size == 0:
+        return [None] * len(wanted)
+
+    # a stable sort keeps equal values in dataset order, so the leftmost
+    # match in sorted order is the first occurrence in the dataset
+    order = np.argsort(values, kind="stable")
+    positions = np.searchsorted(values[order], wanted)
+    clipped = np.minimum(positions, values.size - 1)
+    found = (positions < values.size) & (values[order[clipped]] == wanted)
+    return [
+        index if hit else None
+        for index, hit in zip(order[clipped].tolist(), found.tolist())
+    ]
+
+
+def move_to_front_search(dataset: List[Any], target: Any) -> Optional[int]:
+    """Perform a linear search that moves the target to the front.
+
+    Every element found is moved to the start of the list, so elements
+    that are searched often stay near the front and are found quickly.
+
+    Args:
+        dataset: List to search through and reorder
+        target: Element to search for
+
+    Returns:
+        int: Index of the target element before it moved, or None if not
+        found
+    """
+    for i, item in enumerate(dataset):
+        if item == target:
+            if i:
+                del dataset[i]
+                dataset.insert(0, item)
+            return i
+    return None
+
+
+def transpose_search(dataset: List[Any], target: Any) -> Optional[int]:
+    """Perform a linear search that swaps the target with its predecessor.
+
+    Every element found moves one place towards the front, so the list
+    adapts more slowly than with move-to-front, but a single search for a
+    rare element cannot push the popular ones back.
+
+    Args:
+        dataset: List to search through and reorder
+        target: Element to search for
+
+    Returns:
+        int: Index of the target element before it moved, or None if not
+        found
+    """
+    for i, item in enumerate(dataset):
+        if item == target:
+            if i:
+                dataset[i] = dataset[i - 1]
+                dataset[i - 1] = item
+            return i
+    return None
@@ -0,0 +1,439 @@
+"""Bounded caches of search results, with selectable eviction policies."""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Sequence, Type
+
+from lvb.approach import CachePolicy
+from lvb.benchmark import measure_latencies, percentiles
+
+# returned by a lookup that finds nothing, since None is a search result
+MISSING = object()
+
+
+class LookupCache(ABC):
+    """Map targets to the results of searching for them, up to a capacity.
+
+    A subclass decides which result to evict when a new one does not fit.
+    Every lookup counts as a hit or a miss, and every result dropped to
+    make room counts as an eviction.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("A lookup cache must hold at least one result.")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of results held."""
+
+    @abstractmethod
+    def get(self, key: Any) -> Any:
+        """Return the result cached for a key, or MISSING."""
+
+    @abstractmethod
+    def put(self, key: Any, value: Any) -> None:
+        """Cache the result for a key that was just missed."""
+
+    @abstractmethod
+    def invalidate(self, key: Any) -> None:
+        """Drop the result for a key, after the structure changed for it."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every result and all history, as after a rebuild."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of lookups that were answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset_counters(self) -> None:
+        """Forget the hits, misses and evictions counted so far."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def wrap(self, search_func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """Wrap a search so that repeated targets are answered from here.
+
+        Args:
+            search_func: Function that searches for a single target
+
+        Returns:
+            Callable: Search function that consults the cache first
+        """
+
+        def cached_search(target: Any) -> Any:
+            """Return the cached result, or search and cache it."""
+            value = self.get(target)
+            if value is MISSING:
+                value = search_func(target)
+                self.put(target, value)
+            return value
+
+        return cached_search
+
+
+class LRUCache(LookupCache):
+    """Evict the result that was used least recently."""
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of results held."""
+        return len(self.entries)
+
+    def get(self, key: Any) -> Any:
+        """Return the result cached for a key, or MISSING."""
+        value = self.entries.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Cache a result, evicting the least recently used if full."""
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Any) -> None:
+        """Drop the result for a key."""
+        self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every result."""
+        self.entries.clear()
+
+
+class LFUCache(LookupCache):
+    """Evict the result that was used least often, the oldest among ties.
+
+    Keys are kept in one recency-ordered bucket per use count, so every
+    operation takes constant time.
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.entries: Dict[Any, Any] = {}
+        self.counts: Dict[Any, int] = {}
+        self.buckets: Dict[int, OrderedDict] = {}
+        self.least = 0
+
+    def __len__(self) -> int:
+        """Return the number of results held."""
+        return len(self.entries)
+
+    def _touch(self, key: Any) -> None:
+        """Move a key into the bucket of one more use."""
+        count = self.counts[key]
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+            if self.least == count:
+                self.least = count + 1
+        self.counts[key] = count + 1
+        self.buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def get(self, key: Any) -> Any:
+        """Return the result cached for a key, or MISSING."""
+        value = self.entries.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._touch(key)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Cache a result, evicting the least frequently used if full."""
+        if key in self.entries:
+            self.entries[key] = value
+            self._touch(key)
+            return
+        if len(self.entries) >= self.capacity:
+            bucket = self.buckets[self.least]
+            evicted, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self.buckets[self.least]
+            del self.entries[evicted]
+            del self.counts[evicted]
+            self.evictions += 1
+        self.entries[key] = value
+        self.counts[key] = 1
+        self.buckets.setdefault(1, OrderedDict())[key] = None
+        self.least = 1
+
+    def invalidate(self, key: Any) -> None:
+        """Drop the result for a key."""
+        if key not in self.entries:
+            return
+        count = self.counts.pop(key)
+        del self.entries[key]
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+            if self.least == count:
+                self.least = min(self.buckets, default=0)
+
+    def clear(self) -> None:
+        """Drop every result."""
+        self.entries.clear()
+        self.counts.clear()
+        self.buckets.clear()
+        self.least = 0
+
+
+class ARCCache(LookupCache):
+    """Adaptive replacement cache, balancing recency against frequency.
+
+    Results seen once live in t1 and results seen again in t2, while b1
+    and b2 remember the keys recently evicted from each. A miss that hits
+    a ghost list grows the share of the list it came from, so the cache
+    tunes itself between LRU and LFU as the workload shifts.
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.t1: OrderedDict = OrderedDict()
+        self.t2: OrderedDict = OrderedDict()
+        self.b1: OrderedDict = OrderedDict()
+        self.b2: OrderedDict = OrderedDict()
+        # Target size of t1, adapted on every ghost hit
+        self.target = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of results held."""
+        return len(self.t1) + len(self.t2)
+
+    def get(self, key: Any) -> Any:
+        """Return the result cached for a key, or MISSING."""
+        if key in self.t1:
+            value = self.t1.pop(key)
+        elif key in self.t2:
+            value = self.t2.pop(key)
+        else:
+            self.misses += 1
+            return MISSING
+        # a second use makes the result frequent
+        self.t2[key] = value
+        self.hits += 1
+        return value
+
+    def _replace(self, in_b2: bool) -> None:
+        """Evict from t1 or t2 to its ghost list, as the target decides."""
+        # invalidated results leave room that needs no eviction
+        if len(self) < self.capacity:
+            return
+        if self.t1 and (
+            len(self.t1) > self.target
+            or (in_b2 and len(self.t1) == self.target)
+        ):
+            key, _ = self.t1.popitem(last=False)
+            self.b1[key] = None
+        else:
+            key, _ = self.t2.popitem(last=False)
+            self.b2[key] = None
+        self.evictions += 1
+
+    def put(self, key: Any, value: Any) -> None:
+        """Cache a result, adapting the target on a ghost hit."""
+        if key in self.t1 or key in self.t2:
+            self.t1.pop(key, None)
+            self.t2[key] = value
+            return
+        capacity = self.capacity
+        if key in self.b1:
+            self.target = min(
+                capacity,
+                self.target + max(len(self.b2) / len(self.b1), 1),
+            )
+            self._replace(in_b2=False)
+            del self.b1[key]
+            self.t2[key] = value
+            return
+        if key in self.b2:
+            self.target = max(
+                0.0, self.target - max(len(self.b1) / len(self.b2), 1)
+            )
+            self._replace(in_b2=True)
+            del self.b2[key]
+            self.t2[key] = value
+            return
+        if len(self.t1) + len(self.b1) == capacity:
+            if len(self.t1) < capacity:
+                self.b1.popitem(last=False)
+                self._replace(in_b2=False)
+            else:
+                self.t1.popitem(last=False)
+                self.evictions += 1
+        else:
+            history = len(self) + len(self.b1) + len(self.b2)
+            if history >= capacity:
+                if history == 2 * capacity:
+                    self.b2.popitem(last=False)
+                self._replace(in_b2=False)
+        self.t1[key] = value
+
+    def invalidate(self, key: Any) -> None:
+        """Drop the result for a key, keeping its history."""
+        self.t1.pop(key, None)
+        self.t2.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every result and the ghost lists."""
+        for entries in (self.t1, self.t2, self.b1, self.b2):
+            entries.clear()
+        self.target = 0.0
+
+
+class TwoQueueCache(LookupCache):
+    """2Q cache, which admits a result to its main LRU list on reuse.
+
+    New results enter a small FIFO queue, and the keys evicted from it
+    are remembered in a ghost queue. Only a key missed again while it is
+    remembered joins the main list, so a scan of results used once cannot
+    flush the results that are used often.
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.recent: OrderedDict = OrderedDict()
+        self.ghosts: OrderedDict = OrderedDict()
+        self.frequent: OrderedDict = OrderedDict()
+        # the sizes that the 2Q paper recommends for its queues
+        self.recent_limit = max(1, capacity // 4)
+        self.ghost_limit = max(1, capacity // 2)
+
+    def __len__(self) -> int:
+        """Return the number of results held."""
+        return len(self.recent) + len(self.frequent)
+
+    def get(self, key: Any) -> Any:
+        """Return the result cached for a key, or MISSING."""
+        value = self.frequent.get(key, MISSING)
+        if value is not MISSING:
+            self.frequent.move_to_end(key)
+        else:
+            value = self.recent.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def _reclaim(self) -> None:
+        """Evict one result if the cache is full."""
+        if len(self) < self.capacity:
+            return
+        if len(self.recent) > self.recent_limit or not self.frequent:
+            key, _ = self.recent.popitem(last=False)
+            self.ghosts[key] = None
+            if len(self.ghosts) > self.ghost_limit:
+                self.ghosts.popitem(last=False)
+        else:
+            self.frequent.popitem(last=False)
+        self.evictions += 1
+
+    def put(self, key: Any, value: Any) -> None:
+        """Cache a result in the queue that its history decides."""
+        if key in self.frequent:
+            self.frequent[key] = value
+            return
+        if key in self.recent:
+            self.recent[key] = value
+            return
+        # the ghost is checked first, as making room may push it out
+        remembered = self.ghosts.pop(key, MISSING) is not MISSING
+        self._reclaim()
+        if remembered:
+            self.frequent[key] = value
+        else:
+            self.recent[key] = value
+
+    def invalidate(self, key: Any) -> None:
+        """Drop the result for a key, keeping its history."""
+        self.recent.pop(key, None)
+        self.frequent.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every result and the ghost queue."""
+        for entries in (self.recent, self.ghosts, self.frequent):
+            entries.clear()
+
+
+# map each eviction policy to the class of cache that implements it
+LOOKUP_CACHES: Dict[CachePolicy, Type[LookupCache]] = {
+    CachePolicy.LRU: LRUCache,
+    CachePolicy.LFU: LFUCache,
+    CachePolicy.ARC: ARCCache,
+    CachePolicy.TWO_QUEUE: TwoQueueCache,
+}
+
+
+def create_lookup_cache(policy: CachePolicy, capacity: int) -> LookupCache:
+    """Create an empty lookup cache with an eviction policy and capacity."""
+    return LOOKUP_CACHES[policy](capacity)
+
+
+def cache_statistics(
+    cache: LookupCache,
+    cached_search: Callable[[Any], Any],
+    targets: Sequence[Any],
+) -> Dict[str, Any]:
+    """Search once for every target through an empty cache.
+
+    The timed repeats run the same targets again and again, so they would
+    find every result that fits cached. A single pass from an empty cache
+    shows the hit rate of the workload itself, and splits its latencies
+    between the searches answered from the cache and the ones that fell
+    through to the structure.
+
+    Args:
+        cache: Cache that the search consults
+        cached_search: Search wrapped by the cache
+        targets: Targets to search for, in order
+
+    Returns:
+        Dict: Hits, misses, evictions, hit rate, and latency percentiles
+        of the hits and of the misses
+    """
+    cache.clear()
+    cache.reset_counters()
+    hits: List[bool] = []
+
+    def observed_search(target: Any) -> None:
+        before = cache.hits
+        cached_search(target)
+        hits.append(cache.hits > before)
+
+    latencies = measure_latencies(observed_search, targets)
+    details: Dict[str, Any] = {
+        "cache_hits": cache.hits,
+        "cache_misses": cache.misses,
+        "cache_evictions": cache.evictions,
+        "cache_hit_rate": cache.hit_rate,
+    }
+    for name, wanted in (("hit", True), ("miss", False)):
+        split = [
+            latency for latency, hit in zip(latencies, hits) if hit is wanted
+        ]
+        if split:
+            p50, p99 = percentiles(split, (50, 99))
+            details[f"cache_{name}_p50"] = p50
+            details[f"cache_{name}_p99"] = p99
+    return details
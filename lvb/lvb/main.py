@@ -1,22 +1,61 @@
 """Conduct experiments to evaluate performance of search algorithms."""
 
-# ruff: noqa: PLR0913
+# ruff: noqa: PLR0913, PLR0917
 
+import asyncio
+import io
+import math
+import random
 import statistics
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 import typer
 from rich.console import Console
 
 from lvb import approach
-from lvb.benchmark import benchmark
-from lvb.binarysearch import binary_search_iterative, binary_search_recursive
+from lvb.benchmark import percentiles
+from lvb.cache import DatasetCache
+from lvb.complexity import analyze_scaling
 from lvb.constants import constants
-from lvb.generate import (
-    generate_binary_search_tree,
-    generate_dataset,
-    select_targets,
+from lvb.experiment import Configuration, RunResult, run_benchmark
+from lvb.incremental import run_incremental, validate_incremental
+from lvb.instrument import profile_call
+from lvb.parallel import run_parallel
+from lvb.results import (
+    compare_results,
+    default_results_path,
+    environment,
+    read_results,
+    run_record,
+    save_results,
 )
-from lvb.linearsearch import linear_search
+from lvb.service import (
+    Address,
+    LoadResult,
+    LocalServer,
+    closed_loop,
+    find_sustained_rate,
+    load_keys,
+    load_search,
+    open_loop,
+    seeded,
+)
+from lvb.service import serve as serve_lookups
+from lvb.sweep import (
+    ALL,
+    doubling_sizes,
+    parse_axis,
+    run_sweep,
+    sweep_configurations,
+)
+from lvb.throughput import (
+    free_threaded_build,
+    gil_enabled,
+    measure_throughput,
+    validate_throughput,
+)
+from lvb.workload import WorkloadMix, run_workload, validate_workload
 
 # create a Typer object to support the command-line interface
 cli = typer.Typer()
@@ -25,8 +64,319 @@ cli = typer.Typer()
 console = Console()
 
 
-@cli.command()
+def _seconds(value: float) -> str:
+    """Format a time in seconds with the configured precision."""
+    return f"{value:.{constants.DECIMAL_PLACES}f}"
+
+
+def _save(
+    output_format: approach.OutputFormat,
+    output_file: Optional[str],
+    records: List[Dict[str, Any]],
+    seed: Optional[int],
+) -> None:
+    """Save run records with a description of this machine."""
+    path = output_file or default_results_path(output_format)
+    save_results(path, output_format, records, environment(seed))
+    console.print(f"Saved {len(records)} runs to {path}")
+
+
+def _describe_memory(details: Dict[str, Any]) -> List[str]:
+    """Describe the footprint of a structure and the memory of its use."""
+    rss = (
+        f", RSS {details['rss_delta'] / 1024:+.1f} KiB"
+        if "rss_delta" in details
+        else ""
+    )
+    lines = [
+        f"memory: {details['deep_size'] / 1024:.1f} KiB deep size, "
+        f"{details['deep_bytes_per_key']:.1f} bytes per key; build peak "
+        f"{details['build_peak'] / 1024:.1f} KiB, "
+        f"{details['build_retained'] / 1024:.1f} KiB retained{rss}"
+    ]
+    if "search_peak" in details:
+        lines.append(
+            f"searching once: peak {details['search_peak']} bytes above "
+            f"baseline, {details['search_blocks']:+d} memory blocks retained"
+        )
+    return lines
+
+
+def _describe_work(details: Dict[str, Any]) -> List[str]:
+    """Describe the comparisons and probes that every search took."""
+    work = (
+        f"work per search: {details['comparisons_per_search']:.2f} "
+        f"comparisons (max {details['max_comparisons']}), "
+        f"{details['probes_per_search']:.2f} probes "
+        f"(max {details['max_probes']})"
+    )
+    if "mean_probe_stride" in details:
+        work += f", {details['mean_probe_stride']:.1f} positions apart"
+    lines = [work]
+    if "probe_traces" in details:
+        # the first lookups show the access pattern without a flood
+        for trace in details["probe_traces"][: constants.PRINTED_TRACES]:
+            shown = " → ".join(map(str, trace[: constants.PRINTED_PROBES]))
+            more = len(trace) - constants.PRINTED_PROBES
+            lines.append(
+                f"probes: {shown}" + (f" … {more} more" if more > 0 else "")
+            )
+    return lines
+
+
+def _describe_lookup_cache(details: Dict[str, Any]) -> List[str]:
+    """Describe how often the lookup cache answered, and how fast."""
+    if "cache_hit_rate" not in details:
+        return []
+    lines = [
+        f"lookup cache hit rate {details['cache_hit_rate']:.2%} "
+        f"({details['cache_hits']} hits, {details['cache_misses']} misses, "
+        f"{details['cache_evictions']} evictions)"
+    ]
+    # a pass may be all hits or all misses, and then has one side only
+    for name in ("hit", "miss"):
+        if f"cache_{name}_p50" in details:
+            lines.append(
+                f"cache {name} p50 "
+                f"{details[f'cache_{name}_p50'] * 1e6:.3f} µs, p99 "
+                f"{details[f'cache_{name}_p99'] * 1e6:.3f} µs"
+            )
+    return lines
+
+
+def _describe_result(result: RunResult, searches: int) -> List[str]:
+    """Describe the spread, build statistics and baseline of a run."""
+    measurement = result.measurement
+    lines = [
+        f"± {_seconds(measurement.margin)} (95% CI), "
+        f"min {_seconds(measurement.minimum)}, "
+        f"stdev {_seconds(measurement.stdev)} over "
+        f"{len(measurement.times)} repeats of {measurement.number} calls"
+    ]
+    if result.latencies:
+        p50, p95, p99 = percentiles(result.latencies)
+        lines.append(
+            f"per search p50 {p50 * 1e6:.3f} µs, p95 {p95 * 1e6:.3f} µs, "
+            f"p99 {p99 * 1e6:.3f} µs"
+        )
+    details = result.details
+    if "generate_time" in details:
+        lines.append(
+            f"dataset ready in {_seconds(details['generate_time'])} seconds"
+            + (
+                f", merged in {_seconds(details['merge_time'])} seconds"
+                if "merge_time" in details
+                else ""
+            )
+        )
+    if "cold_latencies" in details:
+        p50, p95, p99 = percentiles(details["cold_latencies"])
+        cache_state = (
+            "cold page cache"
+            if details["page_cache_dropped"]
+            else "page cache not dropped"
+        )
+        lines.append(
+            f"{cache_state}: p50 {p50 * 1e6:.3f} µs, p95 {p95 * 1e6:.3f} µs, "
+            f"p99 {p99 * 1e6:.3f} µs, "
+            f"{details['pages_per_lookup']:.1f} pages and "
+            f"{details['bytes_per_lookup']:.0f} bytes per lookup"
+        )
+    if "baseline_time" in details:
+        baseline_time = details["baseline_time"]
+        lines.append(
+            f"{searches} independent binary searches took "
+            f"{_seconds(baseline_time)} seconds "
+            f"({baseline_time / result.elapsed_time:.2f}x the galloping sweep)"
+        )
+    if "build_time" in details:
+        build = f"built in {_seconds(details['build_time'])} seconds"
+        # only the trees implemented here count their rotations
+        if "rotations" in details:
+            build += f" with {details['rotations']} rotations"
+        if "node_count" in details:
+            build += (
+                f", height {details['height']}, {details['node_count']} nodes"
+            )
+        if "bytes_per_key" in details:
+            build += f", {details['bytes_per_key']:.2f} bytes per key"
+        lines.append(build)
+    if "packed_bytes_per_key" in details:
+        lines.append(
+            f"keys packed in {details['packed_bytes_per_key']:.2f} bytes "
+            "per key"
+        )
+    if "bloom_build_time" in details:
+        lines.append(
+            f"Bloom filter built in "
+            f"{_seconds(details['bloom_build_time'])} seconds, "
+            f"{details['bloom_bytes_per_key']:.2f} bytes per key, "
+            f"false positive rate {details['bloom_false_positive_rate']:.4f} "
+            f"({details['bloom_false_positives']}/"
+            f"{details['bloom_missing_targets']} missing targets)"
+        )
+    lines.extend(_describe_lookup_cache(details))
+    if "deep_size" in details:
+        lines.extend(_describe_memory(details))
+    if "comparisons_per_search" in details:
+        lines.extend(_describe_work(details))
+    return lines
+
+
+def _print_configuration(
+    configuration: Configuration,
+    runs: int,
+    jobs: int,
+    pin_cpus: bool,
+    incremental: bool,
+) -> None:
+    """Print every choice that the benchmark runs with."""
+    console.print(
+        "\n[bold blue]Search Algorithm Benchmarking Tool[/bold blue]\n"
+    )
+    console.print(f"Data structure: {configuration.data_structure}")
+    console.print(f"Search algorithm: {configuration.search_algorithm}")
+    console.print(f"Data type: {configuration.data_type}")
+    console.print(
+        f"Target position: {configuration.target_position}"
+        + (
+            f" (exponent {configuration.zipf_exponent})"
+            if configuration.target_position == approach.TargetPosition.ZIPF
+            else ""
+        )
+    )
+    console.print(f"Insert order: {configuration.insert_order}")
+    if configuration.data_structure == approach.DataStructure.B_PLUS_TREE:
+        console.print(f"Fanout: {configuration.fanout}")
+    console.print(
+        f"Number of runs: {runs}{' (incremental)' if incremental else ''}"
+    )
+    console.print(f"Searches per run: {configuration.searches}")
+    console.print(f"Repeats per run: {configuration.repeats}")
+    console.print(f"Time budget per run: {configuration.time_budget}s")
+    console.print(f"Storage: {configuration.storage}")
+    console.print(f"Seed: {configuration.seed}")
+    console.print(
+        f"Dataset cache: {configuration.cache_directory or 'disabled'}"
+    )
+    console.print(f"Jobs: {jobs}{' (pinned)' if pin_cpus else ''}")
+    console.print(f"Batch mode: {configuration.batch}")
+    console.print(f"Bloom filter: {configuration.bloom_filter}")
+    console.print(
+        "Lookup cache: "
+        + (
+            f"{configuration.lookup_cache} "
+            f"({configuration.lookup_cache_capacity} results)"
+            if configuration.lookup_cache is not None
+            else "disabled"
+        )
+    )
+    console.print(f"Memory accounting: {configuration.memory}")
+    console.print(f"Instrumented searches: {configuration.instrument}\n")
+
+
+def _validate_runs(
+    configuration: Configuration,
+    jobs: int,
+    profile: Optional[str],
+    incremental: bool,
+) -> Optional[str]:
+    """Return the reason the runs cannot go ahead as requested, or None."""
+    error = configuration.validate()
+    if error is None and incremental:
+        error = validate_incremental(configuration, jobs)
+    storage = configuration.storage
+    if error is None and jobs > 1 and storage != approach.Storage.MEMORY:
+        error = f"{str(storage).capitalize()} storage runs in a single process"
+    if error is None and jobs > 1 and profile is not None:
+        error = "Profiling runs in a single process"
+    return error
+
+
+def _print_summary(results: List[RunResult]) -> None:
+    """Print the spread of times and latencies across the run sizes."""
+    # Calculate statistics
+    times = [result.elapsed_time for result in results]
+    sizes = [result.size for result in results]
+    min_time = min(times)
+    max_time = max(times)
+    avg_time = sum(times) / len(times)
+    median_time = statistics.median(times)
+
+    console.print("\n[bold green]Benchmark Summary:[/bold green]")
+    console.print(
+        f"Minimum time: {_seconds(min_time)}s (size {sizes[times.index(min_time)]})"
+    )
+    console.print(
+        f"Maximum time: {_seconds(max_time)}s (size {sizes[times.index(max_time)]})"
+    )
+    console.print(f"Average time: {_seconds(avg_time)}s")
+    console.print(f"Median time:  {_seconds(median_time)}s")
+    # setup is what a run spends before its first timed search
+    setup_time = sum(
+        result.details.get(name, 0.0)
+        for result in results
+        for name in ("generate_time", "merge_time", "build_time")
+    )
+    search_time = sum(
+        sum(result.measurement.times) * result.measurement.number
+        for result in results
+    )
+    console.print(
+        f"Setup time:   {_seconds(setup_time)}s (generate, merge and build), "
+        f"timed searches {_seconds(search_time)}s"
+    )
+    if any(result.latencies for result in results):
+        console.print("Per-search latency percentiles:")
+        for result in results:
+            p50, p95, p99 = percentiles(result.latencies)
+            console.print(
+                f"  size {result.size:8d}: p50 {p50 * 1e6:.3f} µs, "
+                f"p95 {p95 * 1e6:.3f} µs, p99 {p99 * 1e6:.3f} µs"
+            )
+
+
+def _print_scaling(
+    results: List[RunResult], searches: int, predict_size: Optional[int]
+) -> None:
+    """Print how the search time grows with the size, and extrapolate it."""
+    sizes = [result.size for result in results]
+    analysis = analyze_scaling(
+        sizes, [result.elapsed_time for result in results]
+    )
+    console.print("\n[bold green]Scaling Analysis:[/bold green]")
+    for before, after, ratio in zip(sizes, sizes[1:], analysis.ratios):
+        console.print(f"Doubling ratio {before} -> {after}: {ratio:.3f}")
+    if not math.isnan(analysis.exponent):
+        console.print(f"Empirical exponent: time ~ n^{analysis.exponent:.3f}")
+    if analysis.best is None:
+        console.print(
+            f"Model fit needs at least {constants.MIN_FIT_SIZES} sizes"
+        )
+        return
+    for fit in analysis.fits:
+        console.print(
+            f"  O({fit.name}): R² {fit.r_squared:.4f}, "
+            f"adjusted {fit.adjusted_r_squared:.4f}"
+        )
+    best = analysis.best
+    formula = f"{best.intercept:.3e}"
+    if best.coefficient:
+        formula += f" + {best.coefficient:.3e} * {best.name}"
+    console.print(
+        f"Best fit: O({best.name}), time = {formula} (R² {best.r_squared:.4f})"
+    )
+    if predict_size is not None:
+        predicted = max(0.0, best.predict(predict_size))
+        console.print(
+            f"Predicted at size {predict_size}: {_seconds(predicted)}s for "
+            f"{searches} searches, {predicted / searches * 1e6:.3f} µs each"
+        )
+
+
+@cli.callback(invoke_without_command=True)
 def main(
+    ctx: typer.Context,
     data_structure: approach.DataStructure = typer.Option(
         approach.DataStructure.UNSORTED_LIST,
         "--data-structure",
@@ -47,120 +397,1027 @@ def main(
         "--target-position",
         "-p",
     ),
+    zipf_exponent: float = typer.Option(
+        constants.DEFAULT_ZIPF_EXPONENT,
+        "--zipf-exponent",
+        min=0.0,
+        help="Skew of Zipf targets, from 0 for uniform to above 1 for heavy",
+    ),
+    insert_order: approach.InsertOrder = typer.Option(
+        approach.InsertOrder.BALANCED,
+        "--insert-order",
+        "-o",
+    ),
+    fanout: int = typer.Option(
+        constants.DEFAULT_FANOUT,
+        "--fanout",
+        min=4,
+        help="Largest number of entries in a B+-tree node",
+    ),
     start_size: int = typer.Option(constants.DEFAULT_START_SIZE),
     runs: int = typer.Option(constants.DEFAULT_RUNS),
     searches: int = typer.Option(constants.DEFAULT_SEARCHES),
+    batch: bool = typer.Option(
+        False, "--batch", help="Search for all targets in one batched call"
+    ),
+    bloom_filter: bool = typer.Option(
+        False,
+        "--bloom-filter",
+        help="Reject missing targets with a Bloom filter before searching",
+    ),
+    false_positive_rate: float = typer.Option(
+        constants.DEFAULT_FALSE_POSITIVE_RATE, "--false-positive-rate"
+    ),
+    lookup_cache: Optional[approach.CachePolicy] = typer.Option(
+        None,
+        "--lookup-cache",
+        help="Answer repeated targets from a cache with this eviction",
+    ),
+    lookup_cache_capacity: int = typer.Option(
+        constants.DEFAULT_LOOKUP_CACHE_CAPACITY,
+        "--lookup-cache-capacity",
+        min=1,
+        help="Largest number of search results the lookup cache keeps",
+    ),
+    repeats: int = typer.Option(
+        constants.DEFAULT_REPEATS,
+        "--repeats",
+        min=1,
+        help="Independent timed repeats per dataset size",
+    ),
+    time_budget: float = typer.Option(
+        constants.DEFAULT_TIME_BUDGET,
+        "--time-budget",
+        min=0.0,
+        help="Seconds that all repeats of one size should take together",
+    ),
+    warmup: int = typer.Option(
+        constants.DEFAULT_WARMUP,
+        "--warmup",
+        min=0,
+        help="Untimed calls before the timed repeats",
+    ),
+    seed: Optional[int] = typer.Option(
+        None, "--seed", help="Seed that makes datasets and targets repeat"
+    ),
+    cache_directory: str = typer.Option(
+        constants.DEFAULT_CACHE_DIRECTORY,
+        "--cache-dir",
+        help="Directory that keeps seeded datasets between runs",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always generate datasets from scratch"
+    ),
+    storage: approach.Storage = typer.Option(
+        approach.Storage.MEMORY,
+        "--storage",
+        help="Keep a list on the heap, packed in one buffer, or in a file",
+    ),
+    jobs: int = typer.Option(
+        constants.DEFAULT_JOBS,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker processes that run independent runs in parallel",
+    ),
+    pin_cpus: bool = typer.Option(
+        False,
+        "--pin-cpus",
+        help="Pin every worker process to a CPU of its own",
+    ),
+    output: Optional[approach.OutputFormat] = typer.Option(
+        None,
+        "--output",
+        help="Also save every run, with its environment, in this format",
+    ),
+    output_file: Optional[str] = typer.Option(
+        None,
+        "--output-file",
+        help="File to save results to, by default lvb-results.<format>",
+    ),
+    predict_size: Optional[int] = typer.Option(
+        None,
+        "--predict-size",
+        min=1,
+        help="Dataset size to extrapolate the fitted search time to",
+    ),
+    memory: bool = typer.Option(
+        False,
+        "--memory",
+        help="Measure the footprint of the structure and of its searches",
+    ),
+    instrument: bool = typer.Option(
+        False,
+        "--instrument",
+        help="Count the comparisons and probes of every search",
+    ),
+    trace: bool = typer.Option(
+        False,
+        "--trace",
+        help="Also record the positions or keys every search probes",
+    ),
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        help="Run under cProfile and dump the profile to this file",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Grow one dataset across runs, generating only the new values",
+    ),
 ):
     """Evaluate the performance of search algorithms."""
-    # Display configuration details
+    # a subcommand runs on its own, with options of its own
+    if ctx.invoked_subcommand is not None:
+        return
+
+    # unseeded datasets never repeat, so there is nothing to cache
+    use_cache = seed is not None and not no_cache
+    configuration = Configuration(
+        data_structure=data_structure,
+        search_algorithm=search_algorithm,
+        data_type=data_type,
+        target_position=target_position,
+        zipf_exponent=zipf_exponent,
+        insert_order=insert_order,
+        fanout=fanout,
+        searches=searches,
+        batch=batch,
+        bloom_filter=bloom_filter,
+        false_positive_rate=false_positive_rate,
+        lookup_cache=lookup_cache,
+        lookup_cache_capacity=lookup_cache_capacity,
+        repeats=repeats,
+        time_budget=time_budget,
+        warmup=warmup,
+        seed=seed,
+        cache_directory=cache_directory if use_cache else None,
+        storage=storage,
+        memory=memory,
+        instrument=instrument or trace,
+        trace=trace,
+    )
+    _print_configuration(configuration, runs, jobs, pin_cpus, incremental)
+
+    # Validate configurations
+    error = _validate_runs(configuration, jobs, profile, incremental)
+    if error is not None:
+        console.print(f"[bold red]Error: {error}![/bold red]")
+        return
+
+    # Initialize benchmarking variables
+    sizes = doubling_sizes(start_size, runs)
+    results: List[RunResult] = []
+    # independent runs may go to worker processes, and come back in order
+    if incremental:
+        run_results = run_incremental(configuration, sizes)
+    elif jobs > 1:
+        run_results = run_parallel(configuration, sizes, jobs, pin_cpus)
+    else:
+        run_results = (run_benchmark(configuration, size) for size in sizes)
+    if profile is not None:
+        # every run finishes under the profiler before any is printed
+        run_results, stats = profile_call(lambda: list(run_results), profile)
+
+    for run, result in enumerate(run_results, start=1):
+        results.append(result)
+        size = result.size
+
+        # Display run results
+        console.print(
+            f"Run {run:2d}/{runs}: {search_algorithm} on {data_structure} "
+            f"(size {size:8d}) completed in "
+            f"{_seconds(result.elapsed_time)} seconds"
+        )
+        for line in _describe_result(result, searches):
+            console.print(f"        {line}")
+
+    _print_summary(results)
+    _print_scaling(results, searches, predict_size)
+    if profile is not None:
+        console.print(
+            f"\n[bold]Profile saved to {profile}, slowest functions by "
+            "cumulative time:[/bold]"
+        )
+        stats.stream = io.StringIO()
+        stats.print_stats(constants.PROFILE_FUNCTIONS)
+        console.print(
+            stats.stream.getvalue(),
+            markup=False,
+            highlight=False,
+            soft_wrap=True,
+        )
+    if output is not None:
+        _save(
+            output,
+            output_file,
+            [run_record(configuration, result) for result in results],
+            seed,
+        )
+
+
+@cli.command()
+def sweep(
+    data_structures: List[str] = typer.Option(
+        [ALL],
+        "--data-structure",
+        "-d",
+        help="Data structures to sweep, repeated or comma-separated, or all",
+    ),
+    search_algorithms: List[str] = typer.Option(
+        [ALL],
+        "--search-algorithm",
+        "-s",
+        help="Search algorithms to sweep, or all",
+    ),
+    data_types: List[str] = typer.Option(
+        [ALL], "--data-type", "-t", help="Data types to sweep, or all"
+    ),
+    target_positions: List[str] = typer.Option(
+        [ALL],
+        "--target-position",
+        "-p",
+        help="Target positions to sweep, or all",
+    ),
+    zipf_exponent: float = typer.Option(
+        constants.DEFAULT_ZIPF_EXPONENT,
+        "--zipf-exponent",
+        min=0.0,
+        help="Skew of Zipf targets, from 0 for uniform to above 1 for heavy",
+    ),
+    insert_order: approach.InsertOrder = typer.Option(
+        approach.InsertOrder.BALANCED,
+        "--insert-order",
+        "-o",
+    ),
+    fanout: int = typer.Option(
+        constants.DEFAULT_FANOUT,
+        "--fanout",
+        min=4,
+        help="Largest number of entries in a B+-tree node",
+    ),
+    start_size: int = typer.Option(constants.DEFAULT_START_SIZE),
+    runs: int = typer.Option(constants.DEFAULT_RUNS),
+    searches: int = typer.Option(constants.DEFAULT_SEARCHES),
+    repeats: int = typer.Option(
+        constants.DEFAULT_REPEATS,
+        "--repeats",
+        min=1,
+        help="Independent timed repeats per dataset size",
+    ),
+    time_budget: float = typer.Option(
+        constants.DEFAULT_TIME_BUDGET,
+        "--time-budget",
+        min=0.0,
+        help="Seconds that all repeats of one size should take together",
+    ),
+    warmup: int = typer.Option(
+        constants.DEFAULT_WARMUP,
+        "--warmup",
+        min=0,
+        help="Untimed calls before the timed repeats",
+    ),
+    seed: Optional[int] = typer.Option(
+        None, "--seed", help="Seed that makes datasets and targets repeat"
+    ),
+    cache_directory: str = typer.Option(
+        constants.DEFAULT_CACHE_DIRECTORY,
+        "--cache-dir",
+        help="Directory that keeps seeded datasets between runs",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always generate datasets from scratch"
+    ),
+    jobs: int = typer.Option(
+        constants.DEFAULT_JOBS,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker processes that run independent runs in parallel",
+    ),
+    pin_cpus: bool = typer.Option(
+        False,
+        "--pin-cpus",
+        help="Pin every worker process to a CPU of its own",
+    ),
+    output: Optional[approach.OutputFormat] = typer.Option(
+        None,
+        "--output",
+        help="Also save every run, with its environment, in this format",
+    ),
+    output_file: Optional[str] = typer.Option(
+        None,
+        "--output-file",
+        help="File to save results to, by default lvb-results.<format>",
+    ),
+):
+    """Run every valid combination of the chosen axes on shared datasets."""
+    try:
+        axes = [
+            parse_axis(data_structures, approach.DataStructure),
+            parse_axis(search_algorithms, approach.SearchAlgorithm),
+            parse_axis(data_types, approach.DataType),
+            parse_axis(target_positions, approach.TargetPosition),
+        ]
+    except ValueError as error:
+        raise typer.BadParameter(str(error)) from error
+
+    base = Configuration(
+        data_structure=approach.DataStructure.UNSORTED_LIST,
+        search_algorithm=approach.SearchAlgorithm.LINEAR_SEARCH,
+        insert_order=insert_order,
+        fanout=fanout,
+        searches=searches,
+        repeats=repeats,
+        time_budget=time_budget,
+        warmup=warmup,
+        seed=seed,
+        zipf_exponent=zipf_exponent,
+    )
+    configurations = sweep_configurations(base, *axes)
+    combinations = 1
+    for axis in axes:
+        combinations *= len(axis)
+
     console.print(
-        "\n[bold blue]Search Algorithm Benchmarking Tool[/bold blue]\n"
+        "\n[bold blue]Search Algorithm Benchmarking Sweep[/bold blue]\n"
+    )
+    console.print(
+        f"{len(configurations)} valid of {combinations} combinations, "
+        f"{runs} sizes from {start_size}, seed {seed}, {jobs} jobs\n"
+    )
+    if not configurations:
+        console.print("[bold red]Error: No valid combination![/bold red]")
+        return
+
+    # unseeded datasets never repeat, so there is nothing to cache
+    cache = (
+        DatasetCache(cache_directory)
+        if seed is not None and not no_cache
+        else None
+    )
+    console.print(
+        f"{'size':>9} {'data type':<9} {'target':<11} {'data structure':<18} "
+        f"{'search algorithm':<24} {'mean':>10} {'± 95% CI':>10} "
+        f"{'p50 µs':>9} {'p99 µs':>9}"
+    )
+    records = []
+    for configuration, result in run_sweep(
+        configurations,
+        doubling_sizes(start_size, runs),
+        seed,
+        cache,
+        jobs,
+        pin_cpus,
+    ):
+        if result.latencies:
+            p50, p99 = percentiles(result.latencies, (50, 99))
+            latency = f"{p50 * 1e6:9.3f} {p99 * 1e6:9.3f}"
+        else:
+            # a batched search has no latency of a single target
+            latency = f"{'-':>9} {'-':>9}"
+        # stream every result as soon as its run ends
+        console.print(
+            f"{result.size:9d} {configuration.data_type!s:<9} "
+            f"{configuration.target_position!s:<11} "
+            f"{configuration.data_structure!s:<18} "
+            f"{configuration.search_algorithm!s:<24} "
+            f"{_seconds(result.elapsed_time):>10} "
+            f"{_seconds(result.measurement.margin):>10} {latency}"
+        )
+        records.append(run_record(configuration, result))
+    if output is not None:
+        _save(output, output_file, records, seed)
+
+
+@cli.command()
+def throughput(
+    data_structure: approach.DataStructure = typer.Option(
+        approach.DataStructure.SORTED_LIST,
+        "--data-structure",
+        "-d",
+    ),
+    search_algorithm: approach.SearchAlgorithm = typer.Option(
+        approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+        "--search-algorithm",
+        "-s",
+    ),
+    data_type: approach.DataType = typer.Option(
+        approach.DataType.INTEGERS,
+        "--data-type",
+        "-t",
+    ),
+    target_position: approach.TargetPosition = typer.Option(
+        approach.TargetPosition.RANDOM,
+        "--target-position",
+        "-p",
+    ),
+    zipf_exponent: float = typer.Option(
+        constants.DEFAULT_ZIPF_EXPONENT,
+        "--zipf-exponent",
+        min=0.0,
+        help="Skew of Zipf targets, from 0 for uniform to above 1 for heavy",
+    ),
+    insert_order: approach.InsertOrder = typer.Option(
+        approach.InsertOrder.BALANCED,
+        "--insert-order",
+        "-o",
+    ),
+    fanout: int = typer.Option(
+        constants.DEFAULT_FANOUT,
+        "--fanout",
+        min=4,
+        help="Largest number of entries in a B+-tree node",
+    ),
+    size: int = typer.Option(
+        constants.DEFAULT_START_SIZE, "--size", min=1, help="Dataset size"
+    ),
+    workers: List[str] = typer.Option(
+        ["1,2,4,8"],
+        "--workers",
+        "-w",
+        help="Numbers of concurrent readers, repeated or comma-separated",
+    ),
+    concurrency: approach.Concurrency = typer.Option(
+        approach.Concurrency.THREADS,
+        "--concurrency",
+        help="Run the readers as threads or as processes",
+    ),
+    duration: float = typer.Option(
+        constants.DEFAULT_DURATION,
+        "--duration",
+        min=0.0,
+        help="Seconds that every reader keeps searching",
+    ),
+    searches: int = typer.Option(
+        constants.DEFAULT_SEARCHES,
+        "--searches",
+        min=1,
+        help="Targets of every reader, searched round after round",
+    ),
+    seed: Optional[int] = typer.Option(
+        None, "--seed", help="Seed that makes datasets and targets repeat"
+    ),
+    cache_directory: str = typer.Option(
+        constants.DEFAULT_CACHE_DIRECTORY,
+        "--cache-dir",
+        help="Directory that keeps seeded datasets between runs",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always generate datasets from scratch"
+    ),
+):
+    """Measure how read throughput scales with concurrent readers."""
+    try:
+        worker_counts = sorted(
+            {int(item) for value in workers for item in value.split(",")}
+        )
+    except ValueError as error:
+        raise typer.BadParameter("Workers must be integers") from error
+    if not worker_counts or worker_counts[0] < 1:
+        raise typer.BadParameter("Workers must be at least 1")
+
+    use_cache = seed is not None and not no_cache
+    configuration = Configuration(
+        data_structure=data_structure,
+        search_algorithm=search_algorithm,
+        data_type=data_type,
+        target_position=target_position,
+        zipf_exponent=zipf_exponent,
+        insert_order=insert_order,
+        fanout=fanout,
+        searches=searches,
+        seed=seed,
+        cache_directory=cache_directory if use_cache else None,
+    )
+
+    console.print(
+        "\n[bold blue]Search Algorithm Read Throughput[/bold blue]\n"
     )
     console.print(f"Data structure: {data_structure}")
     console.print(f"Search algorithm: {search_algorithm}")
     console.print(f"Data type: {data_type}")
     console.print(f"Target position: {target_position}")
-    console.print(f"Number of runs: {runs}")
-    console.print(f"Searches per run: {searches}\n")
+    console.print(f"Dataset size: {size}")
+    console.print(f"Readers: {concurrency}, {duration}s each")
+    gil = "enabled" if gil_enabled() else "disabled"
+    build = "free-threaded" if free_threaded_build() else "default"
+    console.print(f"GIL: {gil} ({build} build)")
+    console.print(f"Seed: {seed}\n")
 
-    # Validate configurations
-    if (
-        search_algorithm
-        in [
-            approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
-            approach.SearchAlgorithm.BINARY_SEARCH_RECURSIVE,
-        ]
-        and data_structure == approach.DataStructure.UNSORTED_LIST
+    error = validate_throughput(configuration)
+    if error is not None:
+        console.print(f"[bold red]Error: {error}![/bold red]")
+        return
+
+    if seed is not None:
+        # shuffles and treap priorities use Python's generator
+        random.seed(f"{seed}:{size}")
+    console.print(
+        f"{'readers':>7} {'lookups':>10} {'QPS':>12} {'speedup':>8} "
+        f"{'p50 µs':>12} {'p99 µs':>12}"
+    )
+    # the speedup is relative to the fewest readers, usually just one
+    first_qps = None
+    for result in measure_throughput(
+        configuration, size, worker_counts, concurrency, duration
     ):
+        if first_qps is None:
+            first_qps = result.qps
+            if not result.shared:
+                console.print(
+                    "[yellow]Every reader process rebuilds its own copy of "
+                    "the structure[/yellow]"
+                )
+        speedup = result.qps / first_qps if first_qps else 0.0
         console.print(
-            "[bold red]Error: Binary search requires sorted list![/bold red]"
+            f"{result.workers:7d} {result.lookups:10d} {result.qps:12.0f} "
+            f"{speedup:7.2f}x"
         )
+        # every reader on a line of its own, to show who the others slow
+        for number, reader in enumerate(result.readers, start=1):
+            elapsed = reader.end - reader.start
+            qps = reader.lookups / elapsed if elapsed > 0 else 0.0
+            console.print(
+                f"{'#' + str(number):>7} {reader.lookups:10d} {qps:12.0f} "
+                f"{'':8} {reader.p50 * 1e6:12.3f} {reader.p99 * 1e6:12.3f}"
+            )
+
+
+@cli.command()
+def workload(
+    data_structure: approach.DataStructure = typer.Option(
+        approach.DataStructure.SORTED_LIST,
+        "--data-structure",
+        "-d",
+    ),
+    search_algorithm: approach.SearchAlgorithm = typer.Option(
+        approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+        "--search-algorithm",
+        "-s",
+    ),
+    data_type: approach.DataType = typer.Option(
+        approach.DataType.INTEGERS,
+        "--data-type",
+        "-t",
+    ),
+    insert_order: approach.InsertOrder = typer.Option(
+        approach.InsertOrder.BALANCED,
+        "--insert-order",
+        "-o",
+    ),
+    fanout: int = typer.Option(
+        constants.DEFAULT_FANOUT,
+        "--fanout",
+        min=4,
+        help="Largest number of entries in a B+-tree node",
+    ),
+    start_size: int = typer.Option(constants.DEFAULT_START_SIZE),
+    runs: int = typer.Option(constants.DEFAULT_RUNS),
+    operations: int = typer.Option(
+        constants.DEFAULT_OPERATIONS,
+        "--operations",
+        min=1,
+        help="Operations per run, drawn in the shares below",
+    ),
+    reads: float = typer.Option(
+        constants.DEFAULT_READ_SHARE,
+        "--reads",
+        min=0.0,
+        help="Share of the operations that search for a stored value",
+    ),
+    inserts: float = typer.Option(
+        constants.DEFAULT_INSERT_SHARE,
+        "--inserts",
+        min=0.0,
+        help="Share of the operations that insert a new value",
+    ),
+    deletes: float = typer.Option(
+        constants.DEFAULT_DELETE_SHARE,
+        "--deletes",
+        min=0.0,
+        help="Share of the operations that delete a stored value",
+    ),
+    lookup_cache: Optional[approach.CachePolicy] = typer.Option(
+        None,
+        "--lookup-cache",
+        help="Answer repeated reads from a cache that writes invalidate",
+    ),
+    lookup_cache_capacity: int = typer.Option(
+        constants.DEFAULT_LOOKUP_CACHE_CAPACITY,
+        "--lookup-cache-capacity",
+        min=1,
+        help="Largest number of search results the lookup cache keeps",
+    ),
+    seed: Optional[int] = typer.Option(
+        None, "--seed", help="Seed that makes datasets and operations repeat"
+    ),
+    cache_directory: str = typer.Option(
+        constants.DEFAULT_CACHE_DIRECTORY,
+        "--cache-dir",
+        help="Directory that keeps seeded datasets between runs",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always generate datasets from scratch"
+    ),
+):
+    """Measure interleaved reads, inserts and deletes as a structure grows."""
+    use_cache = seed is not None and not no_cache
+    configuration = Configuration(
+        data_structure=data_structure,
+        search_algorithm=search_algorithm,
+        data_type=data_type,
+        insert_order=insert_order,
+        fanout=fanout,
+        lookup_cache=lookup_cache,
+        lookup_cache_capacity=lookup_cache_capacity,
+        seed=seed,
+        cache_directory=cache_directory if use_cache else None,
+    )
+    mix = WorkloadMix(reads, inserts, deletes)
+
+    console.print("\n[bold blue]Search Algorithm Mixed Workload[/bold blue]\n")
+    console.print(f"Data structure: {data_structure}")
+    console.print(f"Search algorithm: {search_algorithm}")
+    console.print(f"Data type: {data_type}")
+    console.print(f"Operations per run: {operations}")
+    console.print(
+        f"Mix: {reads:g} reads, {inserts:g} inserts, {deletes:g} deletes"
+    )
+    console.print(
+        "Lookup cache: "
+        + (
+            f"{lookup_cache} ({lookup_cache_capacity} results)"
+            if lookup_cache is not None
+            else "disabled"
+        )
+    )
+    console.print(f"Seed: {seed}\n")
+
+    error = validate_workload(configuration, mix)
+    if error is not None:
+        console.print(f"[bold red]Error: {error}![/bold red]")
         return
 
-    if (
-        search_algorithm == approach.SearchAlgorithm.BST_SEARCH
-        and data_structure != approach.DataStructure.BINARY_SEARCH_TREE
-    ):
+    columns = "".join(
+        f" {f'{operation} p50 µs':>14} {f'{operation} p99 µs':>14}"
+        for operation in approach.Operation
+    )
+    console.print(f"{'size':>9} {'final':>9} {'ops/s':>12}{columns}")
+    for size in doubling_sizes(start_size, runs):
+        result = run_workload(configuration, mix, size, operations)
+        line = f"{size:9d} {result.final_size:9d} {result.throughput:12.0f}"
+        for operation in approach.Operation:
+            spread = result.percentiles(operation)
+            # an operation with no share never runs, and has no latency
+            if spread is None:
+                line += f" {'-':>14} {'-':>14}"
+            else:
+                line += f" {spread[0] * 1e6:14.3f} {spread[1] * 1e6:14.3f}"
+        console.print(line)
+        if result.missed_reads:
+            console.print(
+                f"[yellow]{result.missed_reads} reads missed a value whose "
+                "duplicate was deleted[/yellow]"
+            )
+
+
+def _address(
+    host: str, port: Optional[int], unix_socket: Optional[str]
+) -> Address:
+    """Combine the address options of the lookup service."""
+    return Address(
+        host, constants.DEFAULT_PORT if port is None else port, unix_socket
+    )
+
+
+@cli.command()
+def serve(
+    data_structure: approach.DataStructure = typer.Option(
+        approach.DataStructure.SORTED_LIST,
+        "--data-structure",
+        "-d",
+    ),
+    search_algorithm: approach.SearchAlgorithm = typer.Option(
+        approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+        "--search-algorithm",
+        "-s",
+    ),
+    data_type: approach.DataType = typer.Option(
+        approach.DataType.INTEGERS,
+        "--data-type",
+        "-t",
+    ),
+    insert_order: approach.InsertOrder = typer.Option(
+        approach.InsertOrder.BALANCED,
+        "--insert-order",
+        "-o",
+    ),
+    fanout: int = typer.Option(
+        constants.DEFAULT_FANOUT,
+        "--fanout",
+        min=4,
+        help="Largest number of entries in a B+-tree node",
+    ),
+    size: int = typer.Option(
+        constants.DEFAULT_START_SIZE, "--size", min=1, help="Dataset size"
+    ),
+    seed: Optional[int] = typer.Option(
+        None, "--seed", help="Seed that makes datasets and targets repeat"
+    ),
+    cache_directory: str = typer.Option(
+        constants.DEFAULT_CACHE_DIRECTORY,
+        "--cache-dir",
+        help="Directory that keeps seeded datasets between runs",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always generate datasets from scratch"
+    ),
+    host: str = typer.Option(constants.DEFAULT_HOST, "--host"),
+    port: Optional[int] = typer.Option(None, "--port"),
+    unix_socket: Optional[str] = typer.Option(
+        None, "--unix-socket", help="Listen on a Unix socket instead of TCP"
+    ),
+):
+    """Serve lookups in one dataset over a local socket."""
+    use_cache = seed is not None and not no_cache
+    configuration = Configuration(
+        data_structure=data_structure,
+        search_algorithm=search_algorithm,
+        data_type=data_type,
+        insert_order=insert_order,
+        fanout=fanout,
+        seed=seed,
+        cache_directory=cache_directory if use_cache else None,
+    )
+    error = validate_throughput(configuration)
+    if error is not None:
+        console.print(f"[bold red]Error: {error}![/bold red]")
+        return
+
+    # a load generator needs the seed to draw keys from the same dataset
+    configuration = seeded(configuration)
+    # shuffles and treap priorities use Python's generator
+    random.seed(f"{configuration.seed}:{size}")
+    address = _address(host, port, unix_socket)
+    search_func = load_search(configuration, size)
+    console.print(
+        f"Serving {search_algorithm} in a {data_structure} of {size} "
+        f"{data_type} on {address}"
+    )
+    console.print(f"Seed: {configuration.seed}")
+    try:
+        asyncio.run(serve_lookups(search_func, address))
+    except KeyboardInterrupt:
+        console.print("Stopped")
+
+
+@cli.command()
+def load(
+    data_structure: approach.DataStructure = typer.Option(
+        approach.DataStructure.SORTED_LIST,
+        "--data-structure",
+        "-d",
+    ),
+    search_algorithm: approach.SearchAlgorithm = typer.Option(
+        approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+        "--search-algorithm",
+        "-s",
+    ),
+    data_type: approach.DataType = typer.Option(
+        approach.DataType.INTEGERS,
+        "--data-type",
+        "-t",
+    ),
+    target_position: approach.TargetPosition = typer.Option(
+        approach.TargetPosition.RANDOM,
+        "--target-position",
+        "-p",
+    ),
+    zipf_exponent: float = typer.Option(
+        constants.DEFAULT_ZIPF_EXPONENT,
+        "--zipf-exponent",
+        min=0.0,
+        help="Skew of Zipf targets, from 0 for uniform to above 1 for heavy",
+    ),
+    insert_order: approach.InsertOrder = typer.Option(
+        approach.InsertOrder.BALANCED,
+        "--insert-order",
+        "-o",
+    ),
+    fanout: int = typer.Option(
+        constants.DEFAULT_FANOUT,
+        "--fanout",
+        min=4,
+        help="Largest number of entries in a B+-tree node",
+    ),
+    size: int = typer.Option(
+        constants.DEFAULT_START_SIZE, "--size", min=1, help="Dataset size"
+    ),
+    searches: int = typer.Option(
+        constants.DEFAULT_SEARCHES,
+        "--searches",
+        min=1,
+        help="Distinct keys that the requests cycle through",
+    ),
+    batch_size: int = typer.Option(
+        constants.DEFAULT_REQUEST_BATCH,
+        "--batch-size",
+        min=1,
+        help="Keys in every request",
+    ),
+    connections: int = typer.Option(
+        constants.DEFAULT_CONNECTIONS, "--connections", min=1
+    ),
+    pipeline: int = typer.Option(
+        constants.DEFAULT_PIPELINE,
+        "--pipeline",
+        min=1,
+        help="Requests in flight on each closed-loop connection",
+    ),
+    rate: Optional[float] = typer.Option(
+        None,
+        "--rate",
+        min=1.0,
+        help="Offer requests per second in an open loop instead",
+    ),
+    find_max: bool = typer.Option(
+        False,
+        "--find-max",
+        help="Raise the offered rate until the server falls behind",
+    ),
+    duration: float = typer.Option(
+        constants.DEFAULT_DURATION,
+        "--duration",
+        min=0.0,
+        help="Seconds that every load level runs",
+    ),
+    seed: Optional[int] = typer.Option(
+        None, "--seed", help="Seed that makes datasets and targets repeat"
+    ),
+    cache_directory: str = typer.Option(
+        constants.DEFAULT_CACHE_DIRECTORY,
+        "--cache-dir",
+        help="Directory that keeps seeded datasets between runs",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always generate datasets from scratch"
+    ),
+    host: str = typer.Option(constants.DEFAULT_HOST, "--host"),
+    port: Optional[int] = typer.Option(
+        None, "--port", help="Port of a running server"
+    ),
+    unix_socket: Optional[str] = typer.Option(
+        None, "--unix-socket", help="Unix socket of a running server"
+    ),
+):
+    """Drive a lookup server with load and report its latency and QPS.
+
+    Without --port or --unix-socket, a server with the same options is
+    started in a child process for the duration of the run.
+    """
+    use_cache = seed is not None and not no_cache
+    configuration = Configuration(
+        data_structure=data_structure,
+        search_algorithm=search_algorithm,
+        data_type=data_type,
+        target_position=target_position,
+        zipf_exponent=zipf_exponent,
+        insert_order=insert_order,
+        fanout=fanout,
+        searches=searches,
+        seed=seed,
+        cache_directory=cache_directory if use_cache else None,
+    )
+    error = validate_throughput(configuration)
+    if error is not None:
+        console.print(f"[bold red]Error: {error}![/bold red]")
+        return
+
+    local = port is None and unix_socket is None
+    if not local and seed is None:
+        # keys drawn from another dataset than the server's all miss
         console.print(
-            "[bold red]Error: BST search requires binary tree![/bold red]"
+            "[bold red]Error: Load against a running server requires the "
+            "seed that it prints![/bold red]"
         )
         return
+    if local:
+        # the local server and the keys must come from the same dataset
+        configuration = seeded(configuration)
+    if configuration.seed is not None:
+        random.seed(f"{configuration.seed}:{size}")
+    keys = load_keys(configuration, size)
 
-    # Initialize benchmarking variables
-    size = start_size
-    times = []
-    sizes = []
-
-    for run in range(1, runs + 1):
-        # Generate dataset
-        needs_sorted = (
-            data_structure == approach.DataStructure.SORTED_LIST
-            or search_algorithm
-            in [
-                approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
-                approach.SearchAlgorithm.BINARY_SEARCH_RECURSIVE,
-            ]
-        )
-
-        dataset = generate_dataset(size, data_type, sorted_data=needs_sorted)
-
-        # Generate BST if needed
-        bst = None
-        if data_structure == approach.DataStructure.BINARY_SEARCH_TREE:
-            bst = generate_binary_search_tree(dataset)
-
-        # Select targets
-        targets = select_targets(dataset, target_position, searches, data_type)
-
-        # Select search function
-        if search_algorithm == approach.SearchAlgorithm.LINEAR_SEARCH:
-            search_func = linear_search
-        elif (
-            search_algorithm
-            == approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE
-        ):
-            search_func = binary_search_iterative
-        elif (
-            search_algorithm
-            == approach.SearchAlgorithm.BINARY_SEARCH_RECURSIVE
-        ):
-            search_func = binary_search_recursive
-        else:
-            search_func = bst.search
-
-        # Benchmark execution
-        def perform_searches():
-            for target in targets:
-                if data_structure == approach.DataStructure.BINARY_SEARCH_TREE:
-                    search_func(target)
-                else:
-                    search_func(dataset, target)
+    console.print("\n[bold blue]Search Algorithm Lookup Service[/bold blue]\n")
+    console.print(f"Data structure: {data_structure}")
+    console.print(f"Search algorithm: {search_algorithm}")
+    console.print(f"Data type: {data_type}")
+    console.print(f"Dataset size: {size}")
+    console.print(
+        f"Requests of {batch_size} keys over {connections} connections"
+    )
+    console.print(f"Seed: {configuration.seed}\n")
 
-        elapsed_time = benchmark(perform_searches)
-        times.append(elapsed_time)
-        sizes.append(size)
+    def report(label: str, result: LoadResult) -> None:
+        p50, p99, p999 = result.percentiles()
+        console.print(
+            f"{label:<26} {result.requests:9d} {result.qps:12.0f} "
+            f"{p50 * 1e6:10.1f} {p99 * 1e6:10.1f} {p999 * 1e6:10.1f}"
+        )
 
-        # Display run results
+    async def drive(address: Address) -> None:
         console.print(
-            f"Run {run:2d}/{runs}: {search_algorithm} on {data_structure} "
-            f"(size {size:8d}) completed in "
-            f"{elapsed_time:.{constants.DECIMAL_PLACES}f} seconds"
+            f"{'load':<26} {'requests':>9} {'lookups/s':>12} "
+            f"{'p50 µs':>10} {'p99 µs':>10} {'p99.9 µs':>10}"
+        )
+        if rate is not None:
+            result = await open_loop(
+                address, keys, batch_size, duration, connections, rate
+            )
+            report(f"open {rate:.0f} req/s", result)
+        else:
+            result = await closed_loop(
+                address, keys, batch_size, duration, connections, pipeline
+            )
+            report(f"closed {connections}x{pipeline}", result)
+        if not find_max:
+            return
+        # start below what the closed loop managed, so the first rate holds
+        start_rate = result.qps / batch_size / 2
+        best, probes = await find_sustained_rate(
+            address, keys, batch_size, duration, connections, start_rate
         )
+        for probe in probes:
+            mark = "" if probe.sustained else " (behind)"
+            report(f"open {probe.offered_rate:.0f} req/s{mark}", probe)
+        if best is None:
+            console.print("No offered rate was sustained")
+        else:
+            console.print(f"Maximum sustained QPS: {best.qps:.0f} lookups/s")
 
-        size *= constants.DOUBLING_FACTOR
+    if local:
+        with LocalServer(configuration, size) as server:
+            asyncio.run(drive(server.address))
+    else:
+        asyncio.run(drive(_address(host, port, unix_socket)))
 
-    # Calculate statistics
-    min_time = min(times)
-    max_time = max(times)
-    avg_time = sum(times) / len(times)
-    median_time = statistics.median(times)
 
-    console.print("\n[bold green]Benchmark Summary:[/bold green]")
+@cli.command()
+def compare(
+    baseline: Path = typer.Argument(
+        ..., exists=True, dir_okay=False, help="Saved baseline results"
+    ),
+    current: Path = typer.Argument(
+        ..., exists=True, dir_okay=False, help="New results to check"
+    ),
+    threshold: float = typer.Option(
+        constants.DEFAULT_REGRESSION_THRESHOLD,
+        "--threshold",
+        min=0.0,
+        help="Relative slowdown, such as 0.05 for 5%, that fails the check",
+    ),
+):
+    """Check new results against a baseline and fail on regressions."""
+    comparisons = compare_results(
+        read_results(baseline), read_results(current), threshold
+    )
+    if not comparisons:
+        console.print(
+            "[bold red]Error: No run appears in both files![/bold red]"
+        )
+        raise typer.Exit(code=2)
+
     console.print(
-        f"Minimum time: {min_time:.{constants.DECIMAL_PLACES}f}s (size {sizes[times.index(min_time)]})"
+        f"{'run':<70} {'baseline':>10} {'current':>10} {'change':>8} {'t':>7}"
     )
+    for comparison in comparisons:
+        if comparison.regression:
+            verdict = "[bold red]slower[/bold red]"
+        elif comparison.significant:
+            verdict = (
+                "faster"
+                if comparison.statistic < 0
+                else "slower, within threshold"
+            )
+        else:
+            verdict = "no significant change"
+        console.print(
+            f"{comparison.describe():<70} {_seconds(comparison.baseline):>10} "
+            f"{_seconds(comparison.current):>10} "
+            f"{comparison.change:+8.1%} {comparison.statistic:7.2f} {verdict}"
+        )
+
+    regressions = [
+        comparison for comparison in comparisons if comparison.regression
+    ]
+    if regressions:
+        console.print(
+            f"\n[bold red]{len(regressions)} of {len(comparisons)} runs are "
+            f"significantly slower by more than {threshold:.0%}[/bold red]"
+        )
+        raise typer.Exit(code=1)
     console.print(
-        f"Maximum time: {max_time:.{constants.DECIMAL_PLACES}f}s (size {sizes[times.index(max_time)]})"
+        f"\n[bold green]No regression in {len(comparisons)} runs[/bold green]"
     )
-    console.print(f"Average time: {avg_time:.{constants.DECIMAL_PLACES}f}s")
-    console.print(f"Median time:  {median_time:.{constants.DECIMAL_PLACES}f}s")
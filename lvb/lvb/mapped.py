@@ -0,0 +1,239 @@
+"""Search a dataset kept in a memory-mapped file instead of the heap."""
+
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from lvb.approach import DataType
+from lvb.cache import CACHE_SUFFIX, DatasetCache
+from lvb.constants import constants
+from lvb.generate import create_generator, fill_values, value_dtype
+
+# readers of the NumPy file header for each format version
+HEADER_READERS = {
+    (1, 0): np.lib.format.read_array_header_1_0,
+    (2, 0): np.lib.format.read_array_header_2_0,
+}
+
+
+class MappedDataset:
+    """Fixed-width values in a NumPy file that is mapped into memory.
+
+    The operating system pages the file in on demand, so a dataset can be
+    larger than physical memory. Every search counts the pages it touches
+    and the bytes it reads, so lookups can be compared on I/O as well as
+    on time.
+    """
+
+    def __init__(self, path: Union[str, Path], delete: bool = False):
+        self.path = Path(path)
+        self.delete = delete
+        self._file = self.path.open("rb")
+        version = np.lib.format.read_magic(self._file)
+        if version not in HEADER_READERS:
+            self._file.close()
+            raise ValueError(f"Unsupported NumPy file version: {version}")
+        shape, _, dtype = HEADER_READERS[version](self._file)
+        self.offset = self._file.tell()
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.values = np.frombuffer(
+            self._map, dtype=dtype, count=shape[0], offset=self.offset
+        )
+        self.itemsize = dtype.itemsize
+        self.lookups = 0
+        self.pages_touched = 0
+        self.bytes_read = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the file."""
+        return len(self.values)
+
+    def __enter__(self) -> "MappedDataset":
+        """Return the dataset for use in a with statement."""
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Unmap the file when the with statement ends."""
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file, and delete it if it was only temporary."""
+        # the array exports the mapping, so it must go before the mapping
+        self.values = np.empty(0, dtype=self.values.dtype)
+        self._map.close()
+        self._file.close()
+        if self.delete:
+            self.path.unlink(missing_ok=True)
+
+    def reset_counters(self) -> None:
+        """Forget the lookups, pages and bytes counted so far."""
+        self.lookups = 0
+        self.pages_touched = 0
+        self.bytes_read = 0
+
+    def evict_pages(self) -> bool:
+        """Ask the operating system to drop the cached pages of the file.
+
+        The next lookups then read from disk, as they would on a cold page
+        cache. This is advice, so a page that another process keeps mapped
+        may stay in memory.
+
+        Returns:
+            bool: True if the page cache of the file could be advised
+        """
+        if hasattr(mmap, "MADV_DONTNEED"):
+            self._map.madvise(mmap.MADV_DONTNEED)
+        if not hasattr(os, "posix_fadvise"):
+            return False
+        os.posix_fadvise(self._file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        return True
+
+    def _encode(self, target: Any) -> Any:
+        """Convert a target into the stored form of the values."""
+        if isinstance(target, str) and self.values.dtype.kind == "S":
+            return target.encode("ascii")
+        return target
+
+    def _pages(self, start: int, stop: int) -> int:
+        """Return the number of pages that hold values start to stop - 1."""
+        if stop <= start:
+            return 0
+        first = (self.offset + start * self.itemsize) // mmap.PAGESIZE
+        last = (self.offset + stop * self.itemsize - 1) // mmap.PAGESIZE
+        return last - first + 1
+
+    def binary_search(self, target: Any) -> Optional[int]:
+        """Binary search the sorted values directly in the mapped pages.
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            int: Index of the target element, or None if not found
+        """
+        target = self._encode(target)
+        values = self.values
+        offset = self.offset
+        itemsize = self.itemsize
+        pages = set()
+        probes = 0
+        left, right = 0, len(values) - 1
+        found = None
+        while left <= right:
+            mid = (left + right) // 2
+            probes += 1
+            start = offset + mid * itemsize
+            pages.add(start // mmap.PAGESIZE)
+            pages.add((start + itemsize - 1) // mmap.PAGESIZE)
+            value = values[mid]
+            if value == target:
+                found = mid
+                break
+            if value < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+        self.lookups += 1
+        self.pages_touched += len(pages)
+        self.bytes_read += probes * itemsize
+        return found
+
+    def linear_search(self, target: Any) -> Optional[int]:
+        """Scan the values in fixed-size blocks until the target is found.
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            int: Index of the target element, or None if not found
+        """
+        target = self._encode(target)
+        values = self.values
+        block = constants.MAPPED_SCAN_BLOCK
+        found = None
+        stop = len(values)
+        for start in range(0, len(values), block):
+            matches = np.flatnonzero(values[start : start + block] == target)
+            if matches.size:
+                found = start + int(matches[0])
+                stop = min(start + block, len(values))
+                break
+        self.lookups += 1
+        self.pages_touched += self._pages(0, stop)
+        self.bytes_read += stop * self.itemsize
+        return found
+
+
+def _write_values(
+    path: Path,
+    size: int,
+    data_type: DataType,
+    sorted_data: bool,
+    seed: Optional[int],
+) -> None:
+    """Generate values straight into a NumPy file, never all on the heap.
+
+    Args:
+        path: File to write
+        size: Number of values to generate
+        data_type: Type of data to generate
+        sorted_data: Whether to sort the values
+        seed: Seed for reproducible values, or None for fresh entropy
+    """
+    values = np.lib.format.open_memmap(
+        path, mode="w+", dtype=value_dtype(data_type), shape=(size,)
+    )
+    fill_values(values, data_type, create_generator(seed, size))
+    if sorted_data:
+        # the sort runs in place, paging through the file as needed
+        values.sort()
+    values.flush()
+    del values
+
+
+def open_mapped_dataset(
+    size: int,
+    data_type: DataType,
+    sorted_data: bool = False,
+    seed: Optional[int] = None,
+    cache: Optional[DatasetCache] = None,
+) -> MappedDataset:
+    """Map a dataset from the cache, or generate it into a new file.
+
+    Args:
+        size: Size of the dataset
+        data_type: Type of data to generate
+        sorted_data: Whether to sort the dataset
+        seed: Seed for reproducible values, or None for fresh entropy
+        cache: Cache that keeps seeded datasets between runs
+
+    Returns:
+        MappedDataset: Mapped values, deleted on close unless cached
+    """
+    # the file of a seeded dataset is shared with the in-memory storage
+    if cache is not None and seed is not None:
+        path = cache.path(size, data_type, sorted_data, seed)
+        if cache.load(size, data_type, sorted_data, seed) is None:
+            path = cache.create(
+                size,
+                data_type,
+                sorted_data,
+                seed,
+                lambda path: _write_values(
+                    path, size, data_type, sorted_data, seed
+                ),
+            )
+        return MappedDataset(path)
+
+    descriptor, temporary = tempfile.mkstemp(suffix=CACHE_SUFFIX)
+    os.close(descriptor)
+    try:
+        _write_values(Path(temporary), size, data_type, sorted_data, seed)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+    return MappedDataset(temporary, delete=True)
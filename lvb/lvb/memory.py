@@ -0,0 +1,144 @@
+"""Measure how much memory a structure takes to build, hold and search."""
+
+import gc
+import mmap
+import sys
+import tracemalloc
+from collections import deque
+from pathlib import Path
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+# objects that belong to the program rather than to the data it holds
+SHARED_TYPES = (
+    type,
+    ModuleType,
+    FunctionType,
+    BuiltinFunctionType,
+    MethodType,
+)
+
+# pages of the process that are resident, read from the second statm field
+STATM = Path("/proc/self/statm")
+
+
+def current_rss() -> Optional[int]:
+    """Return the resident set size of this process in bytes, if known."""
+    try:
+        resident = int(STATM.read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident * mmap.PAGESIZE
+
+
+def _slot_values(obj: Any) -> Any:
+    """Yield the values held in the slots of an object."""
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                yield getattr(obj, name)
+
+
+def deep_size(root: Any) -> int:
+    """Add up the size of an object and of everything it refers to.
+
+    Containers, instance dictionaries and slots are followed, and every
+    object is counted once however often it is referred to. Classes,
+    modules and functions are shared with the program and not counted,
+    and objects inside C extensions are invisible to `sys.getsizeof`.
+
+    Args:
+        root: Object to measure
+
+    Returns:
+        int: Size in bytes
+    """
+    seen = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend(obj)
+        elif isinstance(obj, np.ndarray):
+            # a view owns no data, but keeps the array that does alive
+            if obj.base is not None:
+                stack.append(obj.base)
+        else:
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+            stack.extend(_slot_values(obj))
+    return total
+
+
+def measure_memory(
+    build: Callable[[], Any],
+    size: int,
+    search_all: Optional[Callable[[], Any]] = None,
+) -> Dict[str, Any]:
+    """Measure the footprint of a structure and the memory its use takes.
+
+    The structure is built twice: once with only the resident set size
+    watched, since tracing every allocation slows the build and inflates
+    the process, and once under `tracemalloc` for its peak and retained
+    bytes. The searches then run once more under `tracemalloc`.
+
+    Args:
+        build: Function that builds the structure from the dataset
+        size: Number of keys in the dataset
+        search_all: Function that searches for every target once
+
+    Returns:
+        Dict: Deep size, bytes per key, build peak, retained bytes, RSS
+        growth and, if there are searches, their peak and retained blocks
+    """
+    gc.collect()
+    rss_before = current_rss()
+    structure = build()
+    rss_after = current_rss()
+    deep = deep_size(structure)
+    details: Dict[str, Any] = {
+        "deep_size": deep,
+        "deep_bytes_per_key": deep / max(1, size),
+    }
+    if rss_before is not None and rss_after is not None:
+        details["rss_delta"] = rss_after - rss_before
+    del structure
+    gc.collect()
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        structure = build()
+        retained, peak = tracemalloc.get_traced_memory()
+        details["build_peak"] = peak - start
+        details["build_retained"] = retained - start
+        del structure
+        if search_all is not None:
+            gc.collect()
+            start, _ = tracemalloc.get_traced_memory()
+            blocks = sys.getallocatedblocks()
+            tracemalloc.reset_peak()
+            search_all()
+            _, peak = tracemalloc.get_traced_memory()
+            details["search_peak"] = peak - start
+            details["search_blocks"] = sys.getallocatedblocks() - blocks
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return details
@@ -0,0 +1,158 @@
+"""Fixed-width string keys packed end to end in one byte buffer."""
+
+import sys
+from typing import Any, Iterator, Optional, Union
+
+import numpy as np
+
+
+class PackedStrings:
+    """Sequence of fixed-width ASCII keys stored in a single byte buffer.
+
+    A list of strings holds a separate object of about 50 bytes for every
+    key, each at its own heap address. Here the key at index i is the
+    `width` bytes starting at i * width, so neighbouring keys share cache
+    lines and the whole dataset costs one byte per character. Keys shorter
+    than the width are padded with NUL bytes, as in a NumPy "S" array.
+
+    The linear and binary searches run in C over the buffer itself, with
+    `find` and `bisect`, so no object is made for a key that they pass
+    over. Reading a key with an index slices it out as one short object,
+    which is how the other list searches run over the keys unchanged with
+    bytes targets. A dataset is an immutable `bytes` buffer, and a layout
+    that is filled in place a `bytearray`.
+    """
+
+    __slots__ = ("buffer", "width")
+
+    def __init__(self, buffer: Union[bytes, bytearray], width: int):
+        self.buffer = buffer
+        self.width = width
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> "PackedStrings":
+        """Copy the keys of a NumPy "S" array into a packed buffer.
+
+        Args:
+            values: Fixed-width byte strings, possibly memory-mapped
+
+        Returns:
+            PackedStrings: Keys in the same order as the array
+        """
+        if values.dtype.kind != "S":
+            raise ValueError(f"Cannot pack values of type {values.dtype}")
+        return cls(values.tobytes(), values.dtype.itemsize)
+
+    @classmethod
+    def empty(cls, size: int, width: int) -> "PackedStrings":
+        """Allocate room for a number of keys, all of them empty."""
+        return cls(bytearray(size * width), width)
+
+    def __len__(self) -> int:
+        """Return the number of keys in the buffer."""
+        return len(self.buffer) // self.width
+
+    def __getitem__(self, index: int) -> bytes:
+        """Return the key at an index, padded to the full width."""
+        if index < 0:
+            index += len(self)
+        start = index * self.width
+        if not 0 <= start < len(self.buffer):
+            raise IndexError("packed key index out of range")
+        return self.buffer[start : start + self.width]
+
+    def __setitem__(self, index: int, key: bytes) -> None:
+        """Overwrite the key at an index with a key of at most the width."""
+        if len(key) > self.width:
+            raise ValueError(f"Key is longer than {self.width} bytes")
+        start = index * self.width
+        self.buffer[start : start + self.width] = key.ljust(self.width, b"\0")
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield every key in order."""
+        buffer = self.buffer
+        width = self.width
+        for start in range(0, len(buffer), width):
+            yield buffer[start : start + width]
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        """Expose the buffer to NumPy as an "S" array, without copying."""
+        values = np.frombuffer(self.buffer, dtype=f"S{self.width}")
+        return values if dtype is None else values.astype(dtype)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the keys, excluding the buffer header."""
+        return len(self.buffer)
+
+    def copy(self) -> "PackedStrings":
+        """Return a copy of the keys in a buffer of their own."""
+        return PackedStrings(bytes(memoryview(self.buffer)), self.width)
+
+    def encode(self, target: Any) -> bytes:
+        """Convert a string into the padded form of the stored keys.
+
+        A key longer than the width stays longer, and so compares greater
+        than every stored key that it starts with, as the string would.
+        """
+        if isinstance(target, str):
+            target = target.encode("ascii")
+        return target.ljust(self.width, b"\0")
+
+    def find(self, target: bytes) -> Optional[int]:
+        """Scan the buffer for a key and return its index.
+
+        `bytearray.find` scans in C and compares in place, so no object is
+        made for the keys passed over. A match that straddles two keys is
+        skipped by resuming the scan at the next key boundary.
+
+        A target longer than the width equals no stored key, but the scan
+        still looks for its first `width` bytes, so a search for a missing
+        key does the work of a linear search that finds nothing, rather
+        than returning at once.
+
+        Args:
+            target: Key in its padded form, as returned by `encode`
+
+        Returns:
+            int: Index of the first equal key, or None if not found
+        """
+        buffer = self.buffer
+        width = self.width
+        key = target[:width]
+        start = buffer.find(key)
+        while start >= 0:
+            offset = start % width
+            if offset == 0:
+                return start // width if len(target) == width else None
+            start = buffer.find(key, start + width - offset)
+        return None
+
+    def bisect(self, target: bytes) -> Optional[int]:
+        """Binary search sorted keys for a key and return its index.
+
+        NumPy's `searchsorted` bisects a view of the buffer and compares
+        the keys where they lie, so a probe neither calls back into Python
+        nor allocates. Only the key that it lands on is checked, once, for
+        an exact match, since NumPy pads the shorter of two keys with NUL
+        bytes and a longer target would otherwise match its prefix.
+
+        Args:
+            target: Key in its padded form, as returned by `encode`
+
+        Returns:
+            int: Index of the first equal key, or None if not found
+        """
+        keys = np.frombuffer(self.buffer, dtype=f"S{self.width}")
+        index = int(keys.searchsorted(target))
+        start = index * self.width
+        if self.buffer[start : start + self.width] != target:
+            return None
+        return index
+
+
+def layout_nbytes(layout: Any) -> int:
+    """Return the bytes a layout takes, counting packed keys in full."""
+    if isinstance(layout, PackedStrings):
+        return sys.getsizeof(layout) + sys.getsizeof(layout.buffer)
+    return sys.getsizeof(layout)
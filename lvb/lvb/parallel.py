@@ -0,0 +1,221 @@
+"""Run independent benchmark runs in a pool of worker processes."""
+
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from types import TracebackType
+from typing import Any, Iterator, List, Optional, Sequence, Type
+
+import numpy as np
+
+from lvb.approach import DataType
+from lvb.experiment import Configuration, RunResult, benchmark_dataset
+from lvb.generate import generate_array, select_array_targets, to_list
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """Class to store where a worker finds an array in shared memory."""
+
+    name: str
+    dtype: str
+    length: int
+
+    def read(self, data_type: DataType) -> List[Any]:
+        """Copy the shared values into a list of Python objects.
+
+        Args:
+            data_type: Type of data in the array
+
+        Returns:
+            List: Values of the array
+        """
+        memory = shared_memory.SharedMemory(name=self.name)
+        try:
+            values = np.ndarray(
+                (self.length,), dtype=np.dtype(self.dtype), buffer=memory.buf
+            )
+            dataset = to_list(values, data_type)
+            # the view exports the buffer, so it must go before closing
+            del values
+        finally:
+            memory.close()
+        return dataset
+
+
+class SharedArrays:
+    """Own the shared memory blocks of a pool, and free them on exit."""
+
+    def __init__(self):
+        self.blocks: List[shared_memory.SharedMemory] = []
+
+    def share(self, values: np.ndarray) -> SharedArray:
+        """Copy an array into a new block of shared memory.
+
+        Args:
+            values: Array to share
+
+        Returns:
+            SharedArray: Where a worker finds the copy
+        """
+        # a block cannot be empty, even for an empty dataset
+        memory = shared_memory.SharedMemory(
+            create=True, size=max(1, values.nbytes)
+        )
+        self.blocks.append(memory)
+        shared = np.ndarray(
+            values.shape, dtype=values.dtype, buffer=memory.buf
+        )
+        shared[:] = values
+        del shared
+        return SharedArray(memory.name, values.dtype.str, len(values))
+
+    def __enter__(self) -> "SharedArrays":
+        """Return the owner for use in a with statement."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close and remove every block of shared memory."""
+        for memory in self.blocks:
+            memory.close()
+            memory.unlink()
+        self.blocks.clear()
+
+
+@dataclass(frozen=True)
+class RunTask:
+    """Class to store one independent run for a worker process."""
+
+    configuration: Configuration
+    dataset: SharedArray
+    targets: List[Any]
+
+
+def run_task(task: RunTask) -> RunResult:
+    """Benchmark a shared dataset in a worker process.
+
+    Args:
+        task: Run to perform
+
+    Returns:
+        RunResult: Timings and build statistics of the run
+    """
+    configuration = task.configuration
+    if configuration.seed is not None:
+        # shuffles and treap priorities use Python's generator
+        random.seed(f"{configuration.seed}:{task.dataset.length}")
+    dataset = task.dataset.read(configuration.data_type)
+    return benchmark_dataset(configuration, dataset, task.targets)
+
+
+def available_cpus() -> List[int]:
+    """Return the CPUs that this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_worker(cpus: Sequence[int], counter: Any) -> None:
+    """Pin a starting worker to the next CPU, so workers do not share one."""
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+
+def run_tasks(
+    tasks: Sequence[RunTask], jobs: int, pin_cpus: bool = False
+) -> Iterator[RunResult]:
+    """Run tasks in a pool of processes and yield results in task order.
+
+    Args:
+        tasks: Independent runs to perform
+        jobs: Number of worker processes
+        pin_cpus: Whether to pin every worker to a CPU of its own
+
+    Yields:
+        RunResult: Result of each task, in the order of the tasks
+
+    Raises:
+        ValueError: If pinning is requested where it is not supported
+    """
+    # a fresh interpreter per worker inherits no state from the parent
+    context = multiprocessing.get_context("spawn")
+    initializer = None
+    initargs: tuple = ()
+    if pin_cpus:
+        if not hasattr(os, "sched_setaffinity"):
+            raise ValueError(
+                "Pinning workers to CPUs requires os.sched_setaffinity."
+            )
+        initializer = _pin_worker
+        initargs = (available_cpus(), context.Value("i", 0))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        futures = [executor.submit(run_task, task) for task in tasks]
+        for future in futures:
+            yield future.result()
+
+
+def run_parallel(
+    configuration: Configuration,
+    sizes: Sequence[int],
+    jobs: int,
+    pin_cpus: bool = False,
+) -> Iterator[RunResult]:
+    """Run one configuration at every size in a pool of processes.
+
+    The datasets are generated here and copied once into shared memory,
+    so the workers never unpickle a list of millions of values.
+
+    Args:
+        configuration: Benchmark to run
+        sizes: Dataset sizes to run it at
+        jobs: Number of worker processes
+        pin_cpus: Whether to pin every worker to a CPU of its own
+
+    Yields:
+        RunResult: Result of each size, in the order of the sizes
+    """
+    cache = configuration.dataset_cache()
+    with SharedArrays() as shared:
+        tasks = []
+        generate_times = []
+        for size in sizes:
+            if configuration.seed is not None:
+                # targets are drawn as a serial run draws them
+                random.seed(f"{configuration.seed}:{size}")
+            generate_start = time.perf_counter()
+            values = generate_array(
+                size,
+                configuration.data_type,
+                configuration.needs_sorted,
+                configuration.seed,
+                cache,
+            )
+            generate_times.append(time.perf_counter() - generate_start)
+            targets = select_array_targets(
+                values,
+                configuration.target_position,
+                configuration.searches,
+                configuration.data_type,
+                configuration.zipf_exponent,
+            )
+            tasks.append(RunTask(configuration, shared.share(values), targets))
+        results = run_tasks(tasks, jobs, pin_cpus)
+        for generate_time, result in zip(generate_times, results):
+            result.details["generate_time"] = generate_time
+            yield result
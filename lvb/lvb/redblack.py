@@ -0,0 +1,209 @@
+"""Red-black tree implementation that rebalances on every write."""
+
+from typing import Any, Optional
+
+
+class RedBlackNode:
+    """Creates the node class for the red-black tree."""
+
+    __slots__ = ("data", "l_child", "parent", "r_child", "red")
+
+    def __init__(self, value, parent=None):
+        self.l_child: Optional[RedBlackNode] = None
+        self.r_child: Optional[RedBlackNode] = None
+        self.parent: Optional[RedBlackNode] = parent
+        self.data = value
+        self.red = True
+
+
+def _is_red(node: Optional[RedBlackNode]) -> bool:
+    """Return if a node is red, counting an empty leaf as black."""
+    return node is not None and node.red
+
+
+class RedBlackTree:
+    """Binary search tree kept balanced by red-black colouring."""
+
+    def __init__(self):
+        self.root: Optional[RedBlackNode] = None
+        self.rotations = 0
+
+    def _replace_child(self, node: RedBlackNode, child: RedBlackNode):
+        """Attach a child in the place that a node held in its parent."""
+        parent = node.parent
+        child.parent = parent
+        if parent is None:
+            self.root = child
+        elif parent.l_child is node:
+            parent.l_child = child
+        else:
+            parent.r_child = child
+
+    def _rotate_left(self, node: RedBlackNode) -> None:
+        """Rotate the subtree rooted at a node to the left."""
+        pivot = node.r_child
+        node.r_child = pivot.l_child
+        if pivot.l_child is not None:
+            pivot.l_child.parent = node
+        self._replace_child(node, pivot)
+        pivot.l_child = node
+        node.parent = pivot
+        self.rotations += 1
+
+    def _rotate_right(self, node: RedBlackNode) -> None:
+        """Rotate the subtree rooted at a node to the right."""
+        pivot = node.l_child
+        node.l_child = pivot.r_child
+        if pivot.r_child is not None:
+            pivot.r_child.parent = node
+        self._replace_child(node, pivot)
+        pivot.r_child = node
+        node.parent = pivot
+        self.rotations += 1
+
+    def insert(self, value: Any) -> None:
+        """Inserts the value into the tree and restores the colouring."""
+        if self.root is None:
+            self.root = RedBlackNode(value)
+            self.root.red = False
+            return
+        parent = self.root
+        while True:
+            if value < parent.data:
+                if parent.l_child is None:
+                    node = parent.l_child = RedBlackNode(value, parent)
+                    break
+                parent = parent.l_child
+            else:
+                if parent.r_child is None:
+                    node = parent.r_child = RedBlackNode(value, parent)
+                    break
+                parent = parent.r_child
+        self._fix_insert(node)
+
+    def _fix_insert(self, node: RedBlackNode) -> None:
+        """Remove a red-red violation introduced by an insert."""
+        while node.parent is not None and node.parent.red:
+            parent = node.parent
+            grandparent = parent.parent
+            if parent is grandparent.l_child:
+                uncle = grandparent.r_child
+                if uncle is not None and uncle.red:
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+                if node is parent.r_child:
+                    self._rotate_left(parent)
+                    node, parent = parent, node
+                self._rotate_right(grandparent)
+            else:
+                uncle = grandparent.l_child
+                if uncle is not None and uncle.red:
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+                if node is parent.l_child:
+                    self._rotate_right(parent)
+                    node, parent = parent, node
+                self._rotate_left(grandparent)
+            parent.red = False
+            grandparent.red = True
+        self.root.red = False
+
+    def delete(self, value: Any) -> bool:
+        """Deletes one copy of the value and restores the colouring."""
+        node = self.root
+        while node is not None and node.data != value:
+            node = node.l_child if value < node.data else node.r_child
+        if node is None:
+            return False
+        if node.l_child is not None and node.r_child is not None:
+            # take the smallest value on the right, and unlink its node
+            successor = node.r_child
+            while successor.l_child is not None:
+                successor = successor.l_child
+            node.data = successor.data
+            node = successor
+        child = node.l_child if node.l_child is not None else node.r_child
+        parent = node.parent
+        if child is not None:
+            self._replace_child(node, child)
+        elif parent is None:
+            self.root = None
+        elif parent.l_child is node:
+            parent.l_child = None
+        else:
+            parent.r_child = None
+        if not node.red:
+            # the only child of a black node is red, and takes its colour
+            if child is not None:
+                child.red = False
+            else:
+                self._fix_delete(parent)
+        return True
+
+    def _fix_delete(self, parent: Optional[RedBlackNode]) -> None:
+        """Restore the black height of a path that lost a black leaf.
+
+        The path runs through the empty child of `parent`, or through
+        `node` once the shortage moves up the tree, and is one black node
+        short of every other path.
+        """
+        node: Optional[RedBlackNode] = None
+        while node is not self.root and (node is None or not node.red):
+            if node is parent.l_child:
+                sibling = parent.r_child
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotate_left(parent)
+                    sibling = parent.r_child
+                if not _is_red(sibling.l_child) and not _is_red(
+                    sibling.r_child
+                ):
+                    sibling.red = True
+                    node, parent = parent, parent.parent
+                    continue
+                if not _is_red(sibling.r_child):
+                    sibling.l_child.red = False
+                    sibling.red = True
+                    self._rotate_right(sibling)
+                    sibling = parent.r_child
+                sibling.red = parent.red
+                parent.red = sibling.r_child.red = False
+                self._rotate_left(parent)
+            else:
+                sibling = parent.l_child
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotate_right(parent)
+                    sibling = parent.l_child
+                if not _is_red(sibling.l_child) and not _is_red(
+                    sibling.r_child
+                ):
+                    sibling.red = True
+                    node, parent = parent, parent.parent
+                    continue
+                if not _is_red(sibling.l_child):
+                    sibling.r_child.red = False
+                    sibling.red = True
+                    self._rotate_left(sibling)
+                    sibling = parent.l_child
+                sibling.red = parent.red
+                parent.red = sibling.l_child.red = False
+                self._rotate_right(parent)
+            node = self.root
+        if node is not None:
+            node.red = False
+
+    def search(self, target: Any) -> bool:
+        """Search for a value in the tree and return if found."""
+        node = self.root
+        while node is not None:
+            if node.data == target:
+                return True
+            node = node.l_child if target < node.data else node.r_child
+        return False
@@ -0,0 +1,45 @@
+"""Adapter exposing the bintrees balanced trees as a reference point."""
+
+from typing import Any, Callable
+
+from bintrees import FastAVLTree, FastRBTree, has_fast_tree_support
+
+
+class BintreesTree:
+    """Wrap a bintrees tree in the insert/search interface of the BST.
+
+    bintrees falls back to its pure Python trees when the Cython
+    extension is unavailable, which `fast` reports.
+    """
+
+    __slots__ = ("tree",)
+
+    fast = has_fast_tree_support()
+
+    def __init__(self, tree_class: Callable[[], Any]):
+        self.tree = tree_class()
+
+    @classmethod
+    def avl(cls) -> "BintreesTree":
+        """Create an empty tree backed by bintrees' FastAVLTree."""
+        return cls(FastAVLTree)
+
+    @classmethod
+    def red_black(cls) -> "BintreesTree":
+        """Create an empty tree backed by bintrees' FastRBTree."""
+        return cls(FastRBTree)
+
+    def insert(self, value: Any) -> None:
+        """Inserts the value into the tree, keeping one copy of duplicates."""
+        self.tree.insert(value, None)
+
+    def delete(self, value: Any) -> bool:
+        """Deletes the value and returns if it was found."""
+        if value not in self.tree:
+            return False
+        self.tree.remove(value)
+        return True
+
+    def search(self, target: Any) -> bool:
+        """Search for a value in the tree and return if found."""
+        return target in self.tree
@@ -0,0 +1,322 @@
+"""Save benchmark results to files and compare them against a baseline."""
+
+import csv
+import io
+import json
+import math
+import os
+import platform
+import statistics
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple, Union
+
+import numpy as np
+
+from lvb.approach import OutputFormat
+from lvb.benchmark import t_critical
+from lvb.constants import constants
+from lvb.experiment import Configuration, RunResult
+
+# configuration fields that change what is measured, so a baseline run and
+# a new run are comparable only if all of them agree
+IDENTITY_FIELDS = (
+    "data_structure",
+    "search_algorithm",
+    "data_type",
+    "target_position",
+    "zipf_exponent",
+    "insert_order",
+    "fanout",
+    "searches",
+    "batch",
+    "bloom_filter",
+    "false_positive_rate",
+    "lookup_cache",
+    "lookup_cache_capacity",
+    "storage",
+)
+
+# columns of a CSV file that hold a list or mapping encoded as JSON
+JSON_COLUMNS = ("times", "latencies", "details")
+
+
+def cpu_model() -> str:
+    """Return the name of the processor, as precisely as the OS tells it."""
+    cpuinfo = Path("/proc/cpuinfo")
+    if cpuinfo.exists():
+        for line in cpuinfo.read_text().splitlines():
+            if line.startswith("model name"):
+                return line.split(":", 1)[1].strip()
+    return platform.processor() or platform.machine()
+
+
+def environment(seed: Optional[int] = None) -> Dict[str, Any]:
+    """Describe the machine and interpreter that produced the results.
+
+    Args:
+        seed: Seed of the datasets and targets, if any
+
+    Returns:
+        Dict: Python version, CPU model, seed and other details
+    """
+    return {
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_model": cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "numpy_version": np.__version__,
+        "seed": seed,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def _plain(value: Any) -> Any:
+    """Turn enums and NumPy scalars into plain values that JSON can hold."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {str(key): _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def run_record(
+    configuration: Configuration, result: RunResult
+) -> Dict[str, Any]:
+    """Flatten one run into a record with its configuration and raw timings.
+
+    Args:
+        configuration: Configuration of the run
+        result: Outcome of the run
+
+    Returns:
+        Dict: Configuration fields, size, summary and raw timings
+    """
+    measurement = result.measurement
+    record = _plain(asdict(configuration))
+    record.update(
+        {
+            "size": result.size,
+            "mean": measurement.mean,
+            "stdev": measurement.stdev,
+            "margin": measurement.margin,
+            "minimum": measurement.minimum,
+            "number": measurement.number,
+            "overhead": measurement.overhead,
+            "times": list(measurement.times),
+            "latencies": list(result.latencies),
+            "details": _plain(result.details),
+        }
+    )
+    return record
+
+
+def write_results(
+    stream: TextIO,
+    output_format: OutputFormat,
+    records: Sequence[Dict[str, Any]],
+    environment: Dict[str, Any],
+) -> None:
+    """Write run records and their environment in the chosen format.
+
+    A JSON file holds one document, while every JSON line and CSV row
+    carries the environment with its run, so files can be concatenated.
+
+    Args:
+        stream: Text stream to write to
+        output_format: Format to write
+        records: Records of every run
+        environment: Description of the machine and interpreter
+    """
+    if output_format == OutputFormat.JSON:
+        json.dump(
+            {"environment": environment, "runs": list(records)},
+            stream,
+            indent=2,
+        )
+        stream.write("\n")
+        return
+    rows = [{**record, "environment": environment} for record in records]
+    if output_format == OutputFormat.JSONL:
+        for row in rows:
+            stream.write(json.dumps(row) + "\n")
+        return
+    if not rows:
+        return
+    writer = csv.DictWriter(stream, fieldnames=list(rows[0]))
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(
+            {
+                key: json.dumps(value)
+                if key in (*JSON_COLUMNS, "environment")
+                else value
+                for key, value in row.items()
+            }
+        )
+
+
+def save_results(
+    path: Union[str, Path],
+    output_format: OutputFormat,
+    records: Sequence[Dict[str, Any]],
+    environment: Dict[str, Any],
+) -> None:
+    """Write run records to a file, see `write_results`."""
+    with Path(path).open("w", newline="") as stream:
+        write_results(stream, output_format, records, environment)
+
+
+def _csv_value(key: str, text: str) -> Any:
+    """Decode one CSV cell back into the value that was written."""
+    if key in (*JSON_COLUMNS, "environment"):
+        return json.loads(text)
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            continue
+    return {"True": True, "False": False, "": None}.get(text, text)
+
+
+def read_results(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Read the run records of a results file in any of the formats.
+
+    Args:
+        path: File written by `save_results`
+
+    Returns:
+        List: Record of every run
+    """
+    text = Path(path).read_text()
+    stripped = text.lstrip()
+    if stripped.startswith("{"):
+        try:
+            document = json.loads(text)
+        except json.JSONDecodeError:
+            # JSON lines hold one document per line rather than one in all
+            return [json.loads(line) for line in text.splitlines() if line]
+        return document["runs"] if "runs" in document else [document]
+    return [
+        {key: _csv_value(key, value) for key, value in row.items()}
+        for row in csv.DictReader(io.StringIO(text))
+    ]
+
+
+def run_key(record: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return what identifies a run across results files."""
+    return (*(record.get(name) for name in IDENTITY_FIELDS), record["size"])
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Class to store how one run changed from the baseline."""
+
+    key: Tuple[Any, ...]
+    baseline: float
+    current: float
+    # Welch's t statistic of the change, positive when the run got slower
+    statistic: float
+    significant: bool
+    regression: bool
+
+    @property
+    def change(self) -> float:
+        """Return the relative change of the mean time."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+    def describe(self) -> str:
+        """Describe the run in words for a console message."""
+        values = dict(zip((*IDENTITY_FIELDS, "size"), self.key))
+        return (
+            f"{values['search_algorithm']} on {values['data_structure']} "
+            f"({values['data_type']}, {values['target_position']}, "
+            f"size {values['size']})"
+        )
+
+
+def welch_statistic(
+    baseline: Sequence[float], current: Sequence[float]
+) -> Tuple[float, float]:
+    """Compute Welch's t statistic and degrees of freedom of two samples.
+
+    Args:
+        baseline: Times per call of the baseline repeats
+        current: Times per call of the new repeats
+
+    Returns:
+        Tuple: Statistic, positive if the current mean is larger, and its
+        Welch-Satterthwaite degrees of freedom
+    """
+    difference = statistics.fmean(current) - statistics.fmean(baseline)
+    spreads = [
+        statistics.variance(sample) / len(sample) if len(sample) > 1 else 0.0
+        for sample in (baseline, current)
+    ]
+    error = math.sqrt(sum(spreads))
+    if error == 0:
+        # identical repeats leave no noise, so any difference is real
+        return math.copysign(math.inf, difference) if difference else 0.0, 1
+    degrees = sum(spreads) ** 2 / sum(
+        spread**2 / (len(sample) - 1)
+        for spread, sample in zip(spreads, (baseline, current))
+        if len(sample) > 1
+    )
+    return difference / error, degrees
+
+
+def compare_results(
+    baseline: Sequence[Dict[str, Any]],
+    current: Sequence[Dict[str, Any]],
+    threshold: float = constants.DEFAULT_REGRESSION_THRESHOLD,
+) -> List[Comparison]:
+    """Compare every run that appears in both results files.
+
+    A run regressed if its mean time grew by more than the threshold and
+    Welch's t-test finds the growth significant at the 95% level, so noise
+    alone does not fail a comparison.
+
+    Args:
+        baseline: Records of the saved baseline
+        current: Records of the new results
+        threshold: Relative slowdown that counts as a regression
+
+    Returns:
+        List: Comparison of each run found in both files
+    """
+    saved = {run_key(record): record for record in baseline}
+    comparisons = []
+    for record in current:
+        key = run_key(record)
+        if key not in saved:
+            continue
+        before = saved[key]["times"]
+        after = record["times"]
+        statistic, degrees = welch_statistic(before, after)
+        significant = abs(statistic) > t_critical(degrees)
+        mean_before = statistics.fmean(before)
+        mean_after = statistics.fmean(after)
+        slower = mean_before > 0 and mean_after / mean_before - 1 > threshold
+        comparisons.append(
+            Comparison(
+                key,
+                mean_before,
+                mean_after,
+                statistic,
+                significant,
+                regression=significant and statistic > 0 and slower,
+            )
+        )
+    return comparisons
+
+
+def default_results_path(output_format: OutputFormat) -> str:
+    """Return the file that results are saved to unless one is given."""
+    return f"{constants.DEFAULT_RESULTS_FILE}.{output_format}"
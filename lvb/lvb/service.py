@@ -0,0 +1,490 @@
+"""Serve lookups over a local socket and drive the server with load."""
+
+# ruff: noqa: PLR0913, PLR0917
+
+import asyncio
+import json
+import multiprocessing
+import os
+import struct
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Deque, Iterator, List, Optional, Tuple
+
+from lvb.benchmark import percentiles
+from lvb.constants import constants
+from lvb.experiment import (
+    Configuration,
+    build_structure,
+    select_search_function,
+)
+from lvb.generate import generate_dataset, select_targets
+
+# every frame starts with the length of its payload, in network byte order
+HEADER = struct.Struct("!I")
+
+
+@dataclass(frozen=True)
+class Address:
+    """Class to store where the lookup server listens."""
+
+    host: str = constants.DEFAULT_HOST
+    port: int = constants.DEFAULT_PORT
+    # Unix socket to use instead of TCP, if any
+    path: Optional[str] = None
+
+    def __str__(self) -> str:
+        """Define a default string representation."""
+        return f"unix:{self.path}" if self.path else f"{self.host}:{self.port}"
+
+
+def encode_frame(payload: Any) -> bytes:
+    """Serialize a request or response into one length-prefixed frame."""
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    return HEADER.pack(len(body)) + body
+
+
+async def _read_body(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """Read the payload of one frame, or return None at the end of stream.
+
+    Raises:
+        ConnectionError: If the frame is larger than the server accepts
+    """
+    try:
+        header = await reader.readexactly(HEADER.size)
+        (length,) = HEADER.unpack(header)
+        if length > constants.FRAME_LIMIT:
+            raise ConnectionError(f"Frame of {length} bytes is too large")
+        return await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        # a frame cut short means that the peer closed the stream mid-way
+        return None
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[Any]:
+    """Read one frame, or return None when the peer closes the stream.
+
+    Raises:
+        ConnectionError: If the frame is larger than the server accepts
+    """
+    body = await _read_body(reader)
+    return None if body is None else json.loads(body)
+
+
+def answer_request(search_func: Callable[[Any], Any], body: bytes) -> Any:
+    """Answer one request frame with the result of every key in it.
+
+    A request that is not a list of keys, or holds a key that cannot be
+    compared with the values served, is answered with an object holding
+    the error, so the requests pipelined behind it are still answered.
+
+    Args:
+        search_func: Function that searches for one key
+        body: Payload of the request frame
+
+    Returns:
+        Any: List of results, or a mapping with the error
+    """
+    try:
+        keys = json.loads(body)
+    except ValueError as error:
+        return {"error": f"Request is not JSON: {error}"}
+    if not isinstance(keys, list):
+        return {"error": "Request must be a list of keys"}
+    try:
+        return [search_func(key) for key in keys]
+    except (TypeError, ValueError) as error:
+        return {"error": f"Cannot search for a key: {error}"}
+
+
+def load_search(
+    configuration: Configuration, size: int
+) -> Callable[[Any], Any]:
+    """Generate the dataset and structure that a server searches.
+
+    Args:
+        configuration: Structure and search to serve
+        size: Number of values in the dataset
+
+    Returns:
+        Callable: Function that searches for one key
+    """
+    dataset = generate_dataset(
+        size,
+        configuration.data_type,
+        configuration.needs_sorted,
+        configuration.seed,
+        configuration.dataset_cache(),
+    )
+    structure = build_structure(configuration, dataset)
+    return select_search_function(
+        configuration.search_algorithm, dataset, structure
+    )
+
+
+def lookup_handler(
+    search_func: Callable[[Any], Any],
+) -> Callable[[asyncio.StreamReader, asyncio.StreamWriter], Any]:
+    """Build the connection handler of a lookup server.
+
+    Every request frame holds a list of keys and is answered by one frame
+    with the result of each key, in the order the requests arrived, so a
+    client may pipeline as many requests as it likes. A malformed request
+    is answered with an error, and only a frame over the size limit ends
+    the connection.
+
+    Args:
+        search_func: Function that searches for one key
+
+    Returns:
+        Callable: Coroutine function that serves one connection
+    """
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                body = await _read_body(reader)
+                if body is None:
+                    break
+                writer.write(encode_frame(answer_request(search_func, body)))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return handle
+
+
+async def serve(
+    search_func: Callable[[Any], Any],
+    address: Address,
+    ready: Optional[Callable[[], Any]] = None,
+) -> None:
+    """Serve lookups until the task is cancelled.
+
+    Args:
+        search_func: Function that searches for one key
+        address: Where to listen
+        ready: Called once the server accepts connections
+    """
+    handle = lookup_handler(search_func)
+    if address.path:
+        server = await asyncio.start_unix_server(handle, path=address.path)
+    else:
+        server = await asyncio.start_server(handle, address.host, address.port)
+    async with server:
+        if ready is not None:
+            ready()
+        await server.serve_forever()
+
+
+def _serve_process(
+    configuration: Configuration, size: int, address: Address, ready: Any
+) -> None:
+    """Run a lookup server in a process of its own."""
+    search_func = load_search(configuration, size)
+    asyncio.run(serve(search_func, address, ready.set))
+
+
+@dataclass
+class LoadResult:
+    """Class to store what the load generator saw of the server."""
+
+    requests: int
+    batch: int
+    elapsed: float
+    # Time from sending, or from the scheduled send, to the response
+    latencies: List[float] = field(default_factory=list)
+    # Requests per second that an open loop offered, or None if closed
+    offered_rate: Optional[float] = None
+
+    @property
+    def qps(self) -> float:
+        """Return the lookups answered per second."""
+        return (
+            self.requests * self.batch / self.elapsed if self.elapsed else 0.0
+        )
+
+    @property
+    def sustained(self) -> bool:
+        """Return whether the server kept up with the offered rate."""
+        if self.offered_rate is None:
+            return True
+        achieved = self.requests / self.elapsed if self.elapsed else 0.0
+        return achieved >= constants.SUSTAINED_FRACTION * self.offered_rate
+
+    def percentiles(self) -> List[float]:
+        """Return the p50, p99 and p99.9 request latency, in seconds."""
+        return percentiles(self.latencies, (50, 99, 99.9))
+
+
+class _Connection:
+    """One client connection that matches responses to requests in order."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        self.reader = reader
+        self.writer = writer
+        # start time of every request still waiting for its response
+        self.pending: Deque[float] = deque()
+        self.latencies: List[float] = []
+        self.last_response = 0.0
+
+    def send(self, keys: List[Any], start: float) -> None:
+        """Queue one request, timed from the given start."""
+        self.pending.append(start)
+        self.writer.write(encode_frame(keys))
+
+    async def receive(self, on_response: Optional[Callable] = None) -> None:
+        """Time every response until the server closes the stream."""
+        while await read_frame(self.reader) is not None:
+            self.last_response = time.perf_counter()
+            self.latencies.append(self.last_response - self.pending.popleft())
+            if on_response is not None:
+                on_response()
+
+
+async def _connect(address: Address) -> _Connection:
+    """Open one connection to the lookup server."""
+    if address.path:
+        reader, writer = await asyncio.open_unix_connection(address.path)
+    else:
+        reader, writer = await asyncio.open_connection(
+            address.host, address.port
+        )
+    return _Connection(reader, writer)
+
+
+async def _finish(
+    connections: List[_Connection], receivers: List[asyncio.Task]
+) -> None:
+    """Wait for the responses still in flight, then close the connections."""
+    for connection in connections:
+        if connection.writer.can_write_eof():
+            connection.writer.write_eof()
+    await asyncio.gather(*receivers)
+    for connection in connections:
+        connection.writer.close()
+
+
+def _batches(keys: List[Any], batch: int) -> Iterator[List[Any]]:
+    """Cycle through the keys in requests of the given size."""
+    position = 0
+    while True:
+        request = [keys[(position + i) % len(keys)] for i in range(batch)]
+        position = (position + batch) % len(keys)
+        yield request
+
+
+def _result(
+    connections: List[_Connection],
+    batch: int,
+    start: float,
+    offered_rate: Optional[float] = None,
+) -> LoadResult:
+    """Gather the timings of every connection into one result."""
+    latencies = [
+        latency
+        for connection in connections
+        for latency in connection.latencies
+    ]
+    end = max(connection.last_response for connection in connections)
+    return LoadResult(
+        len(latencies), batch, max(0.0, end - start), latencies, offered_rate
+    )
+
+
+async def closed_loop(
+    address: Address,
+    keys: List[Any],
+    batch: int,
+    duration: float,
+    connections: int,
+    pipeline: int = constants.DEFAULT_PIPELINE,
+) -> LoadResult:
+    """Keep a fixed number of requests in flight for the duration.
+
+    Args:
+        address: Where the server listens
+        keys: Keys to look up, cycled through in order
+        batch: Keys per request
+        duration: Seconds to keep sending
+        connections: Number of connections
+        pipeline: Requests in flight on each connection
+
+    Returns:
+        LoadResult: Latency of every request and the achieved rate
+    """
+    opened = [await _connect(address) for _ in range(connections)]
+    requests = _batches(keys, batch)
+    start = time.perf_counter()
+    deadline = start + duration
+
+    async def drive(connection: _Connection) -> None:
+        window = asyncio.Semaphore(pipeline)
+        receiver = asyncio.create_task(connection.receive(window.release))
+        while time.perf_counter() < deadline:
+            await window.acquire()
+            connection.send(next(requests), time.perf_counter())
+            await connection.writer.drain()
+        await _finish([connection], [receiver])
+
+    await asyncio.gather(*(drive(connection) for connection in opened))
+    return _result(opened, batch, start)
+
+
+async def open_loop(
+    address: Address,
+    keys: List[Any],
+    batch: int,
+    duration: float,
+    connections: int,
+    rate: float,
+) -> LoadResult:
+    """Send requests on a fixed schedule, whether or not the server keeps up.
+
+    Latency is measured from when each request was due rather than from
+    when it was sent, so a server that falls behind is not flattered by a
+    generator that waits for it.
+
+    Args:
+        address: Where the server listens
+        keys: Keys to look up, cycled through in order
+        batch: Keys per request
+        duration: Seconds to keep sending
+        connections: Number of connections to spread the requests over
+        rate: Requests per second to offer
+
+    Returns:
+        LoadResult: Latency of every request and the achieved rate
+    """
+    opened = [await _connect(address) for _ in range(connections)]
+    receivers = [
+        asyncio.create_task(connection.receive()) for connection in opened
+    ]
+    requests = _batches(keys, batch)
+    total = max(1, int(rate * duration))
+    start = time.perf_counter()
+    for index in range(total):
+        due = start + index / rate
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        opened[index % connections].send(next(requests), due)
+    await _finish(opened, receivers)
+    return _result(opened, batch, start, rate)
+
+
+async def find_sustained_rate(
+    address: Address,
+    keys: List[Any],
+    batch: int,
+    duration: float,
+    connections: int,
+    start_rate: float,
+) -> Tuple[Optional[LoadResult], List[LoadResult]]:
+    """Raise the offered rate step by step until the server falls behind.
+
+    Args:
+        address: Where the server listens
+        keys: Keys to look up
+        batch: Keys per request
+        duration: Seconds that each rate is offered
+        connections: Number of connections
+        start_rate: First requests per second to offer
+
+    Returns:
+        Tuple: Highest sustained result, or None, and every probe
+    """
+    best = None
+    probes = []
+    rate = max(1.0, start_rate)
+    while True:
+        result = await open_loop(
+            address, keys, batch, duration, connections, rate
+        )
+        probes.append(result)
+        if not result.sustained:
+            return best, probes
+        best = result
+        rate *= constants.RATE_STEP
+
+
+class LocalServer:
+    """Run a lookup server in a child process on a temporary Unix socket."""
+
+    def __init__(self, configuration: Configuration, size: int):
+        self._directory = tempfile.TemporaryDirectory()
+        # platforms without Unix sockets fall back to the default port
+        self.address = (
+            Address(path=str(Path(self._directory.name) / "lvb.sock"))
+            if hasattr(asyncio, "start_unix_server")
+            else Address()
+        )
+        context = multiprocessing.get_context("spawn")
+        ready = context.Event()
+        self._process = context.Process(
+            target=_serve_process,
+            args=(configuration, size, self.address, ready),
+            daemon=True,
+        )
+        self._process.start()
+        while not ready.wait(0.1):
+            if not self._process.is_alive():
+                self.close()
+                raise RuntimeError("The lookup server did not start")
+
+    def __enter__(self) -> "LocalServer":
+        """Return the server for use in a with statement."""
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Stop the server when the with statement ends."""
+        self.close()
+
+    def close(self) -> None:
+        """Stop the server process and remove its socket."""
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process.join()
+        self._directory.cleanup()
+
+
+def load_keys(configuration: Configuration, size: int) -> List[Any]:
+    """Select the keys to send, from the dataset that the server holds.
+
+    Args:
+        configuration: Configuration the server was started with
+        size: Number of values in the dataset
+
+    Returns:
+        List: Keys at the configured target position
+    """
+    dataset = generate_dataset(
+        size,
+        configuration.data_type,
+        configuration.needs_sorted,
+        configuration.seed,
+        configuration.dataset_cache(),
+    )
+    return select_targets(
+        dataset,
+        configuration.target_position,
+        configuration.searches,
+        configuration.data_type,
+        configuration.zipf_exponent,
+    )
+
+
+def seeded(configuration: Configuration) -> Configuration:
+    """Give a configuration a seed, so server and client share a dataset."""
+    if configuration.seed is not None:
+        return configuration
+    return replace(configuration, seed=int.from_bytes(os.urandom(4), "big"))
@@ -0,0 +1,72 @@
+"""Splay tree that moves every element it finds to the root."""
+
+from typing import Any
+
+from lvb.bst import BinarySearchTree, Node
+
+
+class SplayTree(BinarySearchTree):
+    """Binary search tree that adapts its shape to the searches.
+
+    The tree is built exactly as the binary search tree is, and every
+    search then splays the last node it reaches to the root. Elements
+    that are searched often stay near the top, so a skewed workload costs
+    far less than log n per search, at the price of rotations on every
+    search, even a read.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.rotations = 0
+
+    def search(self, target: Any) -> bool:
+        """Search for a value, splay the node reached, and return if found.
+
+        The top-down splay walks the tree once, splitting it into a left
+        tree of smaller and a right tree of larger elements, and rotating
+        whenever the path goes the same way twice in a row.
+        """
+        node = self.root
+        if node is None:
+            return False
+        # the header collects the left and right trees as they are split
+        header = Node(None)
+        left = right = header
+        while True:
+            if target < node.data:
+                child = node.l_child
+                if child is None:
+                    break
+                if target < child.data:
+                    node.l_child = child.r_child
+                    child.r_child = node
+                    node = child
+                    self.rotations += 1
+                    if node.l_child is None:
+                        break
+                right.l_child = node
+                right = node
+                node = node.l_child
+            elif node.data < target:
+                child = node.r_child
+                if child is None:
+                    break
+                if child.data < target:
+                    node.r_child = child.l_child
+                    child.l_child = node
+                    node = child
+                    self.rotations += 1
+                    if node.r_child is None:
+                        break
+                left.r_child = node
+                left = node
+                node = node.r_child
+            else:
+                break
+        # reassemble the tree with the node reached at the root
+        left.r_child = node.l_child
+        right.l_child = node.r_child
+        node.l_child = header.r_child
+        node.r_child = header.l_child
+        self.root = node
+        return node.data == target
@@ -0,0 +1,289 @@
+"""Sweep every valid combination of the benchmark axes over shared data."""
+
+# ruff: noqa: PLR0913, PLR0917
+
+import random
+import time
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from lvb import approach
+from lvb.cache import DatasetCache
+from lvb.constants import constants
+from lvb.experiment import Configuration, RunResult, benchmark_dataset
+from lvb.generate import (
+    generate_array,
+    select_array_targets,
+    select_targets,
+    to_list,
+)
+from lvb.parallel import RunTask, SharedArrays, run_tasks
+
+# the value of an axis that stands for every member of its enum
+ALL = "all"
+
+
+def parse_axis(values: Sequence[str], choices: Type[Enum]) -> List[Any]:
+    """Parse the values of one axis, given as a list or as "all".
+
+    Args:
+        values: Enum values, each of which may list several with commas
+        choices: Enum that the values belong to
+
+    Returns:
+        List: Enum members in the order given, without duplicates
+
+    Raises:
+        ValueError: If a value is not a member of the enum
+    """
+    members: List[Any] = []
+    for value in values:
+        for item in value.split(","):
+            name = item.strip()
+            if not name:
+                continue
+            if name == ALL:
+                chosen = list(choices)
+            else:
+                try:
+                    chosen = [choices(name)]
+                except ValueError:
+                    valid = ", ".join(member.value for member in choices)
+                    raise ValueError(
+                        f"'{name}' is not one of {ALL}, {valid}"
+                    ) from None
+            members.extend(
+                member for member in chosen if member not in members
+            )
+    return members
+
+
+def sweep_configurations(
+    base: Configuration,
+    data_structures: Sequence[approach.DataStructure],
+    search_algorithms: Sequence[approach.SearchAlgorithm],
+    data_types: Sequence[approach.DataType],
+    target_positions: Sequence[approach.TargetPosition],
+) -> List[Configuration]:
+    """List every valid combination of the axes.
+
+    Args:
+        base: Configuration that supplies every setting but the axes
+        data_structures: Data structures to sweep
+        search_algorithms: Search algorithms to sweep
+        data_types: Data types to sweep
+        target_positions: Target positions to sweep
+
+    Returns:
+        List: Valid configurations, grouped by data type and position
+    """
+    configurations = []
+    for data_type in data_types:
+        for target_position in target_positions:
+            for data_structure in data_structures:
+                for search_algorithm in search_algorithms:
+                    configuration = replace(
+                        base,
+                        data_structure=data_structure,
+                        search_algorithm=search_algorithm,
+                        data_type=data_type,
+                        target_position=target_position,
+                    )
+                    # skip the pairs that a single run would reject
+                    if configuration.validate() is None:
+                        configurations.append(configuration)
+    return configurations
+
+
+def _shared_targets(
+    arrays: Dict[bool, np.ndarray],
+    position: approach.TargetPosition,
+    searches: int,
+    data_type: approach.DataType,
+    zipf_exponent: float = constants.DEFAULT_ZIPF_EXPONENT,
+) -> Dict[bool, List[Any]]:
+    """Select the targets once for the unsorted and sorted dataset.
+
+    Both orders get the targets at the same positions, so a target near
+    the beginning is near the beginning of whichever list is searched.
+
+    Args:
+        arrays: Unsorted and sorted values, keyed by sortedness
+        position: Position of the targets in the dataset
+        searches: Number of targets to select
+        data_type: Type of data in the dataset
+        zipf_exponent: Skew of the Zipf targets
+
+    Returns:
+        Dict: Targets for each dataset, keyed by sortedness
+    """
+    some_values = next(iter(arrays.values()))
+    if position == approach.TargetPosition.NONEXISTENT:
+        missing = select_array_targets(
+            some_values, position, searches, data_type
+        )
+        return {order: missing for order in arrays}
+    positions = np.asarray(
+        select_targets(
+            range(len(some_values)),
+            position,
+            searches,
+            data_type,
+            zipf_exponent,
+        ),
+        dtype=np.intp,
+    )
+    return {
+        order: to_list(values[positions], data_type)
+        for order, values in arrays.items()
+    }
+
+
+@dataclass
+class _SharedData:
+    """Class to store a generated dataset and the targets of its runs."""
+
+    size: int
+    # Configurations of the data type of the dataset
+    configurations: List[Configuration]
+    # Unsorted and, if any configuration needs them, sorted values
+    arrays: Dict[bool, np.ndarray]
+    targets: Dict[approach.TargetPosition, Dict[bool, List[Any]]]
+    generate_time: float
+
+
+def _shared_data(
+    configurations: Sequence[Configuration],
+    sizes: Sequence[int],
+    seed: Optional[int],
+    cache: Optional[DatasetCache],
+) -> Iterator[_SharedData]:
+    """Generate the dataset of every size and data type exactly once."""
+    data_types = list(
+        dict.fromkeys(
+            configuration.data_type for configuration in configurations
+        )
+    )
+    for size in sizes:
+        for data_type in data_types:
+            chosen = [
+                configuration
+                for configuration in configurations
+                if configuration.data_type == data_type
+            ]
+            if seed is not None:
+                random.seed(f"{seed}:{size}:{data_type}")
+            generate_start = time.perf_counter()
+            values = generate_array(size, data_type, seed=seed, cache=cache)
+            arrays = {False: values}
+            if any(configuration.needs_sorted for configuration in chosen):
+                arrays[True] = np.sort(values)
+            generate_time = time.perf_counter() - generate_start
+            targets = {}
+            for configuration in chosen:
+                position = configuration.target_position
+                if position not in targets:
+                    targets[position] = _shared_targets(
+                        arrays,
+                        position,
+                        configuration.searches,
+                        data_type,
+                        configuration.zipf_exponent,
+                    )
+            yield _SharedData(size, chosen, arrays, targets, generate_time)
+
+
+def run_sweep(
+    configurations: Sequence[Configuration],
+    sizes: Sequence[int],
+    seed: Optional[int] = None,
+    cache: Optional[DatasetCache] = None,
+    jobs: int = 1,
+    pin_cpus: bool = False,
+) -> Iterator[Tuple[Configuration, RunResult]]:
+    """Run every configuration at every size, yielding results as they end.
+
+    The dataset of each size and data type is generated once and sorted
+    at most once, and every configuration with the same target position
+    searches for the same targets.
+
+    Args:
+        configurations: Valid configurations to run
+        sizes: Dataset sizes to run them at
+        seed: Seed for reproducible datasets and targets
+        cache: Cache that keeps seeded datasets between runs
+        jobs: Number of worker processes, or 1 to run in this process
+        pin_cpus: Whether to pin every worker to a CPU of its own
+
+    Yields:
+        Tuple: Each configuration with the result of one of its runs
+    """
+    if jobs > 1:
+        yield from _run_sweep_parallel(
+            configurations, sizes, seed, cache, jobs, pin_cpus
+        )
+        return
+
+    for data in _shared_data(configurations, sizes, seed, cache):
+        data_type = data.configurations[0].data_type
+        datasets = {
+            order: to_list(values, data_type)
+            for order, values in data.arrays.items()
+        }
+        for configuration in data.configurations:
+            order = configuration.needs_sorted
+            # a self-adjusting search reorders the list it runs on, so it
+            # gets a copy and leaves the shared one as every run found it
+            dataset = (
+                list(datasets[order])
+                if configuration.self_adjusting
+                else datasets[order]
+            )
+            result = benchmark_dataset(
+                configuration,
+                dataset,
+                data.targets[configuration.target_position][order],
+            )
+            result.details["generate_time"] = data.generate_time
+            yield configuration, result
+
+
+def _run_sweep_parallel(
+    configurations: Sequence[Configuration],
+    sizes: Sequence[int],
+    seed: Optional[int],
+    cache: Optional[DatasetCache],
+    jobs: int,
+    pin_cpus: bool,
+) -> Iterator[Tuple[Configuration, RunResult]]:
+    """Run the sweep in a process pool that reads datasets from shared memory."""
+    with SharedArrays() as shared:
+        tasks = []
+        generate_times = []
+        for data in _shared_data(configurations, sizes, seed, cache):
+            shared_arrays = {
+                order: shared.share(values)
+                for order, values in data.arrays.items()
+            }
+            for configuration in data.configurations:
+                order = configuration.needs_sorted
+                tasks.append(
+                    RunTask(
+                        configuration,
+                        shared_arrays[order],
+                        data.targets[configuration.target_position][order],
+                    )
+                )
+                generate_times.append(data.generate_time)
+        results = run_tasks(tasks, jobs, pin_cpus)
+        for task, generate_time, result in zip(tasks, generate_times, results):
+            result.details["generate_time"] = generate_time
+            yield task.configuration, result
+
+
+def doubling_sizes(start_size: int, runs: int) -> List[int]:
+    """Return the dataset sizes of a run that doubles its size each time."""
+    return [start_size * constants.DOUBLING_FACTOR**run for run in range(runs)]
@@ -0,0 +1,340 @@
+"""Measure the read throughput of concurrent readers on one structure."""
+
+# ruff: noqa: PLR0913, PLR0917
+
+import multiprocessing
+import sys
+import sysconfig
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from lvb import approach
+from lvb.benchmark import percentiles
+from lvb.experiment import (
+    LIST_SEARCHES,
+    Configuration,
+    build_structure,
+    select_search_function,
+)
+from lvb.eytzinger import EytzingerTree
+from lvb.generate import generate_array, select_targets, to_list
+from lvb.parallel import SharedArray, SharedArrays
+
+# memoryview formats of the NumPy types that can be read without a copy
+SHARED_FORMATS = {"<i8": "q", "<f8": "d"}
+
+# shared memory that a reader process keeps mapped until it exits
+_ATTACHED: List[shared_memory.SharedMemory] = []
+
+
+def gil_enabled() -> bool:
+    """Return whether the global interpreter lock is enabled right now."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def free_threaded_build() -> bool:
+    """Return whether this CPython was built without the GIL."""
+    return bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+
+def validate_throughput(configuration: Configuration) -> Optional[str]:
+    """Return the reason readers cannot run a configuration, or None."""
+    invalid = configuration.validate()
+    if invalid is not None:
+        return invalid
+    if (
+        configuration.batch
+        or configuration.bloom_filter
+        or configuration.search_algorithm
+        == approach.SearchAlgorithm.GALLOPING_SEARCH
+    ):
+        return "Concurrent lookups require single-target searches"
+    if configuration.self_adjusting:
+        # readers that reorder one structure would race with each other
+        return "Concurrent lookups require searches that only read"
+    if configuration.storage != approach.Storage.MEMORY:
+        return "Concurrent lookups keep the dataset in memory"
+    return None
+
+
+@dataclass(frozen=True)
+class WorkerResult:
+    """Class to store the lookups of one reader."""
+
+    lookups: int
+    # Clock readings when the reader started and stopped, in seconds
+    start: float
+    end: float
+    # Latency percentiles of its lookups, in seconds
+    p50: float
+    p95: float
+    p99: float
+
+
+@dataclass(frozen=True)
+class ThroughputResult:
+    """Class to store the aggregate throughput of concurrent readers."""
+
+    workers: int
+    readers: List[WorkerResult]
+    # Whether the readers searched one shared copy of the structure
+    shared: bool
+
+    @property
+    def lookups(self) -> int:
+        """Return the lookups of all readers together."""
+        return sum(reader.lookups for reader in self.readers)
+
+    @property
+    def elapsed(self) -> float:
+        """Return the time from the first start to the last stop."""
+        return max(reader.end for reader in self.readers) - min(
+            reader.start for reader in self.readers
+        )
+
+    @property
+    def qps(self) -> float:
+        """Return the aggregate queries per second."""
+        return self.lookups / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def drive(
+    search_func: Callable[[Any], Any], targets: Sequence[Any], duration: float
+) -> WorkerResult:
+    """Search for the targets round after round until the duration is up.
+
+    Args:
+        search_func: Function that searches for one target
+        targets: Targets of this reader
+        duration: Seconds to keep searching
+
+    Returns:
+        WorkerResult: Lookups, start and stop, and latency percentiles
+    """
+    clock = time.perf_counter_ns
+    latencies = []
+    start = clock()
+    deadline = start + int(duration * 1e9)
+    end = start
+    while end < deadline and targets:
+        for target in targets:
+            before = clock()
+            search_func(target)
+            end = clock()
+            latencies.append((end - before) / 1e9)
+    p50, p95, p99 = percentiles(latencies)
+    return WorkerResult(len(latencies), start / 1e9, end / 1e9, p50, p95, p99)
+
+
+def _run_threads(
+    search_func: Callable[[Any], Any],
+    worker_targets: List[List[Any]],
+    duration: float,
+) -> List[WorkerResult]:
+    """Let one thread per target list search the same structure at once."""
+    barrier = threading.Barrier(len(worker_targets))
+    results: List[Optional[WorkerResult]] = [None] * len(worker_targets)
+
+    def reader(index: int) -> None:
+        barrier.wait()
+        results[index] = drive(search_func, worker_targets[index], duration)
+
+    threads = [
+        threading.Thread(target=reader, args=(index,))
+        for index in range(len(worker_targets))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return [result for result in results if result is not None]
+
+
+@dataclass(frozen=True)
+class SharedStructure:
+    """Class to store where a reader process finds the shared data."""
+
+    configuration: Configuration
+    values: SharedArray
+    # Eytzinger layout of the values, if it can be shared as well
+    layout: Optional[SharedArray] = None
+
+
+def _attach(shared: SharedArray) -> memoryview:
+    """Map shared numbers as a memoryview that indexes like a list."""
+    memory = shared_memory.SharedMemory(name=shared.name)
+    # the view exports the buffer, so the block must outlive every search
+    _ATTACHED.append(memory)
+    return memory.buf.cast(SHARED_FORMATS[shared.dtype])[: shared.length]
+
+
+def reads_in_place(shared: SharedStructure) -> bool:
+    """Return whether readers search the shared copy rather than their own.
+
+    The sorted and unsorted lists and the Eytzinger layout of integers or
+    floats are read in place, while any other structure, such as the hash
+    index or a tree of nodes, cannot live in shared memory and is rebuilt
+    by every reader from the shared values.
+
+    Args:
+        shared: Where the shared data is
+
+    Returns:
+        bool: True if the readers share one copy of the structure
+    """
+    configuration = shared.configuration
+    if shared.values.dtype not in SHARED_FORMATS:
+        return False
+    if shared.layout is not None:
+        return True
+    return (
+        configuration.data_structure
+        in [
+            approach.DataStructure.UNSORTED_LIST,
+            approach.DataStructure.SORTED_LIST,
+        ]
+        and configuration.search_algorithm in LIST_SEARCHES
+    )
+
+
+def attach_search(shared: SharedStructure) -> Callable[[Any], Any]:
+    """Build the search function of a reader process.
+
+    Args:
+        shared: Where the shared data is
+
+    Returns:
+        Callable: Function that searches for one target
+    """
+    configuration = shared.configuration
+    if not reads_in_place(shared):
+        dataset = shared.values.read(configuration.data_type)
+        structure = build_structure(configuration, dataset)
+        return select_search_function(
+            configuration.search_algorithm, dataset, structure
+        )
+    if shared.layout is not None:
+        tree = EytzingerTree()
+        tree.layout = _attach(shared.layout)
+        tree.size = shared.values.length
+        return tree.search
+    return select_search_function(
+        configuration.search_algorithm, _attach(shared.values), None
+    )
+
+
+def _reader_process(
+    shared: SharedStructure,
+    targets: List[Any],
+    duration: float,
+    barrier: Any,
+    results: Any,
+    index: int,
+) -> None:
+    """Search the shared structure from a process of its own."""
+    search_func = attach_search(shared)
+    barrier.wait()
+    results.put((index, drive(search_func, targets, duration)))
+
+
+def _run_processes(
+    shared: SharedStructure,
+    worker_targets: List[List[Any]],
+    duration: float,
+) -> List[WorkerResult]:
+    """Let one process per target list search the shared structure."""
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(len(worker_targets))
+    queue = context.Queue()
+    processes = [
+        context.Process(
+            target=_reader_process,
+            args=(shared, targets, duration, barrier, queue, index),
+        )
+        for index, targets in enumerate(worker_targets)
+    ]
+    for process in processes:
+        process.start()
+    # drain the queue before joining, so no reader blocks on a full pipe
+    gathered = dict(queue.get() for _ in processes)
+    for process in processes:
+        process.join()
+    return [gathered[index] for index in range(len(processes))]
+
+
+def measure_throughput(
+    configuration: Configuration,
+    size: int,
+    worker_counts: Sequence[int],
+    concurrency: approach.Concurrency,
+    duration: float,
+) -> Iterator[ThroughputResult]:
+    """Measure how the read throughput of one structure scales with readers.
+
+    The dataset and structure are built once, and every reader searches
+    for targets of its own that `select_targets` picks from it.
+
+    Args:
+        configuration: Structure and search to measure
+        size: Number of values in the dataset
+        worker_counts: Numbers of concurrent readers to try
+        concurrency: Whether the readers are threads or processes
+        duration: Seconds that every reader keeps searching
+
+    Yields:
+        ThroughputResult: Throughput for each number of readers
+    """
+    values = generate_array(
+        size,
+        configuration.data_type,
+        configuration.needs_sorted,
+        configuration.seed,
+        configuration.dataset_cache(),
+    )
+    dataset = to_list(values, configuration.data_type)
+
+    def targets_for(workers: int) -> List[List[Any]]:
+        return [
+            select_targets(
+                dataset,
+                configuration.target_position,
+                configuration.searches,
+                configuration.data_type,
+                configuration.zipf_exponent,
+            )
+            for _ in range(workers)
+        ]
+
+    if concurrency == approach.Concurrency.THREADS:
+        structure = build_structure(configuration, dataset)
+        search_func = select_search_function(
+            configuration.search_algorithm, dataset, structure
+        )
+        for workers in worker_counts:
+            readers = _run_threads(search_func, targets_for(workers), duration)
+            yield ThroughputResult(workers, readers, shared=True)
+        return
+
+    with SharedArrays() as arrays:
+        layout = None
+        if (
+            configuration.data_structure
+            == approach.DataStructure.EYTZINGER_TREE
+        ):
+            tree = EytzingerTree.from_sorted(dataset)
+            # only an unboxed layout can be read from shared memory
+            if not isinstance(tree.layout, list):
+                layout = arrays.share(
+                    np.frombuffer(tree.layout, dtype=values.dtype)
+                )
+        shared = SharedStructure(configuration, arrays.share(values), layout)
+        in_place = reads_in_place(shared)
+        for workers in worker_counts:
+            readers = _run_processes(shared, targets_for(workers), duration)
+            yield ThroughputResult(workers, readers, shared=in_place)
@@ -0,0 +1,103 @@
+"""Treap implementation that balances itself with random priorities."""
+
+import random
+from typing import Any, List, Optional
+
+
+class TreapNode:
+    """Creates the node class for the treap."""
+
+    __slots__ = ("data", "l_child", "priority", "r_child")
+
+    def __init__(self, value):
+        self.l_child: Optional[TreapNode] = None
+        self.r_child: Optional[TreapNode] = None
+        self.data = value
+        self.priority = random.random()
+
+
+class Treap:
+    """Binary search tree that is also a max-heap on random priorities."""
+
+    def __init__(self):
+        self.root: Optional[TreapNode] = None
+        self.rotations = 0
+
+    def insert(self, value: Any) -> None:
+        """Inserts the value and rotates it up to satisfy the heap order."""
+        node = TreapNode(value)
+        if self.root is None:
+            self.root = node
+            return
+        path: List[TreapNode] = []
+        parent = self.root
+        while parent is not None:
+            path.append(parent)
+            parent = parent.l_child if value < parent.data else parent.r_child
+        parent = path[-1]
+        if value < parent.data:
+            parent.l_child = node
+        else:
+            parent.r_child = node
+        # rotate the new node up while it outranks its parent
+        while path and path[-1].priority < node.priority:
+            parent = path.pop()
+            if parent.l_child is node:
+                parent.l_child = node.r_child
+                node.r_child = parent
+            else:
+                parent.r_child = node.l_child
+                node.l_child = parent
+            self.rotations += 1
+            if not path:
+                self.root = node
+            elif path[-1].l_child is parent:
+                path[-1].l_child = node
+            else:
+                path[-1].r_child = node
+
+    def delete(self, value: Any) -> bool:
+        """Deletes one copy of the value by rotating it down to a leaf."""
+        parent: Optional[TreapNode] = None
+        node = self.root
+        while node is not None and node.data != value:
+            parent = node
+            node = node.l_child if value < node.data else node.r_child
+        if node is None:
+            return False
+        # rotate the child that outranks the other above the node, which
+        # keeps the heap order, until the node has at most one child
+        while node.l_child is not None and node.r_child is not None:
+            if node.l_child.priority > node.r_child.priority:
+                child = node.l_child
+                node.l_child = child.r_child
+                child.r_child = node
+            else:
+                child = node.r_child
+                node.r_child = child.l_child
+                child.l_child = node
+            self.rotations += 1
+            if parent is None:
+                self.root = child
+            elif parent.l_child is node:
+                parent.l_child = child
+            else:
+                parent.r_child = child
+            parent = child
+        child = node.l_child if node.l_child is not None else node.r_child
+        if parent is None:
+            self.root = child
+        elif parent.l_child is node:
+            parent.l_child = child
+        else:
+            parent.r_child = child
+        return True
+
+    def search(self, target: Any) -> bool:
+        """Search for a value in the tree and return if found."""
+        node = self.root
+        while node is not None:
+            if node.data == target:
+                return True
+            node = node.l_child if target < node.data else node.r_child
+        return False
@@ -0,0 +1,293 @@
+"""Run mixed workloads of lookups, inserts and deletes on one structure."""
+
+# ruff: noqa: PLR0911
+
+import random
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from lvb import approach
+from lvb.approach import DataStructure, Operation
+from lvb.avl import AVLTree
+from lvb.benchmark import measure_latencies, percentiles
+from lvb.bplustree import BPlusTree
+from lvb.bst import BinarySearchTree
+from lvb.constants import constants
+from lvb.experiment import (
+    LIST_SEARCHES,
+    Configuration,
+    build_structure,
+    describe,
+    select_search_function,
+)
+from lvb.generate import generate_dataset
+from lvb.hashindex import HashIndex
+from lvb.lookupcache import create_lookup_cache
+from lvb.redblack import RedBlackTree
+from lvb.referencetree import BintreesTree
+from lvb.treap import Treap
+
+
+def _delete_sorted(values: List[Any], value: Any) -> bool:
+    """Delete one copy of a value from a sorted list, found by bisection."""
+    position = bisect_left(values, value)
+    if position == len(values) or values[position] != value:
+        return False
+    del values[position]
+    return True
+
+
+def _delete_unsorted(values: List[Any], value: Any) -> bool:
+    """Delete the first copy of a value from an unsorted list."""
+    try:
+        values.remove(value)
+    except ValueError:
+        return False
+    return True
+
+
+# structures that are the dataset list itself, written in place
+LIST_STRUCTURES = [DataStructure.UNSORTED_LIST, DataStructure.SORTED_LIST]
+
+# map each structure to how a value is inserted into it
+INSERTS: Dict[DataStructure, Callable[[Any, Any], Any]] = {
+    DataStructure.UNSORTED_LIST: list.append,
+    DataStructure.SORTED_LIST: insort,
+    DataStructure.BINARY_SEARCH_TREE: BinarySearchTree.insert,
+    DataStructure.SPLAY_TREE: BinarySearchTree.insert,
+    DataStructure.AVL_TREE: AVLTree.insert,
+    DataStructure.RED_BLACK_TREE: RedBlackTree.insert,
+    DataStructure.TREAP: Treap.insert,
+    DataStructure.BINTREES_AVL_TREE: BintreesTree.insert,
+    DataStructure.BINTREES_RB_TREE: BintreesTree.insert,
+    DataStructure.B_PLUS_TREE: BPlusTree.insert,
+    DataStructure.HASH_INDEX: HashIndex.insert,
+}
+
+# map each structure that can delete a value to how it does so
+DELETES: Dict[DataStructure, Callable[[Any, Any], bool]] = {
+    DataStructure.UNSORTED_LIST: _delete_unsorted,
+    DataStructure.SORTED_LIST: _delete_sorted,
+    DataStructure.BINARY_SEARCH_TREE: BinarySearchTree.delete,
+    DataStructure.SPLAY_TREE: BinarySearchTree.delete,
+    DataStructure.AVL_TREE: AVLTree.delete,
+    DataStructure.RED_BLACK_TREE: RedBlackTree.delete,
+    DataStructure.TREAP: Treap.delete,
+    DataStructure.BINTREES_AVL_TREE: BintreesTree.delete,
+    DataStructure.BINTREES_RB_TREE: BintreesTree.delete,
+    DataStructure.B_PLUS_TREE: BPlusTree.delete,
+    DataStructure.HASH_INDEX: HashIndex.delete,
+}
+
+
+@dataclass(frozen=True)
+class WorkloadMix:
+    """Class to store the share of each operation in a workload."""
+
+    reads: float = constants.DEFAULT_READ_SHARE
+    inserts: float = constants.DEFAULT_INSERT_SHARE
+    deletes: float = constants.DEFAULT_DELETE_SHARE
+
+    @property
+    def weights(self) -> Dict[Operation, float]:
+        """Return the relative weight of every operation."""
+        return {
+            Operation.READ: self.reads,
+            Operation.INSERT: self.inserts,
+            Operation.DELETE: self.deletes,
+        }
+
+
+def validate_workload(
+    configuration: Configuration, mix: WorkloadMix
+) -> Optional[str]:
+    """Return the reason a workload cannot run on a structure, or None."""
+    invalid = configuration.validate()
+    if invalid is not None:
+        return invalid
+    if min(mix.weights.values()) < 0 or sum(mix.weights.values()) <= 0:
+        return "Operation shares must be non-negative and not all zero"
+    if (
+        configuration.batch
+        or configuration.bloom_filter
+        or configuration.search_algorithm
+        == approach.SearchAlgorithm.GALLOPING_SEARCH
+    ):
+        return "Mixed workloads require single-target searches"
+    if configuration.storage != approach.Storage.MEMORY:
+        return "Mixed workloads keep the dataset in memory"
+    data_structure = configuration.data_structure
+    if data_structure not in INSERTS:
+        return f"{describe(data_structure).capitalize()} cannot insert values"
+    if mix.deletes > 0 and data_structure not in DELETES:
+        return f"{describe(data_structure).capitalize()} cannot delete values"
+    if (
+        data_structure in LIST_STRUCTURES
+        and configuration.search_algorithm not in LIST_SEARCHES
+    ):
+        # a model fitted to the list would go stale on the first write
+        return "Mixed workloads on a list require a list search"
+    return None
+
+
+def plan_operations(
+    dataset: List[Any],
+    new_values: List[Any],
+    mix: WorkloadMix,
+    operations: int,
+) -> List[Tuple[Operation, Any]]:
+    """Draw the operations of a workload and the value of each one.
+
+    Reads and deletes pick a value that is stored at that point, and
+    inserts take the next of the new values, so the plan is drawn before
+    anything is timed and every structure runs exactly the same one. An
+    operation that finds nothing stored turns into an insert.
+
+    Args:
+        dataset: Values stored before the first operation
+        new_values: Values to insert, at least one per operation
+        mix: Share of each operation
+        operations: Number of operations to draw
+
+    Returns:
+        List: Operation and value of every step, in order
+    """
+    weights = mix.weights
+    kinds = random.choices(
+        list(weights), weights=list(weights.values()), k=operations
+    )
+    # the stored values, in an order that makes picking and removing O(1)
+    stored = list(dataset)
+    fresh = iter(new_values)
+    plan: List[Tuple[Operation, Any]] = []
+    for kind in kinds:
+        operation = kind if stored else Operation.INSERT
+        if operation == Operation.INSERT:
+            value = next(fresh)
+            stored.append(value)
+        else:
+            position = random.randrange(len(stored))
+            value = stored[position]
+            if operation == Operation.DELETE:
+                stored[position] = stored[-1]
+                stored.pop()
+        plan.append((operation, value))
+    return plan
+
+
+@dataclass(frozen=True)
+class WorkloadResult:
+    """Class to store the latencies of one run of a mixed workload."""
+
+    # Number of values before and after the operations
+    size: int
+    final_size: int
+    # Latency of every operation of each kind, in seconds
+    latencies: Dict[Operation, List[float]]
+    # Reads that did not find their value, only possible in a structure
+    # that keeps one copy of duplicates and so deletes every copy at once
+    missed_reads: int
+
+    @property
+    def operations(self) -> int:
+        """Return the number of operations of every kind."""
+        return sum(len(values) for values in self.latencies.values())
+
+    @property
+    def throughput(self) -> float:
+        """Return the operations per second, excluding the clock reads."""
+        elapsed = sum(sum(values) for values in self.latencies.values())
+        return self.operations / elapsed if elapsed > 0 else 0.0
+
+    def percentiles(self, operation: Operation) -> Optional[List[float]]:
+        """Return the p50 and p99 of one kind, or None if it never ran."""
+        values = self.latencies.get(operation)
+        return percentiles(values, (50, 99)) if values else None
+
+
+def run_workload(
+    configuration: Configuration,
+    mix: WorkloadMix,
+    size: int,
+    operations: int,
+) -> WorkloadResult:
+    """Build a structure and run a mixed workload of operations on it.
+
+    With a lookup cache, every write drops the cached results that it
+    makes stale: a tree answers whether a value is stored, and the hash
+    index with a position that no other write moves, so a write drops its
+    own value, while a list answers with positions that one insert or
+    delete shifts, so a write clears the cache.
+
+    Args:
+        configuration: Structure and search to run the workload on
+        mix: Share of each operation
+        size: Number of values stored before the first operation
+        operations: Number of operations to run
+
+    Returns:
+        WorkloadResult: Latencies of every kind of operation
+    """
+    if configuration.seed is not None:
+        # the plan and treap priorities use Python's generator
+        random.seed(f"{configuration.seed}:{size}")
+    # the values to insert come from the same distribution as the dataset
+    values = generate_dataset(
+        size + operations,
+        configuration.data_type,
+        seed=configuration.seed,
+        cache=configuration.dataset_cache(),
+    )
+    dataset, new_values = values[:size], values[size:]
+    if configuration.needs_sorted:
+        dataset.sort()
+    plan = plan_operations(dataset, new_values, mix, operations)
+
+    structure = build_structure(configuration, dataset)
+    search_func = select_search_function(
+        configuration.search_algorithm, dataset, structure
+    )
+    target = dataset if structure is None else structure
+    insert = INSERTS[configuration.data_structure]
+    delete = DELETES.get(configuration.data_structure)
+
+    forget: Optional[Callable[[Any], None]] = None
+    if configuration.lookup_cache is not None:
+        cache = create_lookup_cache(
+            configuration.lookup_cache, configuration.lookup_cache_capacity
+        )
+        search_func = cache.wrap(search_func)
+        forget = (
+            (lambda _: cache.clear())
+            if structure is None
+            else cache.invalidate
+        )
+
+    found: List[bool] = []
+
+    def perform(step: Tuple[Operation, Any]) -> None:
+        operation, value = step
+        if operation == Operation.READ:
+            result = search_func(value)
+            found.append(result is not None and result is not False)
+            return
+        if operation == Operation.INSERT:
+            insert(target, value)
+        else:
+            delete(target, value)
+        if forget is not None:
+            forget(value)
+
+    timings = measure_latencies(perform, plan)
+    latencies: Dict[Operation, List[float]] = {}
+    for (operation, _), latency in zip(plan, timings):
+        latencies.setdefault(operation, []).append(latency)
+    inserted = len(latencies.get(Operation.INSERT, []))
+    deleted = len(latencies.get(Operation.DELETE, []))
+    return WorkloadResult(
+        size,
+        size + inserted - deleted,
+        latencies,
+        missed_reads=found.count(False),
+    )
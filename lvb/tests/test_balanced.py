@@ -0,0 +1,138 @@
+"""Test cases for the self-balancing trees."""
+
+import math
+import random
+
+import pytest
+
+from lvb.approach import DataStructure, InsertOrder
+from lvb.avl import AVLTree
+from lvb.generate import (
+    SELF_BALANCING_TREES,
+    generate_self_balancing_tree,
+    order_for_insertion,
+)
+from lvb.redblack import RedBlackTree
+from lvb.treap import Treap
+
+
+def _height(node):
+    if node is None:
+        return 0
+    return 1 + max(_height(node.l_child), _height(node.r_child))
+
+
+def _in_order(node):
+    if node is None:
+        return []
+    return [*_in_order(node.l_child), node.data, *_in_order(node.r_child)]
+
+
+def _black_height(node):
+    if node is None:
+        return 1
+    if node.red:
+        for child in (node.l_child, node.r_child):
+            assert child is None or not child.red
+    left = _black_height(node.l_child)
+    assert left == _black_height(node.r_child)
+    return left + (0 if node.red else 1)
+
+
+@pytest.mark.parametrize("tree_class", [AVLTree, RedBlackTree, Treap])
+@pytest.mark.parametrize("insert_order", list(InsertOrder))
+def test_trees_keep_values_in_order(tree_class, insert_order):
+    dataset = [random.randint(1, 500) for _ in range(1000)]
+    tree = tree_class()
+    for value in order_for_insertion(dataset, insert_order):
+        tree.insert(value)
+    assert _in_order(tree.root) == sorted(dataset)
+    for value in dataset:
+        assert tree.search(value) is True
+    assert tree.search(0) is False
+    assert tree.search(501) is False
+
+
+def test_avl_tree_stays_balanced_on_sorted_inserts():
+    size = 4096
+    tree = AVLTree()
+    for value in range(size):
+        tree.insert(value)
+    assert _height(tree.root) <= 1.45 * math.log2(size + 2)
+    assert tree.rotations > 0
+
+
+def test_red_black_tree_keeps_its_colouring():
+    size = 4096
+    tree = RedBlackTree()
+    for value in range(size, 0, -1):
+        tree.insert(value)
+    assert not tree.root.red
+    _black_height(tree.root)
+    assert _height(tree.root) <= 2 * math.log2(size + 1)
+
+
+def _avl_height(node):
+    if node is None:
+        return 0
+    left = _avl_height(node.l_child)
+    right = _avl_height(node.r_child)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+
+def _heap_ordered(node):
+    return node is None or all(
+        (child is None or child.priority <= node.priority)
+        and _heap_ordered(child)
+        for child in (node.l_child, node.r_child)
+    )
+
+
+@pytest.mark.parametrize("tree_class", [AVLTree, RedBlackTree, Treap])
+def test_trees_stay_balanced_through_deletes(tree_class):
+    dataset = [random.randint(1, 300) for _ in range(600)]
+    tree = tree_class()
+    for value in dataset:
+        tree.insert(value)
+    remaining = sorted(dataset)
+    for value in [*random.sample(dataset, len(dataset) // 2), 0]:
+        assert tree.delete(value) is (value in remaining)
+        if value in remaining:
+            remaining.remove(value)
+    assert _in_order(tree.root) == remaining
+    if tree_class is AVLTree:
+        _avl_height(tree.root)
+    elif tree_class is RedBlackTree:
+        assert not tree.root.red
+        _black_height(tree.root)
+        assert tree.root.parent is None
+    else:
+        assert _heap_ordered(tree.root)
+    for value in list(remaining):
+        assert tree.delete(value) is True
+    assert tree.root is None
+
+
+def test_balanced_order_needs_no_rotations():
+    tree = AVLTree()
+    for value in order_for_insertion(list(range(127)), InsertOrder.BALANCED):
+        tree.insert(value)
+    assert tree.rotations == 0
+
+
+@pytest.mark.parametrize("data_structure", list(SELF_BALANCING_TREES))
+def test_generate_self_balancing_tree(data_structure):
+    dataset = ["pear", "fig", "apple", "kiwi", "date"]
+    tree = generate_self_balancing_tree(
+        dataset, data_structure, InsertOrder.SORTED
+    )
+    for value in dataset:
+        assert tree.search(value) is True
+    assert tree.search("plum") is False
+
+
+def test_generate_rejects_other_structures():
+    with pytest.raises(ValueError):
+        generate_self_balancing_tree([1, 2], DataStructure.SORTED_LIST)
@@ -0,0 +1,54 @@
+"""Test cases for the batched search functions."""
+
+import numpy as np
+import pytest
+
+from lvb.binarysearch import binary_search_iterative, binary_search_many
+from lvb.linearsearch import linear_search, linear_search_many
+
+
+@pytest.mark.parametrize(
+    "dataset",
+    [
+        [7, 3, 9, 3, 1, 7, 7],
+        [2.5, 0.5, 2.5, 9.75],
+        ["pear", "fig", "apple", "fig", "kiwi"],
+    ],
+)
+def test_linear_search_many_matches_linear_search(dataset):
+    targets = [*dataset, dataset[0], min(dataset), max(dataset)]
+    missing = [0, -1.0] if not isinstance(dataset[0], str) else ["plum"]
+    targets += missing
+    expected = [linear_search(dataset, target) for target in targets]
+    assert linear_search_many(dataset, targets) == expected
+
+
+def test_linear_search_many_accepts_arrays():
+    dataset = np.array([4, 8, 15, 16, 23, 42])
+    assert linear_search_many(dataset, np.array([42, 5, 4])) == [5, None, 0]
+
+
+@pytest.mark.parametrize(
+    "dataset",
+    [
+        [1, 3, 3, 5, 8, 13, 21],
+        [0.5, 1.25, 2.5, 9.75],
+        ["apple", "fig", "kiwi", "pear"],
+    ],
+)
+def test_binary_search_many_finds_every_value(dataset):
+    indices = binary_search_many(dataset, dataset)
+    assert [dataset[index] for index in indices] == dataset
+    for value, index in zip(dataset, indices):
+        assert binary_search_iterative(dataset, value) is not None
+        assert dataset[index] == value
+
+
+def test_binary_search_many_misses():
+    dataset = [10, 20, 30]
+    assert binary_search_many(dataset, [5, 25, 35]) == [None, None, None]
+
+
+def test_search_many_on_empty_dataset():
+    assert linear_search_many([], [1, 2]) == [None, None]
+    assert binary_search_many([], [1]) == [None]
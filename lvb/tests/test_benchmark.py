@@ -0,0 +1,102 @@
+"""Test cases for the calibrated benchmark engine."""
+
+import gc
+
+import pytest
+
+from lvb import approach
+from lvb.benchmark import (
+    Measurement,
+    calibrate,
+    measure,
+    measure_latencies,
+    percentiles,
+)
+from lvb.experiment import Configuration, run_benchmark
+
+
+def test_measurement_statistics():
+    measurement = Measurement(times=[1.0, 2.0, 3.0], number=10, overhead=0.0)
+    assert measurement.mean == 2.0  # noqa: PLR2004
+    assert measurement.minimum == 1.0
+    assert measurement.stdev == 1.0
+    # t critical value for two degrees of freedom
+    expected_margin = 4.303 / 3**0.5
+    assert abs(measurement.margin - expected_margin) < 1e-9  # noqa: PLR2004
+
+
+def test_single_repeat_has_no_margin():
+    measurement = Measurement(times=[0.5], number=1, overhead=0.0)
+    assert measurement.stdev == 0.0
+    assert measurement.margin == 0.0
+
+
+def test_calibrate_reaches_target_time():
+    number = calibrate(lambda: sum(range(100)), 0.01)
+    assert number > 1
+
+
+def test_measure_repeats_and_restores_gc():
+    calls = []
+    measurement = measure(
+        lambda: calls.append(None), repeats=3, time_budget=0.01, warmup=4
+    )
+    repeats = 3
+    assert len(measurement.times) == repeats
+    assert all(time >= 0.0 for time in measurement.times)
+    assert len(calls) >= 4 + repeats * measurement.number
+    assert gc.isenabled()
+
+
+def test_measure_latencies_one_per_target():
+    targets = list(range(50))
+    latencies = measure_latencies(lambda target: target * 2, targets)
+    assert len(latencies) == len(targets)
+    assert all(latency >= 0.0 for latency in latencies)
+
+
+def test_percentiles():
+    values = [float(value) for value in range(1, 102)]
+    assert percentiles(values) == [51.0, 96.0, 100.0]
+    assert percentiles(values, (99.9,)) == [pytest.approx(100.9)]
+    assert percentiles([7.0]) == [7.0, 7.0, 7.0]
+    assert percentiles([]) == [0.0, 0.0, 0.0]
+
+
+def test_run_benchmark_reports_latencies_and_build():
+    configuration = Configuration(
+        data_structure=approach.DataStructure.EYTZINGER_TREE,
+        search_algorithm=approach.SearchAlgorithm.EYTZINGER_SEARCH,
+        searches=20,
+        repeats=2,
+        time_budget=0.01,
+    )
+    assert configuration.validate() is None
+    result = run_benchmark(configuration, 256)
+    assert len(result.latencies) == configuration.searches
+    assert "build_time" in result.details
+    assert result.elapsed_time == result.measurement.mean
+
+
+@pytest.mark.parametrize(
+    ("search_algorithm", "batch"),
+    [
+        (approach.SearchAlgorithm.GALLOPING_SEARCH, False),
+        (approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE, True),
+    ],
+    ids=str,
+)
+def test_batched_runs_time_one_call_without_latencies(search_algorithm, batch):
+    configuration = Configuration(
+        data_structure=approach.DataStructure.SORTED_LIST,
+        search_algorithm=search_algorithm,
+        batch=batch,
+        searches=20,
+        repeats=2,
+        time_budget=0.01,
+    )
+    assert configuration.validate() is None
+    result = run_benchmark(configuration, 256)
+    assert result.elapsed_time > 0
+    assert result.latencies == []
+    assert ("baseline_time" in result.details) is not batch
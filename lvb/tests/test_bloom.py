@@ -0,0 +1,65 @@
+"""Test cases for the hash index and the Bloom filter."""
+
+import random
+
+import pytest
+
+from lvb.bloom import BloomFilter
+from lvb.hashindex import HashIndex
+from lvb.linearsearch import linear_search
+
+
+def test_hash_index_returns_first_position():
+    dataset = ["fig", "kiwi", "fig", "pear", "kiwi"]
+    hash_index = HashIndex.from_dataset(dataset)
+    for value in dataset:
+        assert hash_index.search(value) == linear_search(dataset, value)
+    assert hash_index.search("plum") is None
+    assert len(hash_index) == len(set(dataset))
+
+
+def test_hash_index_inserts_after_the_last_position():
+    dataset = ["fig", "kiwi", "fig"]
+    hash_index = HashIndex.from_dataset(dataset)
+    hash_index.insert("pear")
+    hash_index.insert("kiwi")
+    assert hash_index.search("pear") == len(dataset)
+    assert hash_index.search("kiwi") == dataset.index("kiwi")
+    assert hash_index.delete("fig") is True
+    assert hash_index.delete("fig") is False
+    assert hash_index.search("fig") is None
+    assert hash_index.search("pear") == len(dataset)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    dataset = [random.randint(1, 10**9) for _ in range(2000)]
+    bloom = BloomFilter.from_dataset(dataset, len(dataset), 0.01)
+    assert all(value in bloom for value in dataset)
+
+
+def test_bloom_filter_false_positive_rate_is_close():
+    rate = 0.01
+    dataset = [f"key-{value}" for value in range(5000)]
+    bloom = BloomFilter.from_dataset(dataset, len(dataset), rate)
+    missing = [f"missing-{value}" for value in range(20000)]
+    measured = sum(value in bloom for value in missing) / len(missing)
+    assert measured < 3 * rate
+
+
+def test_bloom_filter_guard_skips_rejected_targets():
+    calls = []
+    bloom = BloomFilter.from_dataset([1.5, 2.5], 2, 0.001)
+
+    def search(target):
+        calls.append(target)
+        return True
+
+    guarded = bloom.guard(search)
+    assert guarded(1.5) is True
+    assert guarded(99.5) is None
+    assert calls == [1.5]
+
+
+def test_bloom_filter_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        BloomFilter(10, 1.5)
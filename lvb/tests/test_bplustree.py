@@ -0,0 +1,94 @@
+"""Test cases for the B+-tree."""
+
+import random
+from bisect import bisect_left, insort
+
+import pytest
+
+from lvb.bplustree import BPlusInternal, BPlusLeaf, BPlusTree
+
+
+def _leaf_keys(tree):
+    node = tree.root
+    while isinstance(node, BPlusInternal):
+        node = node.children[0]
+    keys = []
+    while node is not None:
+        keys.extend(node.keys)
+        node = node.next
+    return keys
+
+
+def _check_shape(tree, node=None, depth=1):
+    node = tree.root if node is None else node
+    if isinstance(node, BPlusLeaf):
+        assert depth == tree.height
+        assert len(node.keys) <= tree.fanout
+        return
+    assert len(node.children) == len(node.keys) + 1
+    assert len(node.children) <= tree.fanout
+    if node is not tree.root:
+        assert len(node.children) >= tree.minimum
+    for child in node.children:
+        _check_shape(tree, child, depth + 1)
+
+
+@pytest.mark.parametrize("fanout", [4, 5, 16, 64])
+def test_from_sorted_holds_every_value(fanout):
+    dataset = sorted(random.randint(1, 300) for _ in range(2000))
+    tree = BPlusTree.from_sorted(dataset, fanout)
+    _check_shape(tree)
+    assert _leaf_keys(tree) == dataset
+    for value in range(302):
+        assert tree.search(value) is (value in dataset)
+
+
+def test_from_sorted_stores_numbers_unboxed():
+    assert BPlusTree.from_sorted([1, 2, 3], 4).typecode == "q"
+    assert BPlusTree.from_sorted([0.5, 1.5], 4).typecode == "d"
+    assert BPlusTree.from_sorted(["a", "b"], 4).typecode is None
+
+
+@pytest.mark.parametrize("fanout", [4, 7, 32])
+def test_insert_and_delete_match_sorted_list(fanout):
+    delete_ratio = 0.45
+    tree = BPlusTree(fanout)
+    reference = []
+    for _ in range(4000):
+        value = random.randint(1, 400)
+        if reference and random.random() < delete_ratio:
+            value = random.choice(reference)
+            assert tree.delete(value) is True
+            del reference[bisect_left(reference, value)]
+        else:
+            tree.insert(value)
+            insort(reference, value)
+    _check_shape(tree)
+    assert _leaf_keys(tree) == reference
+    for value in range(402):
+        assert tree.search(value) is (value in reference)
+
+
+def test_delete_everything_collapses_the_tree():
+    dataset = list(range(500))
+    tree = BPlusTree.from_sorted(dataset, 8)
+    random.shuffle(dataset)
+    for value in dataset:
+        assert tree.delete(value) is True
+    assert tree.delete(1) is False
+    assert tree.height == 1
+    assert tree.node_count == 1
+    assert tree.search(1) is False
+
+
+def test_statistics():
+    levels = 3
+    tree = BPlusTree.from_sorted(list(range(1000)), 10)
+    assert tree.height == levels
+    assert tree.node_count == 100 + 10 + 1
+    assert tree.nbytes > 0
+
+
+def test_rejects_small_fanout():
+    with pytest.raises(ValueError):
+        BPlusTree(2)
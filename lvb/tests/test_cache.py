@@ -0,0 +1,55 @@
+"""Test cases for the on-disk dataset cache."""
+
+import os
+
+import numpy as np
+
+from lvb.approach import DataType
+from lvb.cache import DatasetCache
+from lvb.generate import generate_array, generate_dataset
+
+
+def test_cached_dataset_is_mapped_and_equal(tmp_path):
+    cache = DatasetCache(tmp_path)
+    first = generate_dataset(300, DataType.STRINGS, True, seed=5, cache=cache)
+    path = cache.path(300, DataType.STRINGS, True, 5)
+    assert path.exists()
+    loaded = generate_array(300, DataType.STRINGS, True, seed=5, cache=cache)
+    assert isinstance(loaded, np.memmap)
+    assert generate_dataset(300, DataType.STRINGS, True, 5, cache) == first
+
+
+def test_unseeded_datasets_are_not_cached(tmp_path):
+    cache = DatasetCache(tmp_path)
+    generate_dataset(100, DataType.INTEGERS, cache=cache)
+    assert cache.files() == []
+
+
+def test_key_separates_sortedness_and_type(tmp_path):
+    cache = DatasetCache(tmp_path)
+    for data_type in DataType:
+        for sorted_data in (False, True):
+            generate_array(64, data_type, sorted_data, seed=1, cache=cache)
+    assert len(cache.files()) == len(DataType) * 2
+
+
+def test_least_recently_used_file_is_evicted(tmp_path):
+    cache = DatasetCache(tmp_path)
+    for size in (1000, 2000, 3000):
+        generate_array(size, DataType.FLOATS, seed=2, cache=cache)
+    oldest, middle, newest = cache.files()
+    # using the oldest file makes the middle one the next to go
+    os.utime(oldest, (1, 1))
+    os.utime(middle, (0, 0))
+    cache.load(1000, DataType.FLOATS, False, 2)
+    cache.size_limit = cache.nbytes - 1
+    assert cache.evict(keep=newest) == [middle]
+    assert set(cache.files()) == {oldest, newest}
+
+
+def test_truncated_file_is_a_miss(tmp_path):
+    cache = DatasetCache(tmp_path)
+    generate_array(100, DataType.INTEGERS, seed=3, cache=cache)
+    path = cache.path(100, DataType.INTEGERS, False, 3)
+    path.write_bytes(path.read_bytes()[:50])
+    assert cache.load(100, DataType.INTEGERS, False, 3) is None
@@ -0,0 +1,60 @@
+"""Test cases for fitting search times to complexity classes."""
+
+import math
+
+import pytest
+
+from lvb.complexity import (
+    analyze_scaling,
+    doubling_ratios,
+    fit_model,
+    power_law_exponent,
+)
+
+SIZES = [1000 * 2**run for run in range(6)]
+
+
+def test_doubling_ratios_compare_consecutive_runs():
+    assert doubling_ratios([1.0, 2.0, 3.0]) == [2.0, 1.5]
+    assert doubling_ratios([0.0, 1.0]) == [math.inf]
+
+
+def test_power_law_exponent_recovers_the_power():
+    times = [3e-9 * size**2 for size in SIZES]
+    assert power_law_exponent(SIZES, times) == pytest.approx(2.0)
+    assert math.isnan(power_law_exponent([1000], [1.0]))
+
+
+@pytest.mark.parametrize(
+    ("name", "growth"),
+    [
+        ("log n", math.log2),
+        ("n", float),
+        ("n log n", lambda size: size * math.log2(size)),
+    ],
+)
+def test_best_fit_is_the_model_that_made_the_times(name, growth):
+    times = [2e-6 + 5e-9 * growth(size) for size in SIZES]
+    analysis = analyze_scaling(SIZES, times)
+    assert analysis.best.name == name
+    assert analysis.best.r_squared == pytest.approx(1.0)
+    assert analysis.best.predict(10 * SIZES[-1]) == pytest.approx(
+        2e-6 + 5e-9 * growth(10 * SIZES[-1])
+    )
+
+
+def test_flat_times_stay_constant():
+    times = [1.0, 1.02, 0.99, 1.01, 0.98, 1.0]
+    analysis = analyze_scaling(SIZES, times)
+    assert analysis.best.name == "1"
+    assert analysis.best.predict(10**9) == pytest.approx(1.0, rel=0.05)
+
+
+def test_shrinking_times_fit_no_growth_model():
+    assert fit_model("n", SIZES, [6.0, 5.0, 4.0, 3.0, 2.0, 1.0]) is None
+
+
+def test_too_few_sizes_report_ratios_only():
+    analysis = analyze_scaling(SIZES[:2], [1.0, 2.0])
+    assert analysis.ratios == [2.0]
+    assert analysis.best is None
@@ -0,0 +1,59 @@
+"""Test cases for the Eytzinger tree."""
+
+from array import array
+
+import pytest
+
+from lvb.eytzinger import EytzingerTree
+
+
+@pytest.fixture
+def sample_tree():
+    return EytzingerTree.from_sorted([20, 30, 40, 50, 60, 70, 80])
+
+
+def test_layout_is_breadth_first(sample_tree):
+    assert list(sample_tree.layout[1:]) == [50, 30, 70, 20, 40, 60, 80]
+
+
+def test_integers_are_stored_unboxed(sample_tree):
+    assert isinstance(sample_tree.layout, array)
+    assert sample_tree.layout.typecode == "q"
+
+
+def test_floats_are_stored_unboxed():
+    tree = EytzingerTree.from_sorted([0.5, 1.5, 2.5])
+    assert tree.layout.typecode == "d"
+    assert tree.search(1.5) is True
+
+
+def test_large_integers_fall_back_to_list():
+    tree = EytzingerTree.from_sorted([1, 2**70])
+    assert isinstance(tree.layout, list)
+    assert tree.search(2**70) is True
+
+
+def test_search_every_value(sample_tree):
+    for value in [20, 30, 40, 50, 60, 70, 80]:
+        assert sample_tree.search(value) is True
+
+
+def test_search_non_existing_value(sample_tree):
+    assert sample_tree.search(99) is False
+    assert sample_tree.search(45) is False
+    assert sample_tree.search(1) is False
+
+
+def test_search_strings_with_duplicates():
+    values = sorted(["kiwi", "apple", "fig", "apple", "plum", "date"])
+    tree = EytzingerTree.from_sorted(values)
+    assert len(tree) == len(values)
+    for value in values:
+        assert tree.search(value) is True
+    assert tree.search("banana") is False
+
+
+def test_search_in_empty_tree():
+    tree = EytzingerTree.from_sorted([])
+    assert len(tree) == 0
+    assert tree.search(5) is False
@@ -0,0 +1,39 @@
+"""Test cases for the galloping merge search."""
+
+import random
+
+from lvb.binarysearch import binary_search_many
+from lvb.gallopingsearch import galloping_search_many
+
+
+def test_results_keep_target_order():
+    dataset = [2, 3, 5, 7, 11, 13, 17, 19, 23]
+    targets = [19, 2, 4, 23, 7, 7, 100, 0]
+    assert galloping_search_many(dataset, targets) == [
+        7,
+        0,
+        None,
+        8,
+        3,
+        3,
+        None,
+        None,
+    ]
+
+
+def test_matches_binary_search_many():
+    dataset = sorted(random.randint(1, 10000) for _ in range(5000))
+    targets = [random.randint(0, 10001) for _ in range(300)]
+    expected = binary_search_many(dataset, targets)
+    assert galloping_search_many(dataset, targets) == expected
+
+
+def test_strings_and_duplicates():
+    dataset = ["apple", "fig", "fig", "fig", "kiwi", "pear"]
+    targets = ["pear", "fig", "banana", "apple"]
+    assert galloping_search_many(dataset, targets) == [5, 1, None, 0]
+
+
+def test_empty_inputs():
+    assert galloping_search_many([], [1, 2]) == [None, None]
+    assert galloping_search_many([1, 2], []) == []
@@ -0,0 +1,86 @@
+"""Test cases for the data generation functions."""
+
+import math
+
+from lvb.approach import DataType
+from lvb.bst import BinarySearchTree
+from lvb.constants import constants
+from lvb.generate import generate_binary_search_tree, generate_dataset
+
+
+def _height(node):
+    if node is None:
+        return 0
+    return 1 + max(_height(node.l_child), _height(node.r_child))
+
+
+def _in_order(node):
+    if node is None:
+        return []
+    return [*_in_order(node.l_child), node.data, *_in_order(node.r_child)]
+
+
+def test_from_sorted_links_medians():
+    bst = BinarySearchTree.from_sorted([20, 30, 40, 50, 60, 70, 80])
+    root = bst.root
+    assert [root.data, root.l_child.data, root.r_child.data] == [50, 30, 70]
+    assert _in_order(root) == [20, 30, 40, 50, 60, 70, 80]
+
+
+def test_from_sorted_empty():
+    bst = BinarySearchTree.from_sorted([])
+    assert bst.root is None
+    assert bst.search(1) is False
+
+
+def test_generate_binary_search_tree_is_balanced():
+    size = 1000
+    dataset = generate_dataset(size, DataType.INTEGERS)
+    bst = generate_binary_search_tree(dataset)
+    assert _in_order(bst.root) == sorted(dataset)
+    assert _height(bst.root) == math.ceil(math.log2(size + 1))
+    for value in dataset:
+        assert bst.search(value) is True
+
+
+def test_sorted_inserts_do_not_recurse():
+    size = 5000
+    bst = BinarySearchTree()
+    for value in range(size):
+        bst.insert(value)
+    assert bst.search(size - 1) is True
+    assert bst.search(size) is False
+
+
+def test_seeded_datasets_repeat():
+    for data_type in DataType:
+        first = generate_dataset(500, data_type, seed=7)
+        second = generate_dataset(500, data_type, seed=7)
+        assert first == second
+        assert generate_dataset(500, data_type, seed=8) != first
+
+
+def test_generated_values_stay_in_range():
+    size = 2000
+    integers = generate_dataset(size, DataType.INTEGERS, sorted_data=True)
+    assert integers == sorted(integers)
+    assert all(isinstance(value, int) for value in integers)
+    assert integers[0] >= constants.RANDOM_INT_MIN
+    assert integers[-1] <= constants.RANDOM_INT_MAX
+    floats = generate_dataset(size, DataType.FLOATS)
+    assert all(isinstance(value, float) for value in floats)
+    assert min(floats) >= constants.RANDOM_FLOAT_MIN
+    assert max(floats) <= constants.RANDOM_FLOAT_MAX
+
+
+def test_generated_strings_sort_like_python():
+    strings = generate_dataset(2000, DataType.STRINGS, sorted_data=True)
+    assert strings == sorted(strings)
+    assert all(len(value) == constants.STRING_LENGTH for value in strings)
+    assert all(value.isalnum() for value in strings)
+
+
+def test_presorted_tree_skips_sorting():
+    dataset = generate_dataset(1000, DataType.FLOATS, sorted_data=True)
+    bst = generate_binary_search_tree(dataset, sorted_data=True)
+    assert _in_order(bst.root) == dataset
@@ -0,0 +1,165 @@
+"""Test cases for datasets that grow across runs instead of regenerating."""
+
+import copy
+import gc
+import random
+
+import pytest
+
+from lvb import approach
+from lvb.approach import DataStructure, DataType, InsertOrder, SearchAlgorithm
+from lvb.experiment import Configuration
+from lvb.generate import generate_growth, order_for_insertion
+from lvb.incremental import (
+    collection_paused,
+    grow_structure,
+    run_incremental,
+    validate_incremental,
+)
+from lvb.sweep import doubling_sizes
+
+SIZES = doubling_sizes(100, 3)
+
+OLD = [10, 20, 30, 40]
+
+NEW = [5, 25, 45]
+
+
+def _in_order(node):
+    if node is None:
+        return []
+    return [*_in_order(node.l_child), node.data, *_in_order(node.r_child)]
+
+
+def test_growth_repeats_with_a_seed_and_sorts_on_request():
+    size, new_size = SIZES[:2]
+    growth = generate_growth(size, new_size, DataType.INTEGERS, seed=1)
+    assert len(growth) == new_size - size
+    assert generate_growth(size, new_size, DataType.INTEGERS, seed=1) == (
+        growth
+    )
+    assert generate_growth(0, size, DataType.INTEGERS, seed=1) != growth
+    strings = generate_growth(0, 10, DataType.STRINGS, sorted_data=True)
+    assert strings == sorted(strings)
+    assert all(isinstance(value, str) for value in strings)
+
+
+def test_random_trees_take_the_new_values_by_insertion():
+    configuration = Configuration(
+        data_structure=DataStructure.BINARY_SEARCH_TREE,
+        search_algorithm=SearchAlgorithm.BST_SEARCH,
+        insert_order=InsertOrder.RANDOM,
+    )
+    tree = grow_structure(configuration, None, OLD, OLD)
+    grown = grow_structure(configuration, tree, sorted(OLD + NEW), NEW)
+    assert grown is tree
+    assert _in_order(grown.root) == sorted(OLD + NEW)
+
+
+def test_grown_trees_count_the_rotations_of_one_run():
+    configuration = Configuration(
+        data_structure=DataStructure.AVL_TREE,
+        search_algorithm=SearchAlgorithm.BST_SEARCH,
+        insert_order=InsertOrder.RANDOM,
+    )
+    tree = grow_structure(configuration, None, sorted(OLD), OLD)
+    # rotations left over from the runs before this one
+    tree.rotations += len(OLD)
+    expected = copy.deepcopy(tree)
+    expected.rotations = 0
+    random.seed(9)
+    for value in order_for_insertion(NEW, InsertOrder.RANDOM):
+        expected.insert(value)
+    random.seed(9)
+    grown = grow_structure(configuration, tree, sorted(OLD + NEW), NEW)
+    assert grown is tree
+    assert grown.rotations == expected.rotations
+
+
+def test_balanced_trees_are_rebuilt_from_the_merged_values():
+    configuration = Configuration(
+        data_structure=DataStructure.BINARY_SEARCH_TREE,
+        search_algorithm=SearchAlgorithm.BST_SEARCH,
+    )
+    tree = grow_structure(configuration, None, OLD, OLD)
+    grown = grow_structure(configuration, tree, sorted(OLD + NEW), NEW)
+    assert grown is not tree
+    assert _in_order(grown.root) == sorted(OLD + NEW)
+
+
+def test_collection_is_paused_only_inside_the_block():
+    assert gc.isenabled()
+    with collection_paused():
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+
+@pytest.mark.parametrize(
+    ("data_structure", "search_algorithm", "insert_order"),
+    [
+        (
+            DataStructure.SORTED_LIST,
+            SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+            InsertOrder.BALANCED,
+        ),
+        (
+            DataStructure.UNSORTED_LIST,
+            SearchAlgorithm.LINEAR_SEARCH,
+            InsertOrder.BALANCED,
+        ),
+        (
+            DataStructure.BINARY_SEARCH_TREE,
+            SearchAlgorithm.BST_SEARCH,
+            InsertOrder.RANDOM,
+        ),
+        (
+            DataStructure.TREAP,
+            SearchAlgorithm.BST_SEARCH,
+            InsertOrder.RANDOM,
+        ),
+        (
+            DataStructure.B_PLUS_TREE,
+            SearchAlgorithm.B_PLUS_TREE_SEARCH,
+            InsertOrder.BALANCED,
+        ),
+        (
+            DataStructure.EYTZINGER_TREE,
+            SearchAlgorithm.EYTZINGER_SEARCH,
+            InsertOrder.BALANCED,
+        ),
+    ],
+)
+def test_every_structure_grows_across_runs(
+    data_structure, search_algorithm, insert_order
+):
+    configuration = Configuration(
+        data_structure=data_structure,
+        search_algorithm=search_algorithm,
+        insert_order=insert_order,
+        searches=20,
+        repeats=2,
+        time_budget=0.001,
+        seed=2,
+    )
+    results = list(run_incremental(configuration, SIZES))
+    assert [result.size for result in results] == SIZES
+    for result in results:
+        assert result.details["merge_time"] >= 0
+        assert result.elapsed_time > 0
+
+
+def test_incremental_runs_grow_in_memory_in_one_process():
+    configuration = Configuration(
+        data_structure=DataStructure.SORTED_LIST,
+        search_algorithm=SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+    )
+    assert validate_incremental(configuration) is None
+    assert validate_incremental(configuration, jobs=2)
+    mapped = Configuration(
+        data_structure=DataStructure.SORTED_LIST,
+        search_algorithm=SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+        storage=approach.Storage.MMAP,
+    )
+    assert validate_incremental(mapped)
+    with pytest.raises(ValueError, match="grow"):
+        list(run_incremental(configuration, [SIZES[1], SIZES[0]]))
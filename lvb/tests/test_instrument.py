@@ -0,0 +1,111 @@
+"""Test cases for counting the comparisons and probes of searches."""
+
+import math
+import pstats
+
+import pytest
+
+from lvb import approach
+from lvb.binarysearch import binary_search_iterative
+from lvb.experiment import Configuration, run_benchmark
+from lvb.instrument import (
+    CountingKey,
+    ProbeRecorder,
+    SearchLog,
+    count_searches,
+    profile_call,
+)
+from lvb.linearsearch import linear_search
+from lvb.sweep import sweep_configurations
+
+DATASET = list(range(0, 2048, 2))
+
+
+def test_counting_key_sees_reflected_comparisons():
+    log = SearchLog()
+    key = CountingKey(DATASET[2], log)
+    assert DATASET[1] < key
+    assert key == DATASET[2]
+    assert key - DATASET[1] == DATASET[2] - DATASET[1]
+    assert hash(key) == hash(DATASET[2])
+    assert log.comparisons == len(log.keys)
+    assert log.keys == [DATASET[1], DATASET[2]]
+
+
+def test_probe_recorder_notes_every_position_read():
+    log = SearchLog()
+    recorded = ProbeRecorder(DATASET, log)
+    index = binary_search_iterative(recorded, DATASET[3])
+    assert DATASET[index] == DATASET[3]
+    assert len(log.indices) <= math.ceil(math.log2(len(DATASET))) + 1
+    assert log.indices[0] == (len(DATASET) - 1) // 2
+
+
+def test_linear_search_probes_every_position_before_the_target():
+    targets = [DATASET[0], DATASET[10]]
+    details = count_searches(linear_search, DATASET, None, targets, True)
+    assert details["probe_traces"] == [[0], list(range(11))]
+    assert details["max_probes"] == len(details["probe_traces"][1])
+    assert details["mean_probe_stride"] == 1.0
+
+
+def test_binary_search_comparisons_grow_logarithmically():
+    details = count_searches(binary_search_iterative, DATASET, None, DATASET)
+    assert details["max_probes"] <= math.ceil(math.log2(len(DATASET))) + 1
+    assert "probe_traces" not in details
+
+
+@pytest.mark.parametrize(
+    "configuration",
+    sweep_configurations(
+        Configuration(
+            data_structure=approach.DataStructure.UNSORTED_LIST,
+            search_algorithm=approach.SearchAlgorithm.LINEAR_SEARCH,
+            searches=5,
+            repeats=1,
+            time_budget=0.001,
+            warmup=0,
+            seed=9,
+            instrument=True,
+        ),
+        list(approach.DataStructure),
+        [
+            algorithm
+            for algorithm in approach.SearchAlgorithm
+            if algorithm != approach.SearchAlgorithm.GALLOPING_SEARCH
+        ],
+        [approach.DataType.INTEGERS],
+        [approach.TargetPosition.RANDOM],
+    ),
+    ids=lambda configuration: (
+        f"{configuration.data_structure}-{configuration.search_algorithm}"
+    ),
+)
+def test_every_search_counts_its_work(configuration):
+    details = run_benchmark(configuration, 200).details
+    assert details["comparisons_per_search"] >= 1
+    assert details["max_probes"] >= details["probes_per_search"] >= 1
+
+
+def test_instrumented_runs_report_work_beside_time():
+    configuration = Configuration(
+        data_structure=approach.DataStructure.SORTED_LIST,
+        search_algorithm=approach.SearchAlgorithm.EXPONENTIAL_SEARCH,
+        searches=10,
+        repeats=2,
+        time_budget=0.01,
+        seed=3,
+        instrument=True,
+        trace=True,
+    )
+    result = run_benchmark(configuration, 500)
+    assert result.details["probes_per_search"] > 1
+    assert len(result.details["probe_traces"]) == configuration.searches
+
+
+def test_profile_returns_the_value_and_dumps_stats(tmp_path):
+    path = tmp_path / "run.prof"
+    value, stats = profile_call(lambda: sum(DATASET), str(path))
+    assert value == sum(DATASET)
+    assert path.exists()
+    assert isinstance(stats, pstats.Stats)
@@ -0,0 +1,169 @@
+"""Test cases for the caches of search results and their eviction."""
+
+import pytest
+
+from lvb import approach
+from lvb.approach import CachePolicy
+from lvb.experiment import Configuration, run_benchmark
+from lvb.lookupcache import (
+    LOOKUP_CACHES,
+    MISSING,
+    LFUCache,
+    LookupCache,
+    LRUCache,
+    cache_statistics,
+    create_lookup_cache,
+)
+
+CAPACITY = 8
+
+
+def _fill(cache, keys):
+    """Look up every key through the cache, caching the misses."""
+    for key in keys:
+        if cache.get(key) is MISSING:
+            cache.put(key, key * 10)
+
+
+@pytest.mark.parametrize("policy", list(CachePolicy), ids=str)
+def test_every_cache_stays_within_its_capacity(policy):
+    cache = create_lookup_cache(policy, CAPACITY)
+    _fill(cache, range(CAPACITY * 4))
+    assert len(cache) == CAPACITY
+    assert cache.evictions == CAPACITY * 3
+    assert cache.misses == CAPACITY * 4
+    assert cache.hits == 0
+    assert cache.hit_rate == 0.0
+
+
+@pytest.mark.parametrize("policy", list(CachePolicy), ids=str)
+def test_every_cache_answers_repeats_and_forgets_invalidated_keys(policy):
+    cache = create_lookup_cache(policy, CAPACITY)
+    _fill(cache, [1, 2, 1, 2])
+    assert cache.get(1) == 1 * 10
+    cache.invalidate(1)
+    cache.invalidate(99)
+    assert cache.get(1) is MISSING
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get(2) is MISSING
+
+
+@pytest.mark.parametrize("policy", list(CachePolicy), ids=str)
+def test_caches_reuse_room_left_by_invalidated_keys(policy):
+    cache = create_lookup_cache(policy, CAPACITY)
+    _fill(cache, range(CAPACITY * 2))
+    for key in range(CAPACITY * 2):
+        cache.invalidate(key)
+    evictions = cache.evictions
+    _fill(cache, range(CAPACITY * 2, CAPACITY * 3))
+    assert cache.evictions == evictions
+    assert len(cache) == CAPACITY
+
+
+def test_lru_evicts_the_least_recently_used():
+    cache = LRUCache(2)
+    _fill(cache, [1, 2, 1, 3])
+    assert cache.get(2) is MISSING
+    assert cache.get(1) == 1 * 10
+
+
+def test_lfu_evicts_the_least_frequently_used():
+    cache = LFUCache(2)
+    _fill(cache, [1, 1, 1, 2, 2, 3])
+    # 3 evicts 2, the less used of the two, and is the next to go
+    assert cache.get(2) is MISSING
+    _fill(cache, [4])
+    assert cache.get(3) is MISSING
+    assert cache.get(1) == 1 * 10
+
+
+@pytest.mark.parametrize(
+    "policy", [CachePolicy.ARC, CachePolicy.TWO_QUEUE], ids=str
+)
+def test_scan_resistant_caches_keep_hot_keys_through_a_scan(policy):
+    hot = list(range(CAPACITY // 2))
+    cache = create_lookup_cache(policy, CAPACITY)
+    # hot keys are used twice, and used again just after a first scan
+    _fill(cache, hot + hot)
+    _fill(cache, range(100, 100 + CAPACITY))
+    _fill(cache, hot)
+    cache.reset_counters()
+    _fill(cache, range(200, 200 + CAPACITY * 2))
+    _fill(cache, hot)
+    assert cache.hits == len(hot)
+    lru = LRUCache(CAPACITY)
+    _fill(lru, hot + list(range(200, 200 + CAPACITY * 2)) + hot)
+    assert lru.hits == 0
+
+
+def test_capacity_must_hold_a_result():
+    for cache_class in LOOKUP_CACHES.values():
+        with pytest.raises(ValueError, match="at least one"):
+            cache_class(0)
+
+
+def test_caches_must_implement_every_operation():
+    class Unbounded(LookupCache):
+        def get(self, key):
+            return MISSING
+
+    with pytest.raises(TypeError, match="abstract"):
+        Unbounded(CAPACITY)
+
+
+def test_statistics_split_hits_from_misses():
+    cache = LRUCache(CAPACITY)
+    search = cache.wrap(lambda target: target)
+    targets = [1, 2, 1, 2, 3]
+    details = cache_statistics(cache, search, targets)
+    assert details["cache_hits"] == targets.count(1) + targets.count(2) - 2
+    assert details["cache_misses"] == len(set(targets))
+    assert details["cache_hit_rate"] == pytest.approx(2 / len(targets))
+    assert details["cache_hit_p99"] >= details["cache_hit_p50"]
+    assert "cache_miss_p50" in details
+
+
+def test_cache_requires_single_searches_that_only_read():
+    for configuration in [
+        Configuration(
+            data_structure=approach.DataStructure.SORTED_LIST,
+            search_algorithm=approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+            batch=True,
+            lookup_cache=CachePolicy.LRU,
+        ),
+        Configuration(
+            data_structure=approach.DataStructure.SPLAY_TREE,
+            search_algorithm=approach.SearchAlgorithm.BST_SEARCH,
+            lookup_cache=CachePolicy.LRU,
+        ),
+        Configuration(
+            data_structure=approach.DataStructure.UNSORTED_LIST,
+            search_algorithm=approach.SearchAlgorithm.LINEAR_SEARCH,
+            storage=approach.Storage.MMAP,
+            lookup_cache=CachePolicy.LRU,
+        ),
+    ]:
+        assert configuration.validate()
+
+
+@pytest.mark.parametrize("policy", list(CachePolicy), ids=str)
+def test_cached_runs_report_their_hit_rate(policy):
+    configuration = Configuration(
+        data_structure=approach.DataStructure.EYTZINGER_TREE,
+        search_algorithm=approach.SearchAlgorithm.EYTZINGER_SEARCH,
+        target_position=approach.TargetPosition.HOT_SET,
+        searches=200,
+        repeats=2,
+        time_budget=0.01,
+        seed=6,
+        lookup_cache=policy,
+        lookup_cache_capacity=CAPACITY * 2,
+    )
+    assert configuration.validate() is None
+    details = run_benchmark(configuration, 1000).details
+    assert details["cache_hits"] + details["cache_misses"] == (
+        configuration.searches
+    )
+    # ten hot values fit in the cache, and take most of the searches
+    assert details["cache_hit_rate"] > 0.5  # noqa: PLR2004
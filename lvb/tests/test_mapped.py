@@ -0,0 +1,105 @@
+"""Test cases for searching a memory-mapped dataset."""
+
+import mmap
+
+from lvb import approach
+from lvb.approach import DataType, TargetPosition
+from lvb.binarysearch import binary_search_iterative
+from lvb.cache import DatasetCache
+from lvb.experiment import Configuration, run_benchmark
+from lvb.generate import generate_dataset, select_array_targets
+from lvb.linearsearch import linear_search
+from lvb.mapped import open_mapped_dataset
+
+
+def test_mapped_values_match_in_memory_generation():
+    for data_type in DataType:
+        with open_mapped_dataset(3000, data_type, True, seed=11) as mapped:
+            expected = generate_dataset(3000, data_type, True, seed=11)
+            assert mapped.values.tolist() == [
+                value.encode() if isinstance(value, str) else value
+                for value in expected
+            ]
+
+
+def test_binary_search_agrees_with_list():
+    dataset = generate_dataset(5000, DataType.STRINGS, True, seed=2)
+    with open_mapped_dataset(5000, DataType.STRINGS, True, seed=2) as mapped:
+        for target in [*dataset[::97], "zzzzzzzzzzz", "0"]:
+            found = mapped.binary_search(target)
+            expected = binary_search_iterative(dataset, target)
+            assert (found is None) == (expected is None)
+            if found is not None:
+                assert dataset[found] == target
+        assert mapped.lookups > 0
+        assert mapped.pages_touched >= mapped.lookups
+
+
+def test_streaming_scan_counts_bytes_read():
+    dataset = generate_dataset(200_000, DataType.INTEGERS, seed=3)
+    with open_mapped_dataset(200_000, DataType.INTEGERS, seed=3) as mapped:
+        target = dataset[150_000]
+        assert mapped.linear_search(target) == linear_search(dataset, target)
+        assert mapped.linear_search(-1) is None
+        # the missing target streams the whole file
+        assert mapped.bytes_read >= len(dataset) * mapped.itemsize
+        assert mapped.pages_touched >= (
+            len(dataset) * mapped.itemsize // mmap.PAGESIZE
+        )
+
+
+def test_temporary_file_is_deleted_and_cached_file_kept(tmp_path):
+    with open_mapped_dataset(100, DataType.FLOATS) as mapped:
+        temporary = mapped.path
+    assert not temporary.exists()
+    cache = DatasetCache(tmp_path)
+    with open_mapped_dataset(100, DataType.FLOATS, seed=1, cache=cache):
+        pass
+    assert cache.path(100, DataType.FLOATS, False, 1).exists()
+
+
+def test_mapped_targets_are_python_values():
+    with open_mapped_dataset(500, DataType.STRINGS, True, seed=4) as mapped:
+        existing = select_array_targets(
+            mapped.values, TargetPosition.END, 10, DataType.STRINGS
+        )
+        missing = select_array_targets(
+            mapped.values, TargetPosition.NONEXISTENT, 10, DataType.STRINGS
+        )
+        assert all(mapped.binary_search(target) for target in existing)
+        assert all(mapped.binary_search(target) is None for target in missing)
+
+
+def test_run_benchmark_on_mapped_storage():
+    configuration = Configuration(
+        data_structure=approach.DataStructure.SORTED_LIST,
+        search_algorithm=approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+        searches=10,
+        repeats=2,
+        time_budget=0.01,
+        storage=approach.Storage.MMAP,
+    )
+    assert configuration.validate() is None
+    result = run_benchmark(configuration, 1000)
+    assert len(result.details["cold_latencies"]) == configuration.searches
+    assert result.details["pages_per_lookup"] >= 1
+
+
+def test_mapped_storage_rejects_structures():
+    configuration = Configuration(
+        data_structure=approach.DataStructure.AVL_TREE,
+        search_algorithm=approach.SearchAlgorithm.BST_SEARCH,
+        storage=approach.Storage.MMAP,
+    )
+    assert configuration.validate() is not None
+
+
+def test_mapped_storage_rejects_memory_and_instrumentation():
+    for option in ["memory", "instrument"]:
+        configuration = Configuration(
+            data_structure=approach.DataStructure.UNSORTED_LIST,
+            search_algorithm=approach.SearchAlgorithm.LINEAR_SEARCH,
+            storage=approach.Storage.MMAP,
+            **{option: True},
+        )
+        assert "Mapped storage" in configuration.validate()
@@ -0,0 +1,71 @@
+"""Test cases for measuring the memory of structures and searches."""
+
+import sys
+
+import numpy as np
+import pytest
+
+from lvb import approach
+from lvb.bst import BinarySearchTree
+from lvb.experiment import Configuration, run_benchmark
+from lvb.memory import current_rss, deep_size, measure_memory
+from lvb.sweep import sweep_configurations
+
+SIZE = 200
+
+
+def test_deep_size_counts_shared_objects_once():
+    item = [0] * 100
+    assert deep_size([item, item]) == sys.getsizeof([item, item]) + (
+        deep_size(item)
+    )
+
+
+def test_deep_size_follows_slots_and_array_bases():
+    tree = BinarySearchTree()
+    for value in range(1000, 1000 + SIZE):
+        tree.insert(value)
+    values = list(range(1000, 1000 + SIZE))
+    # every node holds a key, so the tree outweighs a list of the same keys
+    assert deep_size(tree) > deep_size(values)
+    array = np.arange(SIZE)
+    assert deep_size(array[10:]) > array.nbytes
+
+
+def test_measure_memory_reports_build_and_search():
+    values = list(range(SIZE))
+    details = measure_memory(lambda: set(values), SIZE, lambda: sum(values))
+    assert details["deep_size"] >= sys.getsizeof(set(values))
+    assert details["deep_bytes_per_key"] == details["deep_size"] / SIZE
+    assert details["build_peak"] >= details["build_retained"] > 0
+    assert "search_peak" in details and "search_blocks" in details
+    assert ("rss_delta" in details) == (current_rss() is not None)
+
+
+@pytest.mark.parametrize(
+    "configuration",
+    sweep_configurations(
+        Configuration(
+            data_structure=approach.DataStructure.UNSORTED_LIST,
+            search_algorithm=approach.SearchAlgorithm.LINEAR_SEARCH,
+            searches=5,
+            repeats=1,
+            time_budget=0.001,
+            warmup=0,
+            seed=9,
+            memory=True,
+        ),
+        list(approach.DataStructure),
+        list(approach.SearchAlgorithm),
+        [approach.DataType.INTEGERS],
+        [approach.TargetPosition.RANDOM],
+    ),
+    ids=lambda configuration: (
+        f"{configuration.data_structure}-{configuration.search_algorithm}"
+    ),
+)
+def test_every_structure_is_measured(configuration):
+    details = run_benchmark(configuration, SIZE).details
+    assert details["deep_bytes_per_key"] > 0
+    assert "build_peak" in details
+    assert "search_peak" in details
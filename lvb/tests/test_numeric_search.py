@@ -0,0 +1,64 @@
+"""Test cases for the interpolation, exponential and learned searches."""
+
+import random
+
+import pytest
+
+from lvb.binarysearch import exponential_search
+from lvb.generate import generate_learned_index
+from lvb.interpolationsearch import interpolation_search
+from lvb.learnedindex import LearnedIndex
+
+
+@pytest.fixture
+def sorted_integers():
+    return sorted(random.randint(1, 10000) for _ in range(3000))
+
+
+@pytest.fixture
+def sorted_floats():
+    return sorted(random.uniform(0.0, 10000.0) for _ in range(3000))
+
+
+@pytest.mark.parametrize("search", [interpolation_search, exponential_search])
+def test_search_finds_every_value(search, sorted_integers, sorted_floats):
+    for dataset in (sorted_integers, sorted_floats):
+        for value in dataset[::7]:
+            assert dataset[search(dataset, value)] == value
+
+
+@pytest.mark.parametrize("search", [interpolation_search, exponential_search])
+def test_search_misses(search):
+    dataset = [10, 20, 20, 20, 40]
+    for target in [5, 15, 30, 45]:
+        assert search(dataset, target) is None
+    assert search([], 1) is None
+
+
+def test_exponential_search_on_strings():
+    dataset = ["apple", "fig", "kiwi", "pear", "plum"]
+    assert exponential_search(dataset, "plum") == dataset.index("plum")
+    assert exponential_search(dataset, "banana") is None
+
+
+def test_learned_index_returns_first_position(sorted_integers):
+    learned_index = generate_learned_index(sorted_integers)
+    for value in sorted_integers:
+        assert learned_index.search(value) == sorted_integers.index(value)
+    assert learned_index.search(0) is None
+    assert learned_index.search(10001) is None
+
+
+def test_learned_index_fits_uniform_floats(sorted_floats):
+    learned_index = LearnedIndex(sorted_floats, 8)
+    assert len(learned_index) < len(sorted_floats) // 4
+    for value in sorted_floats:
+        assert sorted_floats[learned_index.search(value)] == value
+    assert learned_index.search(sorted_floats[0] - 1.0) is None
+
+
+def test_learned_index_on_skewed_data():
+    dataset = sorted([1] * 50 + [2**i for i in range(40)] + [7] * 20)
+    learned_index = LearnedIndex(dataset, 2)
+    for value in set(dataset):
+        assert learned_index.search(value) == dataset.index(value)
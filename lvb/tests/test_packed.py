@@ -0,0 +1,185 @@
+"""Test cases for string keys packed in one byte buffer."""
+
+import random
+import timeit
+
+import numpy as np
+import pytest
+
+from lvb import approach
+from lvb.binarysearch import binary_search_iterative, binary_search_recursive
+from lvb.constants import constants
+from lvb.experiment import (
+    Configuration,
+    run_benchmark,
+    select_search_function,
+    validate_configuration,
+)
+from lvb.eytzinger import EytzingerTree
+from lvb.packed import PackedStrings
+from lvb.sweep import sweep_configurations
+
+KEYS = [b"apple", b"berry", b"cherry", b"grape", b"lemon", b"mango"]
+
+
+@pytest.fixture
+def packed():
+    return PackedStrings.from_array(np.array(KEYS, dtype="S6"))
+
+
+def test_keys_are_packed_end_to_end(packed):
+    assert len(packed) == len(KEYS)
+    assert packed.nbytes == len(KEYS) * packed.width
+    assert packed[0] == packed.encode("apple")
+    assert packed[-1] == packed.encode("mango")
+    assert list(np.asarray(packed)) == KEYS
+    with pytest.raises(IndexError):
+        packed[len(KEYS)]
+
+
+def test_find_skips_matches_across_key_boundaries(packed):
+    assert packed.find(packed.encode("grape")) == KEYS.index(b"grape")
+    # the padded end of "berry" runs into the start of "cherry"
+    assert packed.find(b"y\0cher") is None
+    assert packed.find(packed.encode("kiwi")) is None
+    assert packed.find(packed.encode("watermelon")) is None
+
+
+def test_find_scans_for_targets_longer_than_the_keys(packed):
+    searched = []
+
+    class Buffer(bytes):
+        def find(self, *args):
+            searched.append(args)
+            return super().find(*args)
+
+    packed.buffer = Buffer(packed.buffer)
+    # a stored key is a prefix of the target, which is still no match
+    assert packed.find(packed.encode("cherry") + b"pie") is None
+    assert packed.find(packed.encode("watermelon")) is None
+    assert [args[0] for args in searched] == [b"cherry", b"waterm"]
+
+
+@pytest.mark.parametrize(
+    "search", [binary_search_iterative, binary_search_recursive]
+)
+def test_binary_searches_run_over_packed_keys(packed, search):
+    for index, key in enumerate(KEYS):
+        assert search(packed, packed.encode(key)) == index
+    assert search(packed, packed.encode("banana")) is None
+    assert search(packed, packed.encode("appletree")) is None
+
+
+def test_bisect_finds_sorted_keys_exactly(packed):
+    for index, key in enumerate(KEYS):
+        assert packed.bisect(packed.encode(key)) == index
+    # NumPy would pad "apple" to match the prefix of a longer target
+    assert packed.bisect(packed.encode("apple") + b"s") is None
+    assert packed.bisect(packed.encode("banana")) is None
+    assert packed.bisect(packed.encode("zucchini")) is None
+    assert PackedStrings(b"", packed.width).bisect(b"apple\0") is None
+
+
+@pytest.mark.parametrize(
+    "search_algorithm",
+    [
+        approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+        approach.SearchAlgorithm.BINARY_SEARCH_RECURSIVE,
+        approach.SearchAlgorithm.EYTZINGER_SEARCH,
+    ],
+    ids=str,
+)
+def test_packed_searches_never_read_one_key_at_a_time(
+    packed, search_algorithm, monkeypatch
+):
+    tree = EytzingerTree.from_sorted(packed)
+    search = select_search_function(search_algorithm, packed, tree)
+
+    def unread(self, index):
+        raise AssertionError("a packed search read a key by index")
+
+    monkeypatch.setattr(PackedStrings, "__getitem__", unread)
+    assert all(search(packed.encode(key)) is not None for key in KEYS)
+    assert not search(packed.encode("banana"))
+
+
+def test_packed_binary_search_beats_a_list_of_strings():
+    random.seed(8)
+    keys = sorted(
+        "".join(random.choices("abcdefghij", k=constants.STRING_LENGTH))
+        for _ in range(100_000)
+    )
+    packed = PackedStrings.from_array(
+        np.array(keys, dtype=f"S{constants.STRING_LENGTH}")
+    )
+    targets = random.sample(keys, 2000)
+    encoded = [packed.encode(target) for target in targets]
+    search_list = select_search_function(
+        approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE, keys, None
+    )
+    search_packed = select_search_function(
+        approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE, packed, None
+    )
+
+    def best(search, values):
+        return min(
+            timeit.repeat(
+                lambda: [search(value) for value in values],
+                number=1,
+                repeat=5,
+            )
+        )
+
+    assert best(search_packed, encoded) < best(search_list, targets)
+
+
+def test_eytzinger_layout_stays_packed(packed):
+    tree = EytzingerTree.from_sorted(packed)
+    assert isinstance(tree.layout, PackedStrings)
+    assert all(tree.search(packed.encode(key)) for key in KEYS)
+    assert not tree.search(packed.encode("banana"))
+
+
+def test_packed_storage_requires_strings_and_a_flat_structure():
+    assert validate_configuration(
+        approach.DataStructure.BINARY_SEARCH_TREE,
+        approach.SearchAlgorithm.BST_SEARCH,
+        data_type=approach.DataType.STRINGS,
+        storage=approach.Storage.PACKED,
+    )
+    assert validate_configuration(
+        approach.DataStructure.SORTED_LIST,
+        approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+        data_type=approach.DataType.INTEGERS,
+        storage=approach.Storage.PACKED,
+    )
+
+
+@pytest.mark.parametrize(
+    "configuration",
+    sweep_configurations(
+        Configuration(
+            data_structure=approach.DataStructure.UNSORTED_LIST,
+            search_algorithm=approach.SearchAlgorithm.LINEAR_SEARCH,
+            data_type=approach.DataType.STRINGS,
+            searches=5,
+            repeats=1,
+            time_budget=0.001,
+            warmup=0,
+            seed=4,
+            storage=approach.Storage.PACKED,
+        ),
+        list(approach.DataStructure),
+        list(approach.SearchAlgorithm),
+        [approach.DataType.STRINGS],
+        list(approach.TargetPosition),
+    ),
+    ids=lambda configuration: (
+        f"{configuration.data_structure}-{configuration.search_algorithm}-"
+        f"{configuration.target_position}"
+    ),
+)
+def test_every_packed_search_runs(configuration):
+    result = run_benchmark(configuration, 300)
+    assert result.elapsed_time > 0
+    assert result.details["packed_bytes_per_key"] == constants.STRING_LENGTH
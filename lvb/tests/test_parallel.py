@@ -0,0 +1,58 @@
+"""Test cases for running benchmarks in a process pool."""
+
+import os
+
+import numpy as np
+import pytest
+
+from lvb import approach
+from lvb.approach import DataType
+from lvb.experiment import Configuration
+from lvb.generate import generate_array, to_list
+from lvb.parallel import SharedArrays, run_parallel
+
+CONFIGURATION = Configuration(
+    data_structure=approach.DataStructure.HASH_INDEX,
+    search_algorithm=approach.SearchAlgorithm.HASH_LOOKUP,
+    searches=10,
+    repeats=1,
+    time_budget=0.001,
+    warmup=0,
+    seed=3,
+)
+
+
+def test_shared_array_round_trip():
+    for data_type in DataType:
+        values = generate_array(100, data_type, seed=1)
+        with SharedArrays() as shared:
+            descriptor = shared.share(values)
+            assert descriptor.read(data_type) == to_list(values, data_type)
+
+
+def test_shared_memory_is_released():
+    with SharedArrays() as shared:
+        shared.share(np.arange(10))
+        blocks = list(shared.blocks)
+    assert not shared.blocks
+    with pytest.raises(FileNotFoundError):
+        type(blocks[0])(name=blocks[0].name)
+
+
+def test_results_come_back_in_size_order():
+    sizes = [400, 100, 200]
+    results = list(run_parallel(CONFIGURATION, sizes, jobs=2))
+    assert [result.size for result in results] == sizes
+    assert all(
+        len(result.latencies) == CONFIGURATION.searches for result in results
+    )
+    assert all("generate_time" in result.details for result in results)
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "sched_setaffinity"), reason="requires CPU affinity"
+)
+def test_pinned_workers_run():
+    size = 100
+    results = list(run_parallel(CONFIGURATION, [size], jobs=1, pin_cpus=True))
+    assert results[0].size == size
@@ -0,0 +1,89 @@
+"""Benchmark suite that fails when searches are slower than a baseline.
+
+Run it with `pytest -m benchmark`. Set LVB_RESULTS to save the runs,
+LVB_BASELINE to a results file saved earlier to check them against it,
+and LVB_THRESHOLD to the relative slowdown that fails the check.
+"""
+
+import os
+
+import pytest
+
+from lvb import approach
+from lvb.approach import OutputFormat
+from lvb.constants import constants
+from lvb.experiment import Configuration, run_benchmark
+from lvb.results import (
+    compare_results,
+    environment,
+    read_results,
+    run_record,
+    save_results,
+)
+
+pytestmark = pytest.mark.benchmark
+
+SEED = 42
+
+SIZES = [1000, 8000]
+
+CONFIGURATIONS = [
+    Configuration(
+        data_structure=approach.DataStructure.SORTED_LIST,
+        search_algorithm=algorithm,
+        repeats=7,
+        time_budget=0.2,
+        seed=SEED,
+    )
+    for algorithm in [
+        approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+        approach.SearchAlgorithm.BINARY_SEARCH_RECURSIVE,
+    ]
+] + [
+    Configuration(
+        data_structure=approach.DataStructure.BINARY_SEARCH_TREE,
+        search_algorithm=approach.SearchAlgorithm.BST_SEARCH,
+        repeats=7,
+        time_budget=0.2,
+        seed=SEED,
+    )
+]
+
+
+@pytest.fixture(scope="module")
+def records():
+    records = [
+        run_record(configuration, run_benchmark(configuration, size))
+        for configuration in CONFIGURATIONS
+        for size in SIZES
+    ]
+    results = os.environ.get("LVB_RESULTS")
+    if results:
+        save_results(
+            results, OutputFormat.JSON, records, environment(seed=SEED)
+        )
+    return records
+
+
+def test_every_run_is_timed(records):
+    assert len(records) == len(CONFIGURATIONS) * len(SIZES)
+    assert all(record["mean"] > 0 for record in records)
+
+
+def test_no_regression_against_the_baseline(records):
+    baseline = os.environ.get("LVB_BASELINE")
+    if not baseline:
+        pytest.skip("set LVB_BASELINE to a saved results file")
+    threshold = float(
+        os.environ.get("LVB_THRESHOLD", constants.DEFAULT_REGRESSION_THRESHOLD)
+    )
+    comparisons = compare_results(read_results(baseline), records, threshold)
+    assert comparisons, "the baseline holds none of these runs"
+    slower = [
+        f"{comparison.describe()}: {comparison.change:+.1%}"
+        for comparison in comparisons
+        if comparison.regression
+    ]
+    assert not slower, "significantly slower than the baseline: " + (
+        "; ".join(slower)
+    )
@@ -0,0 +1,105 @@
+"""Test cases for saving results and comparing them against a baseline."""
+
+import dataclasses
+import io
+import math
+
+import pytest
+
+from lvb import approach
+from lvb.approach import OutputFormat
+from lvb.benchmark import Measurement, t_critical
+from lvb.experiment import Configuration, RunResult
+from lvb.results import (
+    compare_results,
+    environment,
+    read_results,
+    run_record,
+    save_results,
+    welch_statistic,
+    write_results,
+)
+
+CONFIGURATION = Configuration(
+    data_structure=approach.DataStructure.SORTED_LIST,
+    search_algorithm=approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+    seed=7,
+)
+
+TIMES = [1.0, 1.1, 0.9, 1.05, 0.95]
+
+
+def _record(times, size=1000, configuration=CONFIGURATION):
+    result = RunResult(
+        size,
+        Measurement(list(times), number=10, overhead=0.0),
+        latencies=[0.1, 0.2],
+        details={"build_time": 0.5},
+    )
+    return run_record(configuration, result)
+
+
+def test_records_hold_configuration_and_raw_timings():
+    record = _record(TIMES)
+    assert record["data_structure"] == "sorted_list"
+    assert record["seed"] == CONFIGURATION.seed
+    assert record["times"] == TIMES
+    assert record["mean"] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("output_format", list(OutputFormat))
+def test_every_format_reads_back(tmp_path, output_format):
+    records = [_record(TIMES), _record(TIMES, size=2000)]
+    path = tmp_path / f"results.{output_format}"
+    save_results(path, output_format, records, environment(seed=7))
+    loaded = read_results(path)
+    assert [record["size"] for record in loaded] == [1000, 2000]
+    assert loaded[0]["times"] == TIMES
+    assert loaded[0]["details"] == {"build_time": 0.5}
+    assert loaded[0]["batch"] is False
+
+
+def test_environment_describes_the_interpreter():
+    stream = io.StringIO()
+    write_results(stream, OutputFormat.JSONL, [_record(TIMES)], environment())
+    assert '"python_version"' in stream.getvalue()
+    assert '"cpu_model"' in stream.getvalue()
+
+
+def test_welch_statistic_grows_with_the_difference():
+    slower = [time * 1.5 for time in TIMES]
+    statistic, degrees = welch_statistic(TIMES, slower)
+    assert statistic > t_critical(degrees)
+    assert welch_statistic(TIMES, TIMES)[0] == 0.0
+    assert welch_statistic([1.0, 1.0], [2.0, 2.0])[0] == math.inf
+
+
+def test_only_significant_slowdowns_beyond_the_threshold_regress():
+    baseline = [_record(TIMES)]
+    slower = compare_results(baseline, [_record([t * 1.5 for t in TIMES])])
+    noisy = compare_results(baseline, [_record([1.2, 0.8, 1.1, 0.9, 1.1])])
+    faster = compare_results(baseline, [_record([t / 2 for t in TIMES])])
+    assert slower[0].regression
+    assert not noisy[0].significant
+    assert faster[0].significant and not faster[0].regression
+    assert not compare_results(baseline, [_record(TIMES, size=5)])
+    assert not compare_results(
+        baseline, [_record([t * 1.5 for t in TIMES])], threshold=1.0
+    )[0].regression
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"zipf_exponent": CONFIGURATION.zipf_exponent * 2},
+        {"lookup_cache_capacity": CONFIGURATION.lookup_cache_capacity * 2},
+        {"false_positive_rate": CONFIGURATION.false_positive_rate / 10},
+    ],
+    ids=str,
+)
+def test_runs_with_other_parameters_are_not_compared(change):
+    baseline = [_record(TIMES)]
+    changed = dataclasses.replace(CONFIGURATION, **change)
+    current = [_record([t * 1.5 for t in TIMES], configuration=changed)]
+    assert not compare_results(baseline, current)
+    assert compare_results(current, current)
@@ -0,0 +1,114 @@
+"""Test cases for the asyncio lookup service and its load generator."""
+
+import asyncio
+from functools import partial
+
+import pytest
+
+from lvb.binarysearch import binary_search_iterative
+from lvb.service import (
+    HEADER,
+    Address,
+    LoadResult,
+    _connect,
+    closed_loop,
+    encode_frame,
+    open_loop,
+    read_frame,
+    serve,
+)
+
+DATASET = [3, 1, 4, 5, 9, 2, 6]
+
+DURATION = 0.05
+
+unix_sockets = pytest.mark.skipif(
+    not hasattr(asyncio, "start_unix_server"), reason="requires Unix sockets"
+)
+
+
+async def _with_server(tmp_path, client, search_func=DATASET.index):
+    """Run a client coroutine against a server on a Unix socket."""
+    address = Address(path=str(tmp_path / "lvb.sock"))
+    started = asyncio.Event()
+    server = asyncio.create_task(serve(search_func, address, started.set))
+    await started.wait()
+    try:
+        return await client(address)
+    finally:
+        server.cancel()
+
+
+def test_frames_round_trip():
+    async def decode(frame):
+        reader = asyncio.StreamReader()
+        reader.feed_data(frame)
+        reader.feed_eof()
+        return await read_frame(reader), await read_frame(reader)
+
+    payload = [1, 2.5, "abc", None]
+    assert asyncio.run(decode(encode_frame(payload))) == (payload, None)
+
+
+@unix_sockets
+def test_pipelined_requests_are_answered_in_order(tmp_path):
+    async def client(address):
+        connection = await _connect(address)
+        for keys in [[4, 9], [1], [6, 3, 2]]:
+            connection.send(keys, 0.0)
+        answers = [await read_frame(connection.reader) for _ in range(3)]
+        connection.writer.close()
+        return answers
+
+    answers = asyncio.run(_with_server(tmp_path, client))
+    assert answers == [[2, 4], [1], [6, 0, 5]]
+
+
+@unix_sockets
+def test_malformed_requests_are_answered_with_errors(tmp_path):
+    unhandled = []
+
+    async def client(address):
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: unhandled.append(context)
+        )
+        connection = await _connect(address)
+        bad = [encode_frame(payload) for payload in [5, ["a"], [[1]]]]
+        for frame in [*bad, HEADER.pack(3) + b"[1,", encode_frame([4, 7])]:
+            connection.writer.write(frame)
+        answers = [await read_frame(connection.reader) for _ in range(5)]
+        # a body cut short by the end of the stream closes quietly
+        connection.writer.write(HEADER.pack(10) + b"[1")
+        connection.writer.write_eof()
+        closed = await read_frame(connection.reader)
+        connection.writer.close()
+        return answers, closed
+
+    search = partial(binary_search_iterative, sorted(DATASET))
+    answers, closed = asyncio.run(_with_server(tmp_path, client, search))
+    assert all("error" in answer for answer in answers[:4])
+    assert answers[4] == [sorted(DATASET).index(4), None]
+    assert closed is None
+    assert not unhandled
+
+
+@unix_sockets
+def test_closed_and_open_loops_time_every_request(tmp_path):
+    async def client(address):
+        closed = await closed_loop(address, DATASET, 2, DURATION, 2, 3)
+        opened = await open_loop(address, DATASET, 2, DURATION, 2, 200.0)
+        return closed, opened
+
+    closed, opened = asyncio.run(_with_server(tmp_path, client))
+    assert closed.requests == len(closed.latencies) > 0
+    assert closed.offered_rate is None and closed.sustained
+    assert opened.requests == int(200.0 * DURATION)
+    assert opened.qps > 0
+
+
+def test_sustained_rate_needs_most_of_the_offered_rate():
+    kept = LoadResult(95, 1, 1.0, offered_rate=100.0)
+    behind = LoadResult(50, 1, 1.0, offered_rate=100.0)
+    assert kept.sustained
+    assert not behind.sustained
+    assert LoadResult(1, 4, 0.5, [0.1]).percentiles() == [0.1, 0.1, 0.1]
@@ -0,0 +1,195 @@
+"""Test cases for skewed targets and the structures that adapt to them."""
+
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from lvb import approach
+from lvb.approach import DataType, TargetPosition
+from lvb.constants import constants
+from lvb.experiment import Configuration, run_benchmark
+from lvb.generate import (
+    SKEWED_POSITIONS,
+    generate_binary_search_tree,
+    select_array_targets,
+    select_targets,
+)
+from lvb.linearsearch import move_to_front_search, transpose_search
+from lvb.splay import SplayTree
+from lvb.throughput import validate_throughput
+
+DATASET = list(range(1000))
+
+SEARCHES = 5000
+
+
+def _in_order(node):
+    # splaying a degenerate tree is the point, so walk it without recursion
+    values, stack = [], []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.l_child
+        node = stack.pop()
+        values.append(node.data)
+        node = node.r_child
+    return values
+
+
+def _top_share(targets, count):
+    """Return the share of the searches that go to the most common targets."""
+    common = Counter(targets).most_common(count)
+    return sum(searches for _, searches in common) / len(targets)
+
+
+def test_zipf_targets_concentrate_as_the_exponent_grows():
+    random.seed(1)
+    uniform = select_targets(
+        DATASET, TargetPosition.ZIPF, SEARCHES, DataType.INTEGERS, 0.0
+    )
+    skewed = select_targets(
+        DATASET, TargetPosition.ZIPF, SEARCHES, DataType.INTEGERS, 1.5
+    )
+    assert _top_share(skewed, 10) > _top_share(uniform, 10) * 5
+    assert set(skewed) <= set(DATASET)
+
+
+@pytest.mark.parametrize("exponent", [0.0, 1.0, 2.0])
+def test_zipf_targets_follow_the_law(exponent):
+    random.seed(5)
+    dataset = DATASET[:10]
+    searches = SEARCHES * 4
+    targets = select_targets(
+        dataset, TargetPosition.ZIPF, searches, DataType.INTEGERS, exponent
+    )
+    counts = sorted(Counter(targets).values(), reverse=True)
+    weights = [rank**-exponent for rank in range(1, len(dataset) + 1)]
+    for count, weight in zip(counts, weights):
+        assert count / searches == pytest.approx(
+            weight / sum(weights), abs=0.02
+        )
+
+
+def test_zipf_targets_do_not_walk_the_dataset():
+    # far too many values for any pass over them to finish
+    values = range(10**15)
+    targets = select_targets(
+        values, TargetPosition.ZIPF, SEARCHES, DataType.INTEGERS
+    )
+    assert len(targets) == SEARCHES
+    assert all(0 <= target < len(values) for target in targets)
+
+
+def test_hot_set_takes_most_searches():
+    random.seed(2)
+    targets = select_targets(
+        DATASET, TargetPosition.HOT_SET, SEARCHES, DataType.INTEGERS
+    )
+    hot = max(1, int(len(DATASET) * constants.HOT_SET_FRACTION))
+    assert _top_share(targets, hot) >= constants.HOT_SET_PROBABILITY - 0.05
+
+
+def test_temporal_targets_repeat_recent_ones():
+    random.seed(3)
+    targets = select_targets(
+        DATASET, TargetPosition.TEMPORAL, SEARCHES, DataType.INTEGERS
+    )
+    repeats = sum(
+        target in targets[max(0, i - constants.TEMPORAL_WINDOW) : i]
+        for i, target in enumerate(targets)
+    )
+    assert repeats / SEARCHES >= constants.TEMPORAL_PROBABILITY - 0.05
+
+
+@pytest.mark.parametrize("position", SKEWED_POSITIONS, ids=str)
+def test_arrays_and_lists_draw_the_same_targets(position):
+    values = np.array(DATASET[::-1])
+    random.seed(4)
+    from_array = select_array_targets(values, position, 50, DataType.INTEGERS)
+    random.seed(4)
+    from_list = select_targets(
+        values.tolist(), position, 50, DataType.INTEGERS
+    )
+    assert from_array == from_list
+
+
+def test_splay_tree_moves_found_values_to_the_root():
+    tree = generate_binary_search_tree(DATASET, tree_class=SplayTree)
+    for target in [3, 700, 3, 999]:
+        assert tree.search(target) is True
+        assert tree.root.data == target
+    assert tree.search(-1) is False
+    assert tree.rotations > 0
+    assert _in_order(tree.root) == DATASET
+
+
+def test_splay_tree_handles_sorted_inserts_and_empty_trees():
+    assert SplayTree().search(1) is False
+    tree = generate_binary_search_tree(
+        DATASET,
+        approach.InsertOrder.SORTED,
+        sorted_data=True,
+        tree_class=SplayTree,
+    )
+    # the first search walks the whole spine, and halves its depth
+    assert tree.search(0) is True
+    assert all(tree.search(value) for value in DATASET)
+    assert _in_order(tree.root) == DATASET
+
+
+@pytest.mark.parametrize("search", [move_to_front_search, transpose_search])
+def test_self_adjusting_searches_move_found_values_forward(search):
+    dataset = list(DATASET)
+    index = search(dataset, 500)
+    assert index == DATASET.index(500)
+    assert dataset.index(500) < index
+    assert search(dataset, -1) is None
+    assert sorted(dataset) == DATASET
+    assert search(dataset, dataset[0]) == 0
+
+
+def test_self_adjusting_searches_need_an_unsorted_list_and_one_reader():
+    configuration = Configuration(
+        data_structure=approach.DataStructure.SORTED_LIST,
+        search_algorithm=approach.SearchAlgorithm.MOVE_TO_FRONT_SEARCH,
+    )
+    assert configuration.validate()
+    splay = Configuration(
+        data_structure=approach.DataStructure.SPLAY_TREE,
+        search_algorithm=approach.SearchAlgorithm.BST_SEARCH,
+    )
+    assert splay.validate() is None
+    assert validate_throughput(splay)
+
+
+@pytest.mark.parametrize(
+    ("data_structure", "search_algorithm"),
+    [
+        (
+            approach.DataStructure.SPLAY_TREE,
+            approach.SearchAlgorithm.BST_SEARCH,
+        ),
+        (
+            approach.DataStructure.UNSORTED_LIST,
+            approach.SearchAlgorithm.MOVE_TO_FRONT_SEARCH,
+        ),
+        (
+            approach.DataStructure.UNSORTED_LIST,
+            approach.SearchAlgorithm.TRANSPOSE_SEARCH,
+        ),
+    ],
+)
+def test_adaptive_runs_on_skewed_targets(data_structure, search_algorithm):
+    configuration = Configuration(
+        data_structure=data_structure,
+        search_algorithm=search_algorithm,
+        target_position=TargetPosition.ZIPF,
+        zipf_exponent=1.2,
+        searches=50,
+        repeats=2,
+        time_budget=0.01,
+        seed=5,
+    )
+    assert run_benchmark(configuration, 500).elapsed_time > 0
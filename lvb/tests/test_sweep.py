@@ -0,0 +1,132 @@
+"""Test cases for the full-matrix sweep."""
+
+import dataclasses
+from collections import Counter
+
+import pytest
+
+from lvb import approach
+from lvb.experiment import Configuration, benchmark_dataset
+from lvb.sweep import (
+    doubling_sizes,
+    parse_axis,
+    run_sweep,
+    sweep_configurations,
+)
+
+BASE = Configuration(
+    data_structure=approach.DataStructure.UNSORTED_LIST,
+    search_algorithm=approach.SearchAlgorithm.LINEAR_SEARCH,
+    searches=10,
+    repeats=1,
+    time_budget=0.001,
+    warmup=0,
+)
+
+
+def test_parse_axis_lists_and_all():
+    assert parse_axis(
+        ["sorted_list,avl_tree", "sorted_list"], approach.DataStructure
+    ) == [
+        approach.DataStructure.SORTED_LIST,
+        approach.DataStructure.AVL_TREE,
+    ]
+    assert parse_axis(["all"], approach.DataType) == list(approach.DataType)
+    with pytest.raises(ValueError, match="not one of"):
+        parse_axis(["heap"], approach.DataStructure)
+
+
+def test_sweep_skips_invalid_pairs():
+    configurations = sweep_configurations(
+        BASE,
+        list(approach.DataStructure),
+        list(approach.SearchAlgorithm),
+        [approach.DataType.STRINGS],
+        [approach.TargetPosition.RANDOM],
+    )
+    assert configurations
+    assert all(
+        configuration.validate() is None for configuration in configurations
+    )
+    pairs = {
+        (configuration.data_structure, configuration.search_algorithm)
+        for configuration in configurations
+    }
+    assert (
+        approach.DataStructure.UNSORTED_LIST,
+        approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+    ) not in pairs
+    assert (
+        approach.DataStructure.SORTED_LIST,
+        approach.SearchAlgorithm.INTERPOLATION_SEARCH,
+    ) not in pairs
+
+
+def test_sweep_shares_datasets_and_streams_results():
+    configurations = sweep_configurations(
+        BASE,
+        [
+            approach.DataStructure.SORTED_LIST,
+            approach.DataStructure.EYTZINGER_TREE,
+        ],
+        [
+            approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+            approach.SearchAlgorithm.EYTZINGER_SEARCH,
+        ],
+        [approach.DataType.INTEGERS],
+        [approach.TargetPosition.BEGINNING],
+    )
+    sizes = doubling_sizes(100, 2)
+    assert sizes == [100, 200]
+    results = list(run_sweep(configurations, sizes, seed=1))
+    assert len(results) == len(configurations) * len(sizes)
+    assert [result.size for _, result in results] == [100, 100, 200, 200]
+    # every configuration of a size saw the same generated dataset
+    first, second = results[0][1], results[1][1]
+    assert first.details["generate_time"] == second.details["generate_time"]
+
+
+def test_self_adjusting_searches_leave_the_shared_dataset_alone(monkeypatch):
+    configurations = sweep_configurations(
+        BASE,
+        [approach.DataStructure.UNSORTED_LIST],
+        [
+            approach.SearchAlgorithm.MOVE_TO_FRONT_SEARCH,
+            approach.SearchAlgorithm.LINEAR_SEARCH,
+        ],
+        [approach.DataType.INTEGERS],
+        [approach.TargetPosition.END],
+    )
+    seen = []
+
+    def spy(configuration, dataset, targets):
+        seen.append(list(dataset))
+        return benchmark_dataset(configuration, dataset, targets)
+
+    monkeypatch.setattr("lvb.sweep.benchmark_dataset", spy)
+    list(run_sweep(configurations, [100], seed=1))
+    # the linear search found the list in the order it was generated
+    assert seen[0] == seen[1]
+
+
+def test_sweeps_draw_zipf_targets_with_their_exponent(monkeypatch):
+    shares = []
+
+    def spy(configuration, dataset, targets):
+        top = Counter(targets).most_common(1)[0][1]
+        shares.append(top / len(targets))
+        return benchmark_dataset(configuration, dataset, targets)
+
+    monkeypatch.setattr("lvb.sweep.benchmark_dataset", spy)
+    for exponent in [0.0, 4.0]:
+        configurations = sweep_configurations(
+            dataclasses.replace(BASE, searches=200, zipf_exponent=exponent),
+            [approach.DataStructure.UNSORTED_LIST],
+            [approach.SearchAlgorithm.LINEAR_SEARCH],
+            [approach.DataType.INTEGERS],
+            [approach.TargetPosition.ZIPF],
+        )
+        list(run_sweep(configurations, [1000], seed=1))
+    uniform, skewed = shares
+    # with an exponent of 4 the top value takes nine searches in ten
+    assert skewed > uniform * 10
@@ -0,0 +1,121 @@
+"""Test cases for the concurrent read-throughput benchmark."""
+
+from dataclasses import replace
+
+import pytest
+
+from lvb import approach
+from lvb.experiment import Configuration
+from lvb.generate import generate_array, to_list
+from lvb.parallel import SharedArrays
+from lvb.throughput import (
+    SharedStructure,
+    ThroughputResult,
+    WorkerResult,
+    attach_search,
+    drive,
+    measure_throughput,
+    reads_in_place,
+    validate_throughput,
+)
+
+CONFIGURATION = Configuration(
+    data_structure=approach.DataStructure.SORTED_LIST,
+    search_algorithm=approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+    searches=10,
+    seed=5,
+)
+
+DURATION = 0.02
+
+
+def test_drive_repeats_targets_until_the_deadline():
+    calls = []
+    result = drive(calls.append, [1, 2, 3], DURATION)
+    assert result.lookups == len(calls)
+    assert result.lookups % 3 == 0
+    assert result.end - result.start >= DURATION
+    assert result.p50 <= result.p99
+
+
+def test_aggregate_throughput_spans_all_readers():
+    readers = [
+        WorkerResult(100, 0.0, 1.0, 0.0, 0.0, 0.0),
+        WorkerResult(300, 0.5, 2.0, 0.0, 0.0, 0.0),
+    ]
+    result = ThroughputResult(2, readers, shared=True)
+    assert result.lookups == sum(reader.lookups for reader in readers)
+    assert result.elapsed == pytest.approx(2.0)
+    assert result.qps == pytest.approx(result.lookups / result.elapsed)
+
+
+def test_batch_only_searches_are_rejected():
+    galloping = replace(
+        CONFIGURATION,
+        search_algorithm=approach.SearchAlgorithm.GALLOPING_SEARCH,
+    )
+    assert validate_throughput(CONFIGURATION) is None
+    assert validate_throughput(galloping) is not None
+    assert validate_throughput(replace(CONFIGURATION, batch=True))
+
+
+@pytest.mark.parametrize(
+    ("data_structure", "search_algorithm", "data_type", "in_place"),
+    [
+        (
+            approach.DataStructure.SORTED_LIST,
+            approach.SearchAlgorithm.INTERPOLATION_SEARCH,
+            approach.DataType.FLOATS,
+            True,
+        ),
+        (
+            approach.DataStructure.HASH_INDEX,
+            approach.SearchAlgorithm.HASH_LOOKUP,
+            approach.DataType.INTEGERS,
+            False,
+        ),
+        (
+            approach.DataStructure.SORTED_LIST,
+            approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+            approach.DataType.STRINGS,
+            False,
+        ),
+    ],
+)
+def test_readers_find_shared_values(
+    data_structure, search_algorithm, data_type, in_place
+):
+    configuration = replace(
+        CONFIGURATION,
+        data_structure=data_structure,
+        search_algorithm=search_algorithm,
+        data_type=data_type,
+    )
+    values = generate_array(50, data_type, sorted_data=True, seed=1)
+    with SharedArrays() as arrays:
+        shared = SharedStructure(configuration, arrays.share(values))
+        assert reads_in_place(shared) is in_place
+        search = attach_search(shared)
+        target = to_list(values, data_type)[len(values) // 2]
+        assert search(target) is not None
+
+
+@pytest.mark.parametrize("concurrency", list(approach.Concurrency))
+def test_every_worker_count_is_measured(concurrency):
+    configuration = replace(
+        CONFIGURATION,
+        data_structure=approach.DataStructure.EYTZINGER_TREE,
+        search_algorithm=approach.SearchAlgorithm.EYTZINGER_SEARCH,
+    )
+    worker_counts = [1, 2]
+    results = list(
+        measure_throughput(
+            configuration, 100, worker_counts, concurrency, DURATION
+        )
+    )
+    assert [result.workers for result in results] == worker_counts
+    assert all(result.shared for result in results)
+    assert all(
+        len(result.readers) == result.workers and result.lookups > 0
+        for result in results
+    )
@@ -0,0 +1,177 @@
+"""Test cases for mixed workloads of reads, inserts and deletes."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from lvb import approach
+from lvb.approach import CachePolicy, DataStructure, Operation
+from lvb.avl import AVLTree
+from lvb.bst import BinarySearchTree
+from lvb.experiment import Configuration
+from lvb.redblack import RedBlackTree
+from lvb.splay import SplayTree
+from lvb.treap import Treap
+from lvb.workload import (
+    DELETES,
+    INSERTS,
+    WorkloadMix,
+    plan_operations,
+    run_workload,
+    validate_workload,
+)
+
+VALUES = [50, 30, 70, 20, 40, 60, 80, 30, 65]
+
+SIZE = 500
+
+OPERATIONS = 400
+
+# the search that every structure with writes runs in these tests
+SEARCHES = {
+    DataStructure.UNSORTED_LIST: approach.SearchAlgorithm.LINEAR_SEARCH,
+    DataStructure.SORTED_LIST: approach.SearchAlgorithm.BINARY_SEARCH_ITERATIVE,
+    DataStructure.B_PLUS_TREE: approach.SearchAlgorithm.B_PLUS_TREE_SEARCH,
+    DataStructure.HASH_INDEX: approach.SearchAlgorithm.HASH_LOOKUP,
+}
+
+
+def _in_order(node):
+    if node is None:
+        return []
+    return [*_in_order(node.l_child), node.data, *_in_order(node.r_child)]
+
+
+def _configuration(data_structure, **options):
+    return Configuration(
+        data_structure=data_structure,
+        search_algorithm=SEARCHES.get(
+            data_structure, approach.SearchAlgorithm.BST_SEARCH
+        ),
+        seed=7,
+        **options,
+    )
+
+
+@pytest.mark.parametrize(
+    "tree_class", [BinarySearchTree, SplayTree, AVLTree, RedBlackTree, Treap]
+)
+def test_delete_keeps_every_other_value_in_order(tree_class):
+    tree = tree_class()
+    for value in VALUES:
+        tree.insert(value)
+    remaining = sorted(VALUES)
+    # in the plain tree: a leaf, a node with one child, one with two, and
+    # the root
+    for value in [20, 60, 30, 50, 30]:
+        assert tree.delete(value) is True
+        remaining.remove(value)
+        assert _in_order(tree.root) == remaining
+    assert tree.delete(30) is False
+    for value in list(remaining):
+        assert tree.delete(value) is True
+    assert tree.root is None
+    assert tree.delete(1) is False
+
+
+def test_plan_reads_and_deletes_only_stored_values():
+    random.seed(1)
+    dataset = list(range(100))
+    plan = plan_operations(
+        dataset, list(range(100, 1100)), WorkloadMix(0.2, 0.3, 0.5), 1000
+    )
+    stored = Counter(dataset)
+    for operation, value in plan:
+        if operation == Operation.INSERT:
+            stored[value] += 1
+        else:
+            assert stored[value] > 0
+            if operation == Operation.DELETE:
+                stored[value] -= 1
+    kinds = Counter(operation for operation, _ in plan)
+    assert kinds[Operation.DELETE] > kinds[Operation.READ]
+
+
+def test_plan_inserts_once_nothing_is_stored():
+    plan = plan_operations([], [1, 2], WorkloadMix(0, 0, 1), 2)
+    assert [operation for operation, _ in plan] == [
+        Operation.INSERT,
+        Operation.DELETE,
+    ]
+
+
+@pytest.mark.parametrize("data_structure", list(DELETES), ids=str)
+def test_every_structure_with_deletes_runs_a_mixed_workload(data_structure):
+    configuration = _configuration(data_structure)
+    mix = WorkloadMix()
+    assert validate_workload(configuration, mix) is None
+    result = run_workload(configuration, mix, SIZE, OPERATIONS)
+    assert result.operations == OPERATIONS
+    inserted = len(result.latencies.get(Operation.INSERT, []))
+    deleted = len(result.latencies.get(Operation.DELETE, []))
+    assert result.final_size == SIZE + inserted - deleted
+    assert result.throughput > 0
+    assert result.percentiles(Operation.READ) is not None
+    # these keep one copy of a duplicate, and delete all of them at once
+    if data_structure not in [
+        DataStructure.BINTREES_AVL_TREE,
+        DataStructure.BINTREES_RB_TREE,
+        DataStructure.HASH_INDEX,
+    ]:
+        assert result.missed_reads == 0
+
+
+def test_every_structure_that_inserts_can_delete():
+    assert list(DELETES) == list(INSERTS)
+
+
+@pytest.mark.parametrize(
+    "data_structure",
+    [DataStructure.AVL_TREE, DataStructure.RED_BLACK_TREE],
+    ids=str,
+)
+def test_workloads_without_deletes_run_reads_and_inserts(data_structure):
+    configuration = _configuration(data_structure)
+    mix = WorkloadMix(deletes=0)
+    assert validate_workload(configuration, mix) is None
+    result = run_workload(configuration, mix, SIZE, OPERATIONS)
+    assert result.percentiles(Operation.DELETE) is None
+    assert result.missed_reads == 0
+
+
+@pytest.mark.parametrize(
+    "data_structure",
+    [DataStructure.SORTED_LIST, DataStructure.BINARY_SEARCH_TREE],
+    ids=str,
+)
+def test_cached_workloads_find_every_stored_value(data_structure):
+    configuration = _configuration(
+        data_structure, lookup_cache=CachePolicy.LRU, lookup_cache_capacity=8
+    )
+    result = run_workload(
+        configuration, WorkloadMix(0.5, 0.25, 0.25), SIZE // 10, OPERATIONS
+    )
+    assert result.missed_reads == 0
+
+
+def test_workloads_need_writable_structures_and_single_searches():
+    mix = WorkloadMix()
+    for configuration in [
+        Configuration(
+            data_structure=DataStructure.EYTZINGER_TREE,
+            search_algorithm=approach.SearchAlgorithm.EYTZINGER_SEARCH,
+        ),
+        Configuration(
+            data_structure=DataStructure.SORTED_LIST,
+            search_algorithm=approach.SearchAlgorithm.LEARNED_INDEX_SEARCH,
+        ),
+        _configuration(DataStructure.SORTED_LIST, batch=True),
+        _configuration(
+            DataStructure.SORTED_LIST, storage=approach.Storage.MMAP
+        ),
+    ]:
+        assert validate_workload(configuration, mix)
+    sorted_list = _configuration(DataStructure.SORTED_LIST)
+    assert validate_workload(sorted_list, WorkloadMix(0, 0, 0))
+    assert validate_workload(sorted_list, WorkloadMix(1, -1, 0))